@@ -48,7 +48,8 @@ INSTALLED_APPS = [
     "django.contrib.contenttypes",
     "django.contrib.sessions",
     "django.contrib.messages",
-    "django.contrib.staticfiles",
+    # django.contrib.staticfiles, skipping files no page serves
+    "insurance_app.apps.StaticFilesConfig",
 ]
 
 TAILWIND_APP_NAME = "theme"
@@ -72,13 +73,24 @@ TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
         "DIRS": [BASE_DIR / "templates"],
-        "APP_DIRS": True,
         "OPTIONS": {
+            # Parse each template once per process; the dev server's autoreloader
+            # resets it when a template changes
+            "loaders": [
+                (
+                    "django.template.loaders.cached.Loader",
+                    [
+                        "django.template.loaders.filesystem.Loader",
+                        "django.template.loaders.app_directories.Loader",
+                    ],
+                ),
+            ],
             "context_processors": [
                 "django.template.context_processors.debug",
                 "django.template.context_processors.request",
                 "django.contrib.auth.context_processors.auth",
                 "django.contrib.messages.context_processors.messages",
+                "insurance_app.page_cache.page_cache_settings",
             ],
         },
     },
@@ -97,7 +109,18 @@ DATABASES = {
     )
 }
 
-print("DATABASE_URL:", os.getenv("DATABASE_URL"))
+# SQLite: wait up to SQLITE_TIMEOUT seconds for a lock instead of failing with
+# "database is locked"; booking.reserve takes the write lock up front
+if DATABASES["default"]["ENGINE"] == "django.db.backends.sqlite3":
+    DATABASES["default"].setdefault("OPTIONS", {}).update(
+        timeout=int(os.getenv("SQLITE_TIMEOUT", "20")),
+    )
+    # Test on a file (git-ignored), not the shared-cache in-memory database:
+    # its table locks fail at once rather than wait for the busy timeout, so
+    # the concurrent booking tests could not queue like production does
+    DATABASES["default"].setdefault("TEST", {})["NAME"] = str(
+        BASE_DIR / "test_db.sqlite3"
+    )
 
 # DATABASES = {
 #     "default": {
@@ -149,8 +172,24 @@ STATICFILES_DIRS = [
 # STATIC_ROOT = BASE_DIR / "insurance_app" / "staticfiles"
 STATIC_ROOT = os.path.join(BASE_DIR, "staticfiles")
 
-# WhiteNoise settings for serving static files efficiently
-STATICFILES_STORAGE = "whitenoise.storage.CompressedManifestStaticFilesStorage"
+# AVIF/WebP variants written by `manage.py optimize_images`, collected and
+# hashed with the other static files and used by the {% picture %} tag
+IMAGE_BUILD_DIR = BASE_DIR / "image_build"
+if (IMAGE_BUILD_DIR / "static").is_dir():
+    STATICFILES_DIRS.append(IMAGE_BUILD_DIR / "static")
+
+# WhiteNoise settings for serving static files efficiently: the image build
+# hashes and precompresses (gzip and Brotli) everything once, and only the
+# hashed copies are kept and served with far-future cache headers
+STORAGES = {
+    "default": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+    },
+    "staticfiles": {
+        "BACKEND": "insurance_app.storage.StaticBuildStorage",
+    },
+}
+WHITENOISE_KEEP_ONLY_HASHED_FILES = True
 
 AUTH_USER_MODEL = "insurance_app.UserProfile"
 
@@ -172,6 +211,40 @@ LOGIN_URL = "/login/"
 # Tailwind Theme
 TAILWIND_APP_NAME = "theme"
 
+# Serve predictions from the NumPy exports written by
+# `manage.py export_compiled_models` instead of the pickled sklearn pipelines
+USE_COMPILED_MODELS = os.getenv("USE_COMPILED_MODELS", "False") == "True"
+
+# Per-process cache of quote predictions, cleared when a model is swapped
+PREDICTION_CACHE_SIZE = int(os.getenv("PREDICTION_CACHE_SIZE", "4096"))
+PREDICTION_CACHE_TTL = float(os.getenv("PREDICTION_CACHE_TTL", "3600"))
+
+# Answer /quote-predict/ from the grid written by `manage.py build_quote_table`
+# (BMI quantized to 0.1), falling back to the model off the grid
+USE_QUOTE_TABLE = os.getenv("USE_QUOTE_TABLE", "False") == "True"
+
+# Thread pool behind /quote-predict/async/: running predictions, and how many
+# more may wait before the endpoint answers 503
+PREDICTION_EXECUTOR_WORKERS = int(os.getenv("PREDICTION_EXECUTOR_WORKERS", "4"))
+PREDICTION_EXECUTOR_QUEUE = int(os.getenv("PREDICTION_EXECUTOR_QUEUE", "32"))
+
+# Coalesce concurrent single predictions into one model call per batch, closed
+# after PREDICTION_BATCH_WAIT_MS or PREDICTION_BATCH_MAX_SIZE rows
+PREDICTION_BATCHING = os.getenv("PREDICTION_BATCHING", "False") == "True"
+PREDICTION_BATCH_WAIT_MS = float(os.getenv("PREDICTION_BATCH_WAIT_MS", "2"))
+PREDICTION_BATCH_MAX_SIZE = int(os.getenv("PREDICTION_BATCH_MAX_SIZE", "64"))
+
+# Unix socket of `manage.py run_prediction_sidecar`; empty scores in-process
+PREDICTION_SIDECAR_SOCKET = os.getenv("PREDICTION_SIDECAR_SOCKET", "")
+
+# Seconds anonymous visits of the marketing pages (home, about, ...) and the
+# anonymous page header are served from the cache; 0 disables both
+PAGE_CACHE_TIMEOUT = int(os.getenv("PAGE_CACHE_TIMEOUT", "300"))
+
+# Seconds a page of the Join Us job listing stays cached; saving or deleting a
+# job invalidates every page at once
+JOB_LISTING_CACHE_TIMEOUT = int(os.getenv("JOB_LISTING_CACHE_TIMEOUT", "300"))
+
 INTERNAL_IPS = [
     "127.0.0.1",
 ]
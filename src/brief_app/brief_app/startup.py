@@ -0,0 +1,114 @@
+"""Startup profiler for manage.py, WSGI and ASGI boot.
+
+Set ``STARTUP_PROFILE`` before starting a process to time each boot phase:
+
+- ``settings``: importing ``brief_app.settings`` (dotenv, database URL parsing)
+- ``apps``: ``django.setup()``, i.e. logging and app registry population
+- ``urlconf``: importing the root URLconf and every view module it references
+- ``templates``: initializing the template engines and their loaders
+- ``warm_up``: loading and exercising the prediction models (WSGI/ASGI only)
+
+``STARTUP_PROFILE=1`` writes the report as one JSON line to stderr; any other
+value is a file path the JSON line is appended to, so every process started
+with it (manage.py calls, Gunicorn workers) adds its own entry. The
+``benchmark_startup`` command uses this to track cold-start time across
+commits.
+"""
+
+import json
+import os
+import resource
+import sys
+import time
+from typing import Any, Callable, Dict, Optional
+
+ENV_VAR = "STARTUP_PROFILE"
+
+
+def _process_age_ms() -> Optional[float]:
+    """Milliseconds since the kernel started this process, on Linux."""
+    try:
+        with open("/proc/self/stat") as file:
+            # Field 22 (starttime, in clock ticks since boot) follows the comm field
+            start_ticks = int(file.read().rsplit(")", 1)[1].split()[19])
+        with open("/proc/uptime") as file:
+            uptime = float(file.read().split()[0])
+    except (OSError, ValueError, IndexError):
+        return None
+    return round((uptime - start_ticks / os.sysconf("SC_CLK_TCK")) * 1000, 1)
+
+
+def profile_startup(warm_up: bool = False) -> Dict[str, Any]:
+    """
+    Boots Django phase by phase and times each phase.
+
+    Safe to call before ``get_wsgi_application`` or ``execute_from_command_line``:
+    the phases it already ran are no-ops when they run again.
+
+    Args:
+        warm_up (bool): Also load and exercise the prediction models.
+
+    Returns:
+        Dict[str, Any]: Per-phase wall time and newly imported module count,
+            total time, process age and peak RSS.
+    """
+    phases: Dict[str, Dict[str, float]] = {}
+    started = time.perf_counter()
+
+    def timed(name: str, func: Callable[[], Any]) -> None:
+        modules = len(sys.modules)
+        start = time.perf_counter()
+        func()
+        phases[name] = {
+            "ms": round((time.perf_counter() - start) * 1000, 1),
+            "modules": len(sys.modules) - modules,
+        }
+
+    import django
+    from django.conf import settings
+
+    timed("settings", lambda: settings.INSTALLED_APPS)
+    timed("apps", django.setup)
+
+    from django.template import engines
+    from django.urls import get_resolver
+
+    timed("urlconf", lambda: get_resolver().url_patterns)
+    timed(
+        "templates",
+        lambda: [
+            getattr(backend, "engine", backend).template_loaders
+            for backend in engines.all()
+            if hasattr(getattr(backend, "engine", None), "template_loaders")
+        ],
+    )
+    if warm_up:
+        from insurance_app.warmup import warm_up_models
+
+        timed("warm_up", warm_up_models)
+
+    return {
+        "argv": sys.argv[:2],
+        "pid": os.getpid(),
+        "phases": phases,
+        "total_ms": round((time.perf_counter() - started) * 1000, 1),
+        "process_age_ms": _process_age_ms(),
+        "modules": len(sys.modules),
+        "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
+
+
+def write_report(report: Dict[str, Any], destination: str) -> None:
+    line = json.dumps(report)
+    if destination in ("1", "true", "True"):
+        sys.stderr.write(f"startup profile: {line}\n")
+        return
+    with open(destination, "a", encoding="utf-8") as file:
+        file.write(line + "\n")
+
+
+def profile_if_enabled(warm_up: bool = False) -> None:
+    """Profiles the boot of this process when ``STARTUP_PROFILE`` is set."""
+    destination = os.getenv(ENV_VAR)
+    if destination:
+        write_report(profile_startup(warm_up=warm_up), destination)
@@ -12,4 +12,10 @@ from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "brief_app.settings")
 
+# Set STARTUP_PROFILE to time each boot phase (see brief_app/startup.py)
+if os.getenv("STARTUP_PROFILE"):
+    from brief_app.startup import profile_if_enabled
+
+    profile_if_enabled(warm_up=True)
+
 application = get_wsgi_application()
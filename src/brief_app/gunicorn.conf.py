@@ -0,0 +1,43 @@
+"""Gunicorn configuration for the Assur'Aimant web app.
+
+With ``GUNICORN_PRELOAD=1`` (the default) the Django application is imported
+in the master and both prediction pipelines are loaded and exercised there
+before workers are forked, so workers share them copy-on-write and the first
+quote is served warm. With ``GUNICORN_PRELOAD=0`` every worker warms up on its
+own after booting.
+"""
+
+import os
+import time
+
+_started_at = time.perf_counter()
+
+preload_app = os.getenv("GUNICORN_PRELOAD", "1") == "1"
+
+
+def _warm_up(owner, freeze: bool) -> None:
+    from insurance_app.warmup import warm_up_models
+
+    try:
+        report = warm_up_models(started_at=_started_at, freeze=freeze)
+    except Exception:
+        owner.log.exception("Model warm-up failed, models will load on first use")
+        return
+    owner.log.info(
+        "Models warm in %.1f ms (%.1f ms since master start), max RSS %s kB",
+        report["warm_up_ms"],
+        report["time_to_first_prediction_ms"],
+        report["max_rss_kb"],
+    )
+
+
+def when_ready(server) -> None:
+    """Runs in the master once the app is loaded and before workers are forked."""
+    if server.cfg.preload_app:
+        _warm_up(server, freeze=True)
+
+
+def post_worker_init(worker) -> None:
+    """Runs in each worker after it loaded the app, only needed without preload."""
+    if not worker.cfg.preload_app:
+        _warm_up(worker, freeze=False)
@@ -1,10 +1,22 @@
+from datetime import timedelta
 from typing import Any
 from django import forms
 from django.contrib import admin
 from django.http import HttpRequest
-from django.db.models import Field as ModelField
-
-from .models import UserProfile, Job, ContactMessage, Availability, Appointment
+from django.db.models import Field as ModelField, Max, Min, QuerySet
+from django.utils import timezone
+
+from .slots import SLOT_TIMES
+from .recurrence import GENERATE_DAYS, WEEKDAY_CHOICES, materialize, weekday_mask
+from .models import (
+    UserProfile,
+    Job,
+    ContactMessage,
+    Availability,
+    AvailabilityException,
+    AvailabilityRule,
+    Appointment,
+)
 
 # Register your models here.
 admin.site.register(UserProfile)
@@ -34,9 +46,7 @@ class AvailabilityAdminForm(forms.ModelForm):
     using checkboxes for hours between 09:00 and 18:00.
     """
 
-    TIME_CHOICES = [
-        (f"{hour:02d}:00", f"{hour:02d}:00") for hour in range(9, 19)
-    ]  # 09:00 - 18:00
+    TIME_CHOICES = [(time, time) for time in SLOT_TIMES]  # 09:00 - 18:00
 
     time_slots = forms.MultipleChoiceField(
         choices=TIME_CHOICES, widget=forms.CheckboxSelectMultiple
@@ -74,6 +84,96 @@ class AvailabilityAdmin(admin.ModelAdmin):
 admin.site.register(Availability, AvailabilityAdmin)
 
 
+class AvailabilityRuleAdminForm(forms.ModelForm):
+    """
+    Admin form for weekly availability rules.
+
+    Shows the ``weekdays`` bitmask as one checkbox per day of the week.
+    """
+
+    weekdays = forms.TypedMultipleChoiceField(
+        choices=WEEKDAY_CHOICES, coerce=int, widget=forms.CheckboxSelectMultiple
+    )
+
+    class Meta:
+        model = AvailabilityRule
+        fields = ["name", "weekdays", "time_slots", "starts_on", "ends_on", "active"]
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        mask = self.initial.get("weekdays", 0)
+        self.initial["weekdays"] = [
+            day for day, _ in WEEKDAY_CHOICES if mask >> day & 1
+        ]
+
+    def clean_weekdays(self) -> int:
+        """
+        Packs the ticked days into the bitmask stored on the rule.
+        """
+        return weekday_mask(self.cleaned_data["weekdays"])
+
+
+@admin.register(AvailabilityRule)
+class AvailabilityRuleAdmin(admin.ModelAdmin):
+    """
+    Admin configuration for weekly availability rules.
+
+    The "Generate availability" action writes the ``Availability`` rows of
+    the selected rules' date span, from today and at most ``GENERATE_DAYS``
+    days ahead. Every active rule and exception is applied to that span.
+    """
+
+    form = AvailabilityRuleAdminForm
+    list_display = ("name", "display_weekdays", "display_times", "starts_on", "ends_on")
+    list_filter = ("active",)
+    actions = ["generate_availability"]
+
+    def display_weekdays(self, obj: AvailabilityRule) -> str:
+        """
+        Returns the rule's days as abbreviated names, e.g. "Mon, Tue".
+        """
+        return ", ".join(
+            name[:3] for day, name in WEEKDAY_CHOICES if obj.weekdays >> day & 1
+        )
+
+    def display_times(self, obj: AvailabilityRule) -> str:
+        """
+        Returns a comma-separated string of the rule's time slots.
+        """
+        return ", ".join(obj.time_slots)
+
+    @admin.action(description="Generate availability from the active rules")
+    def generate_availability(self, request: HttpRequest, queryset: QuerySet) -> None:
+        """
+        Materializes the availability of the selected rules' date span.
+        """
+        today = timezone.localdate()
+        span = queryset.aggregate(start=Min("starts_on"), end=Max("ends_on"))
+        start = max(today, span["start"])
+        end = start + timedelta(days=GENERATE_DAYS - 1)
+        if span["end"] and not queryset.filter(ends_on__isnull=True).exists():
+            end = min(end, span["end"])
+        if end < start:
+            self.message_user(request, "The selected rules have ended.", "warning")
+            return
+        opened, closed = materialize(start, end)
+        self.message_user(
+            request,
+            f"Generated availability from {start} to {end}: "
+            f"{opened} open days, {closed} days cleared.",
+        )
+
+
+@admin.register(AvailabilityException)
+class AvailabilityExceptionAdmin(admin.ModelAdmin):
+    """
+    Admin configuration for dates that override the weekly rules.
+    """
+
+    list_display = ("date", "__str__", "note")
+    ordering = ("-date",)
+
+
 class AppointmentAdmin(admin.ModelAdmin):
     """
     Admin configuration for the Appointment model.
@@ -0,0 +1,103 @@
+from datetime import date, timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from insurance_app.appointments import (
+    HISTORY_PER_PAGE,
+    UPCOMING_LIMIT,
+    appointment_overview,
+)
+from insurance_app.models import Appointment
+
+User = get_user_model()
+TODAY = date(2030, 6, 15)
+
+
+class AppointmentOverviewTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="regular")
+        other = User.objects.create_user(username="other")
+        # 13 upcoming (including today) and 25 past, one per day
+        for offset in range(-25, 13):
+            Appointment.objects.create(
+                user=self.user,
+                reason="Consultation",
+                date=TODAY + timedelta(days=offset),
+                time="10:00",
+            )
+        Appointment.objects.create(
+            user=other, reason="Consultation", date=TODAY, time="11:00"
+        )
+
+    def test_upcoming_window_and_first_history_page_in_one_query(self):
+        with self.assertNumQueries(1):
+            overview = appointment_overview(self.user, TODAY)
+
+        self.assertEqual(
+            [row.date for row in overview.upcoming],
+            [TODAY + timedelta(days=i) for i in range(UPCOMING_LIMIT)],
+        )
+        self.assertTrue(overview.more_upcoming)
+        self.assertEqual(
+            [row.date for row in overview.history],
+            [TODAY - timedelta(days=i) for i in range(1, HISTORY_PER_PAGE + 1)],
+        )
+        self.assertTrue(overview.history.has_next())
+        self.assertFalse(overview.history.has_previous())
+
+    def test_short_lists_have_nothing_more(self):
+        Appointment.objects.filter(date__lt=TODAY - timedelta(days=2)).delete()
+        Appointment.objects.filter(date__gt=TODAY).delete()
+
+        overview = appointment_overview(self.user, TODAY)
+        self.assertEqual([row.date for row in overview.upcoming], [TODAY])
+        self.assertFalse(overview.more_upcoming)
+        self.assertEqual(len(overview.history), 2)
+        self.assertIsNone(overview.history.next_cursor)
+
+
+class AppointmentHistoryViewTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="regular")
+        today = timezone.now().date()
+        for offset in range(1, 26):
+            Appointment.objects.create(
+                user=self.user,
+                reason="Follow-up" if offset % 2 else "Consultation",
+                date=today - timedelta(days=offset),
+                time="09:00",
+            )
+        self.client.force_login(self.user)
+
+    def test_older_pages_continue_the_first_page(self):
+        response = self.client.get(reverse("book_appointment"))
+        first_page = response.context["past_appointments"]
+        dates = [row.date.isoformat() for row in first_page]
+        self.assertContains(response, 'id="older-appointments"')
+
+        cursor = first_page.next_cursor
+        while cursor:
+            with self.assertNumQueries(3):  # session, user, page
+                data = self.client.get(
+                    reverse("appointment_history"), {"cursor": cursor}
+                ).json()
+            dates += [row["date"] for row in data["appointments"]]
+            cursor = data["next_cursor"]
+
+        self.assertEqual(
+            dates,
+            [
+                (timezone.now().date() - timedelta(days=i)).isoformat()
+                for i in range(1, 26)
+            ],
+        )
+
+    def test_errors(self):
+        url = reverse("appointment_history")
+        self.assertEqual(self.client.get(url, {"cursor": "bad"}).status_code, 400)
+        self.assertEqual(self.client.post(url).status_code, 405)
+        self.client.logout()
+        self.assertEqual(self.client.get(url).status_code, 302)
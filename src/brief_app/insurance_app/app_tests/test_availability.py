@@ -0,0 +1,124 @@
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+
+from insurance_app.availability import (
+    free_capacity,
+    free_slots,
+    month_range,
+    quarter_range,
+    range_masks,
+)
+from insurance_app.models import Appointment, Availability
+from insurance_app.slots import SLOT_TIMES, mask_times, slot_mask
+
+
+class SlotMaskTest(SimpleTestCase):
+    def test_masks_round_trip_in_grid_order(self):
+        mask = slot_mask(["18:00", "09:00", "10:00", "07:00"])
+        self.assertEqual(mask, 0b1000000011)
+        self.assertEqual(mask_times(mask), ["09:00", "10:00", "18:00"])
+        self.assertEqual(mask_times(slot_mask(SLOT_TIMES)), SLOT_TIMES)
+
+    def test_month_and_quarter_ranges(self):
+        self.assertEqual(month_range(2028, 2), (date(2028, 2, 1), date(2028, 2, 29)))
+        self.assertEqual(
+            quarter_range(2028, 4), (date(2028, 10, 1), date(2028, 12, 31))
+        )
+
+
+class FreeSlotsTest(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username="client")
+
+    def book(self, day, time):
+        Appointment.objects.create(
+            user=self.user, reason="Consultation", date=day, time=time
+        )
+
+    def test_booked_slots_are_subtracted_in_one_query(self):
+        for day in range(1, 31):
+            Availability.objects.create(
+                date=date(2030, 4, day), time_slots=["09:00", "10:00", "11:00"]
+            )
+        self.book(date(2030, 4, 2), "10:00")
+        self.book(date(2030, 4, 3), "09:00")
+        self.book(date(2030, 4, 3), "10:00")
+        self.book(date(2030, 4, 3), "11:00")
+        self.book(date(2030, 5, 1), "09:00")  # outside the range
+
+        with self.assertNumQueries(1):
+            free = free_slots(*month_range(2030, 4))
+        self.assertEqual(len(free), 30)
+        self.assertEqual(
+            mask_times(free[date(2030, 4, 1)]), ["09:00", "10:00", "11:00"]
+        )
+        self.assertEqual(mask_times(free[date(2030, 4, 2)]), ["09:00", "11:00"])
+        self.assertEqual(free[date(2030, 4, 3)], 0)
+
+    def test_range_masks_have_one_entry_per_day(self):
+        Availability.objects.create(date=date(2030, 4, 2), time_slots=["12:00"])
+        masks = range_masks(date(2030, 4, 1), date(2030, 4, 3))
+        self.assertEqual(masks, [0, slot_mask(["12:00"]), 0])
+
+    def test_without_availability_the_range_is_empty(self):
+        self.assertEqual(free_slots(date(2030, 4, 1), date(2030, 4, 30)), {})
+        self.assertEqual(
+            free_capacity(date(2030, 4, 1), date(2030, 4, 30)),
+            {"offered": 0, "booked": 0, "free": 0},
+        )
+
+    def test_quarter_capacity_is_one_aggregate_query(self):
+        for month in (4, 5, 6):
+            Availability.objects.create(
+                date=date(2030, month, 10), time_slots=["09:00", "10:00", "18:00"]
+            )
+        self.book(date(2030, 4, 10), "18:00")
+        self.book(date(2030, 6, 10), "09:00")
+        self.book(date(2030, 6, 10), "12:00")  # not offered
+        self.book(date(2030, 7, 10), "09:00")  # next quarter
+
+        with self.assertNumQueries(1):
+            capacity = free_capacity(*quarter_range(2030, 2))
+        self.assertEqual(capacity, {"offered": 9, "booked": 2, "free": 7})
+
+
+class AvailabilityViewsTest(TestCase):
+    def setUp(self):
+        user = get_user_model().objects.create_user(username="client")
+        Availability.objects.create(
+            date=date(2030, 4, 2), time_slots=["09:00", "15:00"]
+        )
+        Appointment.objects.create(
+            user=user, reason="Consultation", date=date(2030, 4, 2), time="09:00"
+        )
+
+    def test_month_query(self):
+        response = self.client.get(reverse("available_slots"), {"month": "2030-04"})
+        data = response.json()
+        self.assertEqual((data["start"], data["end"]), ("2030-04-01", "2030-04-30"))
+        self.assertEqual(data["slots"], SLOT_TIMES)
+        self.assertEqual(len(data["days"]), 30)
+        self.assertEqual(mask_times(data["days"][1]), ["15:00"])
+
+    def test_start_end_query_and_errors(self):
+        url = reverse("available_slots")
+        response = self.client.get(url, {"start": "2030-04-02", "end": "2030-04-02"})
+        self.assertEqual(response.json()["days"], [slot_mask(["15:00"])])
+        for params in (
+            {},
+            {"month": "April"},
+            {"start": "2030-04-05", "end": "2030-04-01"},
+            {"start": "2030-01-01", "end": "2030-12-31"},
+        ):
+            self.assertEqual(self.client.get(url, params).status_code, 400, params)
+
+    def test_single_day_times_skip_booked_slots(self):
+        response = self.client.get(
+            reverse("get_available_times"), {"date": "2030-04-02"}
+        )
+        self.assertEqual(response.json(), {"times": ["15:00"]})
+        response = self.client.get(reverse("get_available_times"), {"date": "bad"})
+        self.assertEqual(response.json(), {"times": []})
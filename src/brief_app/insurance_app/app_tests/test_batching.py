@@ -0,0 +1,91 @@
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+
+from insurance_app.batching import Histogram, MicroBatcher, predict_one
+from insurance_app.model_registry import QUOTE_MODEL, registry
+from insurance_app.prediction_cache import prediction_cache
+from insurance_app.quotes import parse_quote, score_quote_rows
+from insurance_app.app_tests.test_quotes import APPLICANT, applicants
+
+
+class HistogramTest(SimpleTestCase):
+    def test_counts_each_value_in_first_fitting_bucket(self):
+        histogram = Histogram((1, 5))
+        for value in (0.5, 1, 3, 10):
+            histogram.observe(value)
+        stats = histogram.stats()
+        self.assertEqual(stats["buckets"], {"1": 2, "5": 1, "+Inf": 1})
+        self.assertEqual(stats["count"], 4)
+
+
+@override_settings(USE_COMPILED_MODELS=False)
+class MicroBatcherTest(SimpleTestCase):
+    def score_concurrently(self, batcher, rows):
+        barrier = threading.Barrier(len(rows))
+
+        def submit(row):
+            barrier.wait()
+            try:
+                return batcher.submit(row)
+            except ValueError as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=len(rows)) as pool:
+            return list(pool.map(submit, rows))
+
+    def test_concurrent_rows_share_predict_calls(self):
+        batcher = MicroBatcher(QUOTE_MODEL, score_quote_rows, max_wait_ms=200)
+        rows = [parse_quote(row) for row in applicants(8)]
+        results = self.score_concurrently(batcher, rows)
+
+        model = registry.get(QUOTE_MODEL)
+        self.assertEqual(results, score_quote_rows(model, rows))
+        sizes = batcher.stats()["batch_size"]
+        self.assertEqual(sizes["sum"], 8)
+        self.assertLess(sizes["count"], 8)
+        self.assertEqual(batcher.stats()["queue_wait_ms"]["count"], 8)
+
+    def test_max_batch_closes_batch(self):
+        batcher = MicroBatcher(
+            QUOTE_MODEL, score_quote_rows, max_wait_ms=1000, max_batch=2
+        )
+        rows = [parse_quote(row) for row in applicants(4)]
+        self.score_concurrently(batcher, rows)
+        self.assertEqual(batcher.stats()["batch_size"]["buckets"]["2"], 2)
+
+    def test_bad_row_does_not_fail_batch(self):
+        batcher = MicroBatcher(QUOTE_MODEL, score_quote_rows, max_wait_ms=200)
+        rows = [parse_quote(row) for row in applicants(3)]
+        rows[1]["region"] = "atlantis"
+        results = self.score_concurrently(batcher, rows)
+        self.assertIsInstance(results[1], ValueError)
+        self.assertIsInstance(results[0], float)
+        self.assertIsInstance(results[2], float)
+
+
+@override_settings(USE_COMPILED_MODELS=False)
+class PredictOneTest(SimpleTestCase):
+    def setUp(self):
+        prediction_cache.clear()
+
+    def test_scores_directly_when_disabled(self):
+        def score(model, rows):
+            return [threading.get_ident() for _ in rows]
+
+        with override_settings(PREDICTION_BATCHING=False):
+            self.assertEqual(
+                predict_one(QUOTE_MODEL, None, {}, score), threading.get_ident()
+            )
+
+    def test_quote_endpoint_with_batching(self):
+        with override_settings(PREDICTION_BATCHING=True):
+            response = self.client.post(
+                reverse("predict_charges"),
+                data=json.dumps(APPLICANT),
+                content_type="application/json",
+            )
+        self.assertEqual(response.json(), {"prediction": 7193.9})
@@ -0,0 +1,134 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from insurance_app.booking import (
+    NOT_OFFERED,
+    TAKEN,
+    SlotUnavailable,
+    nearest_free_slots,
+    reserve,
+)
+from insurance_app.models import Appointment, Availability
+
+User = get_user_model()
+
+
+def future(days):
+    return timezone.localdate() + timedelta(days=days)
+
+
+class ReserveTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="booker")
+        self.day = future(10)
+        Availability.objects.create(
+            date=self.day, time_slots=["09:00", "10:00", "11:00"]
+        )
+
+    def test_books_an_offered_slot_once(self):
+        appointment = reserve(self.user, "Consultation", self.day, "10:00")
+        self.assertEqual((appointment.date, appointment.time), (self.day, "10:00"))
+
+        with self.assertRaises(SlotUnavailable) as conflict:
+            reserve(self.user, "Consultation", self.day, "10:00")
+        self.assertEqual(conflict.exception.reason, TAKEN)
+        self.assertEqual(
+            conflict.exception.suggestions,
+            [(self.day, "09:00"), (self.day, "11:00")],
+        )
+        self.assertEqual(Appointment.objects.count(), 1)
+
+    def test_slots_outside_the_availability_are_refused(self):
+        for day, time in ((self.day, "14:00"), (future(11), "10:00")):
+            with self.assertRaises(SlotUnavailable) as refused:
+                reserve(self.user, "Consultation", day, time)
+            self.assertEqual(refused.exception.reason, NOT_OFFERED)
+        self.assertFalse(Appointment.objects.exists())
+
+    def test_suggestions_are_nearest_first_and_never_in_the_past(self):
+        Availability.objects.create(date=future(12), time_slots=["09:00"])
+        Availability.objects.create(
+            date=timezone.localdate() - timedelta(days=1), time_slots=["09:00"]
+        )
+        self.assertEqual(
+            nearest_free_slots(future(12), "10:00", count=3),
+            [(future(12), "09:00"), (self.day, "11:00"), (self.day, "10:00")],
+        )
+        self.assertEqual(
+            nearest_free_slots(timezone.localdate(), "09:00", count=1),
+            [(self.day, "09:00")],
+        )
+
+
+class BookAppointmentConflictTest(TestCase):
+    def test_conflict_answers_409_with_suggestions(self):
+        day = future(5)
+        Availability.objects.create(date=day, time_slots=["09:00", "10:00"])
+        reserve(
+            User.objects.create_user(username="first"), "Consultation", day, "09:00"
+        )
+
+        self.client.force_login(User.objects.create_user(username="second"))
+        response = self.client.post(
+            reverse("book_appointment"),
+            {"reason": "Consultation", "date": day.isoformat(), "time": "09:00"},
+        )
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.context["suggested_slots"], [(day, "10:00")])
+        self.assertContains(response, "just been booked", status_code=409)
+        self.assertEqual(Appointment.objects.count(), 1)
+
+    def test_invalid_fields_with_a_taken_slot_rerender_the_form(self):
+        day = future(5)
+        Availability.objects.create(date=day, time_slots=["09:00"])
+        reserve(
+            User.objects.create_user(username="first"), "Consultation", day, "09:00"
+        )
+
+        self.client.force_login(User.objects.create_user(username="second"))
+        response = self.client.post(
+            reverse("book_appointment"),
+            {"reason": "bogus", "date": day.isoformat(), "time": "09:00"},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.context["form"].has_error("reason"))
+        self.assertEqual(Appointment.objects.count(), 1)
+
+
+class ConcurrentBookingTest(TransactionTestCase):
+    REQUESTS = 300
+
+    def test_no_double_booking_under_concurrent_reservations(self):
+        day = future(3)
+        slots = ["09:00", "10:00", "11:00"]
+        Availability.objects.create(date=day, time_slots=slots)
+        users = User.objects.bulk_create(
+            User(username=f"client{i}") for i in range(self.REQUESTS)
+        )
+        barrier = threading.Barrier(self.REQUESTS)
+
+        def book(i):
+            barrier.wait()
+            try:
+                reserve(users[i], "Consultation", day, slots[i % len(slots)])
+                return "booked"
+            except SlotUnavailable as e:
+                return e.reason
+            finally:
+                connection.close()
+
+        with ThreadPoolExecutor(self.REQUESTS) as pool:
+            outcomes = list(pool.map(book, range(self.REQUESTS)))
+
+        self.assertEqual(outcomes.count("booked"), len(slots))
+        self.assertEqual(outcomes.count(TAKEN), self.REQUESTS - len(slots))
+        self.assertEqual(
+            sorted(Appointment.objects.values_list("time", flat=True)), slots
+        )
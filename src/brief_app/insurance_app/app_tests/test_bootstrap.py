@@ -0,0 +1,86 @@
+import os
+import tempfile
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import OperationalError, connections
+from django.test import TestCase, override_settings
+
+from insurance_app.management.commands import bootstrap
+from insurance_app.management.commands.bootstrap import (
+    pending_migrations,
+    static_is_current,
+    wait_for_database,
+)
+
+
+class WaitForDatabaseTest(TestCase):
+    def test_retries_until_the_database_answers(self):
+        connection = connections["default"]
+        with mock.patch.object(
+            connection,
+            "ensure_connection",
+            side_effect=[OperationalError("down"), OperationalError("down"), None],
+        ), mock.patch.object(bootstrap.time, "sleep") as sleep:
+            self.assertEqual(wait_for_database("default", 5, 3.0), 2)
+        self.assertEqual([c.args[0] for c in sleep.call_args_list], [0.25, 0.5])
+
+    def test_gives_up_after_max_retries(self):
+        connection = connections["default"]
+        with mock.patch.object(
+            connection, "ensure_connection", side_effect=OperationalError("down")
+        ), mock.patch.object(bootstrap.time, "sleep"):
+            with self.assertRaises(CommandError):
+                wait_for_database("default", 3, 3.0)
+
+
+class PendingMigrationsTest(TestCase):
+    def test_test_database_is_fully_migrated(self):
+        self.assertEqual(pending_migrations("default"), [])
+
+
+class StaticIsCurrentTest(TestCase):
+    def test_collectstatic_makes_static_root_current(self):
+        with tempfile.TemporaryDirectory() as static_root:
+            with override_settings(STATIC_ROOT=static_root):
+                self.assertFalse(static_is_current())
+                call_command("collectstatic", interactive=False, verbosity=0)
+                self.assertTrue(static_is_current())
+
+                # A manifest older than the sources is stale again
+                os.utime(os.path.join(static_root, "staticfiles.json"), (0, 0))
+                self.assertFalse(static_is_current())
+
+
+class BootstrapCommandTest(TestCase):
+    def setUp(self):
+        # The test database is a file; closing it would end the test transaction
+        patcher = mock.patch.object(bootstrap.connections, "close_all")
+        self.close_all = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_skips_work_that_is_already_done(self):
+        out = StringIO()
+        with mock.patch.object(
+            bootstrap, "static_is_current", return_value=True
+        ), mock.patch.object(bootstrap, "call_command") as run, mock.patch.object(
+            bootstrap.os, "execvp"
+        ) as execvp:
+            call_command("bootstrap", stdout=out)
+        run.assert_not_called()
+        self.close_all.assert_called_once_with()
+        self.assertIn("No migrations to apply", out.getvalue())
+        argv = execvp.call_args.args[1]
+        self.assertEqual(argv[:2], ["gunicorn", "brief_app.wsgi:application"])
+
+    def test_collects_static_and_stops_with_no_exec(self):
+        with mock.patch.object(
+            bootstrap, "static_is_current", return_value=False
+        ), mock.patch.object(bootstrap, "call_command") as run, mock.patch.object(
+            bootstrap.os, "execvp"
+        ) as execvp:
+            call_command("bootstrap", "--no-exec", stdout=StringIO())
+        run.assert_called_once_with("collectstatic", interactive=False, verbosity=0)
+        execvp.assert_not_called()
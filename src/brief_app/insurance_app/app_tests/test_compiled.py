@@ -0,0 +1,100 @@
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+from django.test import SimpleTestCase, override_settings
+
+from insurance_app.compiled import (
+    CompiledModel,
+    StaleCompiledModel,
+    compile_pipeline,
+    compiled_path,
+    export_compiled,
+    load_compiled,
+)
+from insurance_app.features import encode_profiles, to_frame
+from insurance_app.model_registry import (
+    PROFILE_MODEL,
+    QUOTE_MODEL,
+    get_predictor,
+    registry,
+    resolve_model_path,
+)
+from insurance_app.app_tests.test_features import profile_grid
+from insurance_app.app_tests.test_quotes import applicants
+
+
+def quote_frame(count):
+    """Quote rows in the column layout predict_charges sends to the model."""
+    return pd.DataFrame(applicants(count)).rename(
+        columns={"bmi_category": "BMI_category"}
+    )
+
+
+class CompiledModelEquivalenceTest(SimpleTestCase):
+    def test_quote_model_matches_pipeline(self):
+        model = registry.get(QUOTE_MODEL)
+        X = quote_frame(200)
+        np.testing.assert_allclose(
+            compile_pipeline(model).predict(X), model.predict(X), rtol=1e-10
+        )
+
+    def test_profile_model_matches_pipeline(self):
+        model = registry.get(PROFILE_MODEL)
+        X = to_frame(encode_profiles(profile_grid()))
+        np.testing.assert_allclose(
+            compile_pipeline(model).predict(X), model.predict(X), rtol=1e-10
+        )
+
+    def test_accepts_plain_column_dict(self):
+        model = registry.get(QUOTE_MODEL)
+        X = quote_frame(3)
+        columns = {name: X[name].tolist() for name in X.columns}
+        np.testing.assert_allclose(
+            compile_pipeline(model).predict(columns), model.predict(X), rtol=1e-10
+        )
+
+    def test_unknown_category_raises(self):
+        X = quote_frame(1).assign(region="atlantis")
+        with self.assertRaises(ValueError):
+            compile_pipeline(registry.get(QUOTE_MODEL)).predict(X)
+
+
+class CompiledExportTest(SimpleTestCase):
+    def setUp(self):
+        """Copies the quote artifact to a temporary directory."""
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, "model_1.pickle")
+        shutil.copyfile(resolve_model_path(QUOTE_MODEL), self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_save_and_load_round_trip(self):
+        model = registry.get(self.path)
+        export_compiled(self.path, model)
+        loaded = load_compiled(self.path)
+        self.assertIsInstance(loaded, CompiledModel)
+        X = quote_frame(20)
+        np.testing.assert_allclose(loaded.predict(X), model.predict(X), rtol=1e-10)
+
+    def test_stale_export_is_refused(self):
+        export_compiled(self.path, registry.get(self.path))
+        with open(self.path, "ab") as file:
+            file.write(b"\0")
+        with self.assertRaises(StaleCompiledModel):
+            load_compiled(self.path)
+
+    def test_get_predictor_falls_back_without_export(self):
+        self.assertFalse(os.path.exists(compiled_path(self.path)))
+        with override_settings(USE_COMPILED_MODELS=True):
+            self.assertIs(get_predictor(self.path), registry.get(self.path))
+
+    def test_get_predictor_serves_export_when_enabled(self):
+        export_compiled(self.path, registry.get(self.path))
+        with override_settings(USE_COMPILED_MODELS=True):
+            self.assertIsInstance(get_predictor(self.path), CompiledModel)
+        with override_settings(USE_COMPILED_MODELS=False):
+            self.assertIs(get_predictor(self.path), registry.get(self.path))
@@ -0,0 +1,140 @@
+import json
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import Client, TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from insurance_app.contact_messages import (
+    MAX_IDS,
+    NOT_FOUND,
+    RESOLVED,
+    InvalidSelection,
+    resolve_messages,
+)
+from insurance_app.models import ContactMessage
+
+
+def make_messages(count, email="s@example.com"):
+    return [
+        ContactMessage.objects.create(name=f"Sender {i}", email=email, message="Hi")
+        for i in range(count)
+    ]
+
+
+class ResolveMessagesTest(TestCase):
+    def test_reports_every_requested_id(self):
+        first, second = make_messages(2)
+        missing = second.id + 100
+        results = resolve_messages([first.id, missing, second.id])
+        self.assertEqual(
+            results, {first.id: RESOLVED, missing: NOT_FOUND, second.id: RESOLVED}
+        )
+        self.assertFalse(ContactMessage.objects.exists())
+
+    def test_query_count_does_not_grow_with_the_selection(self):
+        few = [m.id for m in make_messages(2)]
+        with self.assertNumQueries(4) as small:
+            resolve_messages(few)
+        many = [m.id for m in make_messages(200)]
+        with self.assertNumQueries(len(small)):
+            resolve_messages(many)
+        self.assertFalse(ContactMessage.objects.exists())
+
+    def test_filter_resolves_the_matching_messages(self):
+        old = make_messages(3, email="spam@example.com")
+        ContactMessage.objects.filter(id=old[0].id).update(
+            submitted_at=timezone.now() - timedelta(days=30)
+        )
+        keep = make_messages(1)
+        results = resolve_messages(filters={"email": "SPAM@example.com"})
+        self.assertEqual(results, {m.id: RESOLVED for m in old})
+
+        make_messages(1, email="spam@example.com")
+        cutoff = (timezone.now() - timedelta(days=1)).isoformat()
+        self.assertEqual(resolve_messages(filters={"submitted_before": cutoff}), {})
+        self.assertEqual(
+            list(ContactMessage.objects.exclude(email="spam@example.com")), keep
+        )
+
+    def test_invalid_selections(self):
+        for ids, filters in (
+            (None, None),
+            ([1], {"email": "a@b.c"}),
+            ([], None),
+            (["1"], None),
+            (list(range(MAX_IDS + 1)), None),
+            (None, {}),
+            (None, {"name": "x"}),
+            (None, {"submitted_after": "yesterday"}),
+        ):
+            with self.assertRaises(InvalidSelection, msg=(ids, filters)):
+                resolve_messages(ids, filters)
+
+
+class SolveMessagesViewTest(TestCase):
+    def setUp(self):
+        self.staff = get_user_model().objects.create_user(
+            username="support", password="x", is_staff=True
+        )
+        self.client = Client(enforce_csrf_checks=True)
+        self.client.force_login(self.staff)
+
+    def post(self, url, payload=None):
+        self.client.get(reverse("messages_list"))  # sets the CSRF cookie
+        return self.client.post(
+            url,
+            json.dumps(payload) if payload is not None else "",
+            content_type="application/json",
+            HTTP_X_CSRFTOKEN=self.client.cookies["csrftoken"].value,
+        )
+
+    def test_bulk_resolve(self):
+        messages = make_messages(3)
+        ids = [m.id for m in messages[:2]]
+        response = self.post(reverse("solve_messages"), {"ids": ids + [0]})
+        self.assertEqual(
+            response.json(),
+            {
+                "success": True,
+                "resolved": 2,
+                "results": {
+                    str(ids[0]): RESOLVED,
+                    str(ids[1]): RESOLVED,
+                    "0": NOT_FOUND,
+                },
+            },
+        )
+        self.assertEqual(list(ContactMessage.objects.all()), messages[2:])
+
+    def test_bad_requests(self):
+        response = self.post(reverse("solve_messages"), {"ids": "all"})
+        self.assertEqual(response.status_code, 400)
+        response = self.post(reverse("solve_messages"), ["not", "an", "object"])
+        self.assertEqual(response.status_code, 400)
+        response = self.client.get(reverse("solve_messages"))
+        self.assertEqual(response.status_code, 405)
+
+    def test_csrf_and_staff_are_required(self):
+        response = self.client.post(
+            reverse("solve_messages"), "{}", content_type="application/json"
+        )
+        self.assertEqual(response.status_code, 403)
+
+        (message,) = make_messages(1)
+        response = Client().post(
+            reverse("solve_messages"),
+            {"ids": [message.id]},
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 302)
+        response = Client().post(reverse("solve_message", args=[message.id]))
+        self.assertEqual(response.status_code, 302)
+        self.assertTrue(ContactMessage.objects.exists())
+
+    def test_single_message_route(self):
+        (message,) = make_messages(1)
+        url = reverse("solve_message", args=[message.id])
+        self.assertEqual(self.post(url).json(), {"success": True})
+        self.assertEqual(self.post(url).status_code, 404)
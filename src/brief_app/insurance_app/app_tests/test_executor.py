@@ -0,0 +1,71 @@
+import asyncio
+import json
+import threading
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+from django.urls import reverse
+
+from insurance_app.executor import ExecutorBusy, PredictionExecutor
+from insurance_app.app_tests.test_quotes import APPLICANT
+
+
+class PredictionExecutorTest(SimpleTestCase):
+    def test_runs_callable_off_the_event_loop(self):
+        executor = PredictionExecutor(max_workers=1, max_queue=0)
+        loop_thread = threading.get_ident()
+
+        async def main():
+            return await executor.run(threading.get_ident)
+
+        self.assertNotEqual(asyncio.run(main()), loop_thread)
+        self.assertEqual(executor.stats()["in_flight"], 0)
+        executor.shutdown()
+
+    def test_rejects_when_queue_is_full(self):
+        executor = PredictionExecutor(max_workers=1, max_queue=1)
+        release = threading.Event()
+
+        async def main():
+            blocked = [
+                asyncio.ensure_future(executor.run(release.wait)) for _ in range(2)
+            ]
+            await asyncio.sleep(0)
+            with self.assertRaises(ExecutorBusy):
+                await executor.run(release.wait)
+            release.set()
+            await asyncio.gather(*blocked)
+
+        asyncio.run(main())
+        self.assertEqual(executor.stats()["rejected"], 1)
+        executor.shutdown()
+
+
+class PredictChargesAsyncViewTest(SimpleTestCase):
+    async def post(self, data):
+        return await self.async_client.post(
+            reverse("predict_charges_async"),
+            data=json.dumps(data),
+            content_type="application/json",
+        )
+
+    async def test_matches_sync_endpoint(self):
+        response = await self.post(APPLICANT)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"prediction": 7193.9})
+
+    async def test_invalid_input(self):
+        response = await self.post({**APPLICANT, "age": "old"})
+        self.assertEqual(response.status_code, 400)
+
+    async def test_saturated_pool_returns_503(self):
+        full = PredictionExecutor(max_workers=1, max_queue=0)
+        full._slots.acquire()
+        with patch("insurance_app.views.prediction_executor", full):
+            response = await self.post(APPLICANT)
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response["Retry-After"], "1")
+
+    async def test_rejects_get(self):
+        response = await self.async_client.get(reverse("predict_charges_async"))
+        self.assertEqual(response.status_code, 405)
@@ -0,0 +1,66 @@
+import itertools
+
+import numpy as np
+from django.test import SimpleTestCase
+
+from insurance_app.features import (
+    FEATURE_COLUMNS,
+    encode_profiles,
+    encode_profiles_pandas,
+    to_frame,
+)
+from insurance_app.model_registry import PROFILE_MODEL, registry
+from insurance_app.views import PredictChargesView
+
+
+def profile_grid():
+    """Profiles covering every age/BMI bin edge, smoker value and children count."""
+    ages = [0, 17, 18, 19, 25, 26, 35, 36, 45, 46, 64, 120]
+    bmis = [0.0, 15.2, 18.4, 18.5, 24.9, 25.0, 29.9, 30.0, 45.3]
+    return [
+        {
+            "age": age,
+            "bmi": bmi,
+            "smoker": smoker,
+            "children": children,
+            "region": "Northeast",
+            "sex": "Male",
+        }
+        for age, bmi, smoker, children in itertools.product(
+            ages, bmis, ["Yes", "No"], [0, 1, 2, 5]
+        )
+    ]
+
+
+class FeatureEncoderParityTest(SimpleTestCase):
+    def test_matches_pandas_encoding_row_by_row(self):
+        view = PredictChargesView()
+        for profile in profile_grid():
+            expected = encode_profiles_pandas([profile]).to_numpy(dtype=np.float64)
+            np.testing.assert_array_equal(encode_profiles([profile]), expected)
+            np.testing.assert_array_equal(
+                view.preprocess_data(profile).to_numpy(), expected
+            )
+
+    def test_matches_pandas_encoding_in_batch(self):
+        profiles = profile_grid()
+        expected = encode_profiles_pandas(profiles).to_numpy(dtype=np.float64)
+        np.testing.assert_array_equal(encode_profiles(profiles), expected)
+
+    def test_unknown_smoker_encodes_as_nan(self):
+        profile = {"age": 30, "bmi": 22.0, "smoker": "maybe", "children": 0}
+        expected = encode_profiles_pandas([profile]).to_numpy(dtype=np.float64)
+        np.testing.assert_array_equal(encode_profiles([profile]), expected)
+        self.assertTrue(np.isnan(encode_profiles([profile])[0, 0]))
+
+    def test_model_predictions_are_identical(self):
+        model = registry.get(PROFILE_MODEL)
+        profiles = profile_grid()
+        np.testing.assert_array_equal(
+            model.predict(to_frame(encode_profiles(profiles))),
+            model.predict(encode_profiles_pandas(profiles)),
+        )
+
+    def test_columns_in_expected_order(self):
+        frame = to_frame(encode_profiles(profile_grid()[:1]))
+        self.assertEqual(list(frame.columns), FEATURE_COLUMNS)
@@ -163,3 +163,11 @@ class AppointmentFormTest(TestCase):
             }
         )
         self.assertFalse(form.is_valid())
+
+    def test_times_off_the_slot_grid_are_rejected(self):
+        for time in ("09:30", "08:00", "19:00"):
+            form = AppointmentForm(
+                data={"reason": "Consultation", "date": date(2025, 5, 13), "time": time}
+            )
+            self.assertFalse(form.is_valid())
+            self.assertIn("time", form.errors)
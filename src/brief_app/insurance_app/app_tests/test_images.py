@@ -0,0 +1,77 @@
+import os
+import tempfile
+from pathlib import Path
+
+from django.template import Context, Template
+from django.test import SimpleTestCase
+from PIL import Image
+
+from insurance_app.images import build_variants, get_variants, variant_widths
+
+
+class VariantWidthsTest(SimpleTestCase):
+    def test_keeps_smaller_widths_and_the_capped_source_width(self):
+        self.assertEqual(variant_widths(1024), [480, 960, 1024])
+        self.assertEqual(variant_widths(400), [400])
+        self.assertEqual(variant_widths(2810), [480, 960, 1440, 1920])
+
+
+class BuildVariantsTest(SimpleTestCase):
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.tmp = Path(tmp_dir.name)
+        self.source = self.tmp / "hero.png"
+        Image.new("RGB", (1000, 500), (16, 120, 80)).save(self.source)
+        self.output = self.tmp / "build"
+        # Resolve {% static %} against an empty STATIC_ROOT, not a local build
+        self.static_root = str(self.tmp / "static_root")
+
+    def render(self, markup):
+        return Template("{% load responsive_images %}" + markup).render(Context())
+
+    def test_writes_every_format_and_width(self):
+        index = build_variants({"images/hero.png": str(self.source)}, self.output)
+        entry = index["images/hero.png"]
+        self.assertEqual((entry["width"], entry["height"]), (1000, 500))
+        for fmt in ("avif", "webp"):
+            names = [v["name"] for v in entry["variants"][fmt]]
+            self.assertEqual(
+                names,
+                [
+                    f"images/hero-480w.{fmt}",
+                    f"images/hero-960w.{fmt}",
+                    f"images/hero-1000w.{fmt}",
+                ],
+            )
+            with Image.open(self.output / "static" / names[0]) as image:
+                self.assertEqual(image.size, (480, 240))
+
+    def test_skips_variants_newer_than_the_source(self):
+        build_variants({"images/hero.png": str(self.source)}, self.output)
+        variant = self.output / "static" / "images" / "hero-480w.webp"
+        os.utime(variant, (4102444800, 4102444800))
+        build_variants({"images/hero.png": str(self.source)}, self.output)
+        self.assertEqual(variant.stat().st_mtime, 4102444800)
+
+    def test_picture_tag_uses_the_index(self):
+        build_variants({"images/hero.png": str(self.source)}, self.output)
+        with self.settings(IMAGE_BUILD_DIR=self.output, STATIC_ROOT=self.static_root):
+            self.assertIsNotNone(get_variants("images/hero.png"))
+            html = self.render(
+                '{% picture "images/hero.png" alt="Hero" class="w-full" %}'
+            )
+        self.assertTrue(html.startswith('<picture><source type="image/avif"'))
+        self.assertIn("/static/images/hero-960w.webp 960w", html)
+        self.assertIn('class="w-full"', html)
+        self.assertIn('width="1000"', html)
+        self.assertIn('src="/static/images/hero.png"', html)
+
+    def test_picture_tag_falls_back_to_img(self):
+        with self.settings(IMAGE_BUILD_DIR=self.output, STATIC_ROOT=self.static_root):
+            html = self.render('{% picture "images/logo.svg" alt="Logo" %}')
+        self.assertEqual(
+            html,
+            '<img src="/static/images/logo.svg" alt="Logo" decoding="async"'
+            ' loading="lazy">',
+        )
@@ -0,0 +1,52 @@
+import os
+import subprocess
+import sys
+
+from django.conf import settings
+from django.test import SimpleTestCase
+
+# What a Gunicorn worker or manage.py does before handling anything
+BOOT = """
+from brief_app.wsgi import application
+from django.urls import get_resolver
+get_resolver().url_patterns
+"""
+
+# Only the prediction views may import these, through insurance_app.prediction
+FORBIDDEN = ("numpy", "pandas", "sklearn")
+
+
+def import_times(code):
+    """Runs code under ``-X importtime`` and returns {module: cumulative us}."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=settings.BASE_DIR,
+        env={**os.environ, "DJANGO_SETTINGS_MODULE": "brief_app.settings"},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+class ImportTimeBudgetTest(SimpleTestCase):
+    def test_booting_django_skips_the_prediction_stack(self):
+        times = import_times(BOOT)
+        self.assertIn("django", times)
+        loaded = sorted(name for name in times if name.split(".")[0] in FORBIDDEN)
+        slowest = sorted(times.items(), key=lambda item: -item[1])[:10]
+        self.assertEqual(
+            loaded,
+            [],
+            f"Booting Django imported {loaded[:5]}; slowest imports (us): {slowest}",
+        )
+
+    def test_prediction_module_loads_the_stack(self):
+        times = import_times(BOOT + "import insurance_app.prediction\n")
+        self.assertIn("pandas", times)
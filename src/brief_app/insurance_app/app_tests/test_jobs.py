@@ -0,0 +1,112 @@
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from insurance_app.jobs import SUMMARY_LENGTH, job_page
+from insurance_app.models import Job
+
+
+def make_jobs(count, description="Short description"):
+    Job.objects.bulk_create(
+        Job(title=f"Job {i}", description=description) for i in range(count)
+    )
+
+
+class JobPageTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def test_keyset_pages_walk_forward_and_back(self):
+        make_jobs(5)
+        ids = list(Job.objects.order_by("job_id").values_list("job_id", flat=True))
+
+        first = job_page(size=2)
+        self.assertEqual([j["job_id"] for j in first["jobs"]], ids[:2])
+        self.assertIsNone(first["previous_before"])
+
+        second = job_page(after=first["next_after"], size=2)
+        self.assertEqual([j["job_id"] for j in second["jobs"]], ids[2:4])
+
+        last = job_page(after=second["next_after"], size=2)
+        self.assertEqual([j["job_id"] for j in last["jobs"]], ids[4:])
+        self.assertIsNone(last["next_after"])
+
+        back = job_page(before=last["previous_before"], size=2)
+        self.assertEqual(back["jobs"], second["jobs"])
+
+    def test_summary_is_cut_in_the_database(self):
+        make_jobs(1, description="x" * (SUMMARY_LENGTH + 50))
+        make_jobs(1, description="y" * SUMMARY_LENGTH)
+        long, exact = job_page()["jobs"]
+        self.assertEqual(len(long["summary"]), SUMMARY_LENGTH)
+        self.assertTrue(long["truncated"])
+        self.assertFalse(exact["truncated"])
+        self.assertNotIn("description", long)
+
+    def test_query_count_does_not_grow_with_the_table(self):
+        make_jobs(20)
+        with self.assertNumQueries(1):
+            job_page()
+        make_jobs(2000)
+        cache.clear()
+        after = Job.objects.order_by("-job_id")[5].job_id
+        with self.assertNumQueries(1):
+            last = job_page(after=after)
+        self.assertEqual(len(last["jobs"]), 5)
+        with self.assertNumQueries(0):
+            job_page(after=after)
+
+    def test_saving_or_deleting_a_job_invalidates_the_cache(self):
+        make_jobs(1)
+        self.assertEqual(len(job_page()["jobs"]), 1)
+
+        job = Job.objects.create(title="New", description="Fresh")
+        self.assertEqual(len(job_page()["jobs"]), 2)
+
+        job.delete()
+        self.assertEqual(len(job_page()["jobs"]), 1)
+
+
+class JoinUsViewTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def test_lists_summaries_and_paginates(self):
+        make_jobs(15, description="z" * (SUMMARY_LENGTH + 1) + "TAIL")
+        response = self.client.get(reverse("join_us"))
+        self.assertEqual(len(response.context["jobs"]), 12)
+        self.assertNotContains(response, "TAIL")
+        self.assertContains(response, "Read more", count=12)
+
+        response = self.client.get(
+            reverse("join_us"), {"after": response.context["next_after"]}
+        )
+        self.assertEqual(len(response.context["jobs"]), 3)
+        self.assertContains(response, "Previous")
+
+    def test_application_form_offers_every_job(self):
+        make_jobs(15)
+        response = self.client.get(reverse("join_us"))
+        self.assertEqual(len(response.context["jobs"]), 12)
+        self.assertEqual(len(response.context["job_choices"]), 15)
+        self.assertContains(response, "</option>", count=16)  # with "Select a Job"
+
+        Job.objects.create(title="Late addition", description="New")
+        response = self.client.get(reverse("join_us"))
+        self.assertContains(response, "Late addition</option>")
+
+    def test_malformed_cursor_shows_the_first_page(self):
+        make_jobs(1)
+        response = self.client.get(reverse("join_us"), {"after": "abc"})
+        self.assertEqual(len(response.context["jobs"]), 1)
+
+    def test_description_expansion(self):
+        job = Job.objects.create(title="Dev", description="Full text")
+        response = self.client.get(reverse("job_description", args=[job.job_id]))
+        self.assertEqual(
+            response.json(), {"job_id": job.job_id, "description": "Full text"}
+        )
+        response = self.client.get(reverse("job_description", args=[job.job_id + 1]))
+        self.assertEqual(response.status_code, 404)
@@ -0,0 +1,96 @@
+import os
+import pickle
+import shutil
+import tempfile
+import time
+
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+
+from insurance_app.model_registry import (
+    ModelRegistry,
+    QUOTE_MODEL,
+    PROFILE_MODEL,
+    registry,
+    resolve_model_path,
+)
+
+User = get_user_model()
+
+
+class ModelRegistryTest(SimpleTestCase):
+    def setUp(self):
+        """Creates a private registry and a temporary artifact for each test."""
+        self.registry = ModelRegistry()
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, "artifact.pkl")
+        self.write_artifact({"coef": 1})
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def write_artifact(self, obj):
+        """Pickles obj to the artifact path and bumps its mtime."""
+        with open(self.path, "wb") as file:
+            pickle.dump(obj, file)
+        stamp = time.time_ns() + 1_000_000_000
+        os.utime(self.path, ns=(stamp, stamp))
+
+    def test_loads_once(self):
+        first = self.registry.get(self.path)
+        second = self.registry.get(self.path)
+        self.assertIs(first, second)
+        self.assertEqual(self.registry.load_count, 1)
+
+    def test_reloads_when_content_changes(self):
+        swapped = []
+        self.registry.add_listener(swapped.append)
+        old_version = self.registry.version(self.path)
+
+        self.write_artifact({"coef": 2})
+
+        self.assertEqual(self.registry.get(self.path), {"coef": 2})
+        self.assertNotEqual(self.registry.version(self.path), old_version)
+        self.assertEqual(self.registry.load_count, 2)
+        self.assertEqual(swapped, [self.path])
+
+    def test_touch_without_change_does_not_unpickle(self):
+        model = self.registry.get(self.path)
+        self.write_artifact({"coef": 1})
+        self.assertIs(self.registry.get(self.path), model)
+        self.assertEqual(self.registry.load_count, 1)
+
+    def test_missing_file_raises(self):
+        with self.assertRaises(FileNotFoundError):
+            self.registry.get(os.path.join(self.tmp_dir, "missing.pkl"))
+
+    def test_stats_reports_active_version(self):
+        self.registry.get(self.path)
+        stats = self.registry.stats()
+        self.assertEqual(stats["load_count"], 1)
+        self.assertGreaterEqual(stats["load_seconds"], 0)
+        self.assertEqual(
+            stats["models"]["artifact.pkl"]["version"],
+            self.registry.version(self.path),
+        )
+
+    def test_relative_names_resolve_to_model_dir(self):
+        self.assertTrue(os.path.exists(resolve_model_path(QUOTE_MODEL)))
+        self.assertTrue(os.path.exists(resolve_model_path(PROFILE_MODEL)))
+
+
+class ModelStatusViewTest(TestCase):
+    def test_staff_can_read_registry_stats(self):
+        registry.get(QUOTE_MODEL)
+        User.objects.create_user(username="staff", password="pass", is_staff=True)
+        self.client.login(username="staff", password="pass")
+
+        resp = self.client.get(reverse("model_status"))
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertIn(QUOTE_MODEL, resp.json()["models"])
+
+    def test_anonymous_is_redirected(self):
+        resp = self.client.get(reverse("model_status"))
+        self.assertEqual(resp.status_code, 302)
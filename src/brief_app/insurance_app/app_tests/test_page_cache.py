@@ -0,0 +1,99 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.http import HttpResponse
+from django.middleware.csrf import get_token
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+
+from insurance_app.page_cache import (
+    is_anonymous_request,
+    is_cacheable_response,
+    page_cache_key,
+)
+
+
+@override_settings(PAGE_CACHE_TIMEOUT=300)
+class AnonymousPageCacheTest(TestCase):
+    def setUp(self):
+        caches["default"].clear()
+        self.addCleanup(caches["default"].clear)
+
+    def test_second_anonymous_request_skips_rendering(self):
+        first = self.client.get(reverse("about"))
+        second = self.client.get(reverse("about"))
+        self.assertTemplateUsed(first, "insurance_app/about.html")
+        self.assertEqual(second.templates, [])
+        self.assertEqual(second.content, first.content)
+        self.assertIn("Cookie", second["Vary"])
+
+    def test_csrf_cookie_does_not_split_the_cache(self):
+        self.client.get(reverse("home"))
+        self.client.cookies["csrftoken"] = "x" * 32
+        self.assertEqual(self.client.get(reverse("home")).templates, [])
+
+    def test_logged_in_users_get_their_own_page(self):
+        self.client.get(reverse("home"))
+        user = get_user_model().objects.create_user(
+            username="visitor", password="pass12345"
+        )
+        self.client.force_login(user)
+        response = self.client.get(reverse("home"))
+        self.assertTemplateUsed(response, "insurance_app/home.html")
+        self.assertContains(response, "Logout")
+
+    def test_query_strings_share_the_page_entry(self):
+        self.client.get(reverse("about"))
+        for value in ("1", "2"):
+            response = self.client.get(reverse("about"), {"x": value})
+            self.assertEqual(response.templates, [])
+
+    def test_allow_listed_parameters_get_their_own_entry(self):
+        request = RequestFactory().get("/about/", {"lang": "fr", "x": "1"})
+        self.assertEqual(
+            page_cache_key(request), page_cache_key(RequestFactory().get("/about/"))
+        )
+        self.assertNotEqual(
+            page_cache_key(request, ["lang"]),
+            page_cache_key(RequestFactory().get("/about/", {"lang": "en"}), ["lang"]),
+        )
+        self.assertEqual(
+            page_cache_key(RequestFactory().get("/about/", {"x": "2"}), ["lang"]),
+            page_cache_key(request, []),
+        )
+
+    @override_settings(PAGE_CACHE_TIMEOUT=0)
+    def test_timeout_zero_disables_the_cache(self):
+        self.client.get(reverse("about"))
+        response = self.client.get(reverse("about"))
+        self.assertTemplateUsed(response, "insurance_app/about.html")
+
+    def test_anonymous_header_is_cached_per_page(self):
+        # Pages without the page cache still reuse the anonymous header
+        self.client.get(reverse("join_us"))
+        with self.assertTemplateNotUsed("insurance_app/includes/header.html"):
+            response = self.client.get(reverse("join_us"))
+        self.assertContains(response, "Sign Up")
+
+
+class CacheabilityTest(TestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+
+    def test_session_and_messages_cookies_are_not_anonymous(self):
+        self.assertTrue(is_anonymous_request(self.factory.get("/")))
+        self.assertFalse(is_anonymous_request(self.factory.post("/")))
+        for cookie in ("sessionid", "messages"):
+            request = self.factory.get("/")
+            request.COOKIES[cookie] = "value"
+            self.assertFalse(is_anonymous_request(request), cookie)
+
+    def test_responses_with_csrf_tokens_or_cookies_are_not_stored(self):
+        request = self.factory.get("/")
+        self.assertTrue(is_cacheable_response(request, HttpResponse("ok")))
+
+        response = HttpResponse("ok")
+        response.set_cookie("tracking", "1")
+        self.assertFalse(is_cacheable_response(request, response))
+
+        get_token(request)
+        self.assertFalse(is_cacheable_response(request, HttpResponse("ok")))
@@ -0,0 +1,131 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from insurance_app.models import ContactMessage, PredictionHistory, UserProfile
+from insurance_app.pagination import CursorPaginator, InvalidCursor
+
+
+def make_messages(count, same_time=False):
+    ContactMessage.objects.bulk_create(
+        ContactMessage(name=f"Sender {i}", email="s@example.com", message="Hi")
+        for i in range(count)
+    )
+    if not same_time:
+        now = timezone.now()
+        for message in ContactMessage.objects.all():
+            message.submitted_at = now - timedelta(minutes=message.id % 4)
+            message.save(update_fields=["submitted_at"])
+
+
+class CursorPaginatorTest(TestCase):
+    ordering = ("-submitted_at", "-id")
+
+    def paginator(self, per_page=3):
+        return CursorPaginator(ContactMessage.objects.all(), self.ordering, per_page)
+
+    def test_walks_every_row_once_forward_and_back(self):
+        # Shared timestamps make the id tie-breaker do the work
+        make_messages(10)
+        expected = list(ContactMessage.objects.order_by(*self.ordering))
+        paginator = self.paginator()
+
+        pages = [paginator.page()]
+        while pages[-1].has_next():
+            pages.append(paginator.page(pages[-1].next_cursor))
+        self.assertEqual([m for page in pages for m in page], expected)
+        self.assertEqual([len(page) for page in pages], [3, 3, 3, 1])
+        self.assertFalse(pages[0].has_previous())
+
+        back = paginator.page(pages[-1].previous_cursor)
+        self.assertEqual(back.object_list, pages[-2].object_list)
+        first = paginator.page(pages[1].previous_cursor)
+        self.assertEqual(first.object_list, pages[0].object_list)
+        self.assertFalse(first.has_previous())
+        self.assertTrue(first.has_next())
+
+    def test_rows_with_identical_timestamps(self):
+        make_messages(5, same_time=True)
+        paginator = self.paginator(per_page=2)
+        second = paginator.page(paginator.page().next_cursor)
+        ids = list(
+            ContactMessage.objects.order_by(*self.ordering).values_list("id", flat=True)
+        )
+        self.assertEqual([m.id for m in second], ids[2:4])
+
+    def test_page_is_one_query_without_count_or_offset(self):
+        make_messages(10)
+        paginator = self.paginator()
+        cursor = paginator.page().next_cursor
+        with self.assertNumQueries(1) as queries:
+            paginator.page(cursor)
+        sql = queries.captured_queries[0]["sql"].upper()
+        self.assertNotIn("COUNT(", sql)
+        self.assertNotIn("OFFSET", sql)
+
+    def test_tampered_or_foreign_cursors_are_rejected(self):
+        make_messages(4)
+        cursor = self.paginator().page().next_cursor
+        with self.assertRaises(InvalidCursor):
+            self.paginator().page(cursor[:-2] + "xx")
+        with self.assertRaises(InvalidCursor):
+            self.paginator().page("not-a-cursor")
+        other = CursorPaginator(ContactMessage.objects.all(), ("-id",), 3)
+        with self.assertRaises(InvalidCursor):
+            other.page(cursor)
+
+
+class PaginatedViewsTest(TestCase):
+    def test_message_list_pages_with_cursors(self):
+        staff = get_user_model().objects.create_user(
+            username="staff", password="x", is_staff=True
+        )
+        self.client.force_login(staff)
+        make_messages(30)
+        url = reverse("messages_list")
+
+        response = self.client.get(url)
+        self.assertEqual(len(response.context["messages"]), 25)
+        self.assertContains(response, "Older")
+        self.assertNotContains(response, "Newer")
+
+        response = self.client.get(
+            url, {"cursor": response.context["page_obj"].next_cursor}
+        )
+        self.assertEqual(len(response.context["messages"]), 5)
+        self.assertContains(response, "Newer")
+
+        response = self.client.get(url, {"cursor": "garbage"})
+        self.assertEqual(len(response.context["messages"]), 25)
+
+    def test_prediction_history_pages_with_cursors(self):
+        user = UserProfile.objects.create_user(username="history", password="x")
+        self.client.force_login(user)
+        for charges in range(12):
+            PredictionHistory.objects.create(
+                user=user,
+                age=30,
+                weight=70,
+                height=175,
+                num_children=0,
+                smoker="No",
+                region="Northeast",
+                sex="Male",
+                predicted_charges=charges,
+            )
+        url = reverse("prediction_history")
+
+        response = self.client.get(url)
+        self.assertEqual(len(response.context["predictions"]), 10)
+        self.assertTrue(response.context["is_paginated"])
+        self.assertContains(response, "Showing 10 of 12")
+
+        response = self.client.get(
+            url, {"cursor": response.context["page_obj"].next_cursor}
+        )
+        charges = [int(p.predicted_charges) for p in response.context["predictions"]]
+        self.assertEqual(charges, [1, 0])
+        self.assertContains(response, "Previous")
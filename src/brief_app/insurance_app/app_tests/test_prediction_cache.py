@@ -0,0 +1,160 @@
+import json
+import os
+import shutil
+import tempfile
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from insurance_app.features import score_profiles
+from insurance_app.model_registry import (
+    PROFILE_MODEL,
+    QUOTE_MODEL,
+    registry,
+    resolve_model_path,
+)
+from insurance_app.prediction_cache import (
+    PredictionCache,
+    cached_prediction,
+    prediction_cache,
+)
+from insurance_app.quotes import parse_quote
+from insurance_app.app_tests.test_quotes import APPLICANT
+
+
+class PredictionCacheTest(SimpleTestCase):
+    def test_counts_hits_and_misses(self):
+        cache = PredictionCache(maxsize=4, ttl=0)
+        self.assertEqual(cache.get_or_compute("a", lambda: 1), 1)
+        self.assertEqual(cache.get_or_compute("a", lambda: 2), 1)
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+        self.assertEqual(stats["hit_rate"], 0.5)
+
+    def test_evicts_least_recently_used(self):
+        cache = PredictionCache(maxsize=2, ttl=0)
+        cache.get_or_compute("a", lambda: 1)
+        cache.get_or_compute("b", lambda: 2)
+        cache.get_or_compute("a", lambda: 1)
+        cache.get_or_compute("c", lambda: 3)
+        self.assertEqual(cache.get_or_compute("a", lambda: 0), 1)
+        self.assertEqual(cache.get_or_compute("b", lambda: 0), 0)
+
+    def test_expired_entries_are_recomputed(self):
+        cache = PredictionCache(maxsize=2, ttl=10)
+        with patch("insurance_app.prediction_cache.time.monotonic", return_value=0):
+            cache.get_or_compute("a", lambda: 1)
+        with patch("insurance_app.prediction_cache.time.monotonic", return_value=11):
+            self.assertEqual(cache.get_or_compute("a", lambda: 2), 2)
+
+    def test_errors_are_not_cached(self):
+        cache = PredictionCache()
+
+        def fail():
+            raise ValueError("boom")
+
+        with self.assertRaises(ValueError):
+            cache.get_or_compute("a", fail)
+        self.assertEqual(cache.stats()["size"], 0)
+
+
+class CachedPredictionTest(SimpleTestCase):
+    def setUp(self):
+        """Copies the quote artifact to a temporary directory."""
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, "model_1.pickle")
+        shutil.copyfile(resolve_model_path(QUOTE_MODEL), self.path)
+        prediction_cache.clear()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    @override_settings(USE_COMPILED_MODELS=False)
+    def test_model_swap_invalidates_cache(self):
+        cached_prediction(self.path, {"age": 35}, lambda model, row: 1.0)
+        self.assertEqual(
+            cached_prediction(self.path, {"age": 35}, lambda model, row: 2.0), 1.0
+        )
+
+        # Rewrite the artifact with different content
+        registry.get(self.path)
+        with open(self.path, "ab") as file:
+            file.write(b"\0")
+        os.utime(self.path, ns=(0, 0))
+        self.assertEqual(
+            cached_prediction(self.path, {"age": 35}, lambda model, row: 3.0), 3.0
+        )
+
+
+@override_settings(USE_COMPILED_MODELS=False)
+class CanonicalBmiTest(SimpleTestCase):
+    def setUp(self):
+        prediction_cache.clear()
+
+    def test_profile_bmi_is_not_rounded_across_a_category_boundary(self):
+        profile = {
+            "age": 35,
+            "smoker": "No",
+            "children": 2,
+            "region": "Northeast",
+            "sex": "Male",
+        }
+        model = registry.get(PROFILE_MODEL)
+        for bmi in (24.96, 25.04):
+            row = {**profile, "bmi": bmi}
+            cached = cached_prediction(
+                PROFILE_MODEL, row, lambda model, row: score_profiles(model, [row])[0]
+            )
+            self.assertEqual(cached, score_profiles(model, [row])[0])
+        self.assertEqual(prediction_cache.stats()["size"], 2)
+
+    def test_quote_model_scores_the_rounded_bmi(self):
+        scored = []
+
+        def predict(model, row):
+            scored.append(row["bmi"])
+            return 1.0
+
+        for bmi in (23.12, 23.1400001, 23.08):
+            inputs = parse_quote({**APPLICANT, "bmi": bmi})
+            cached_prediction(QUOTE_MODEL, inputs, predict)
+        self.assertEqual(scored, [23.1])
+
+
+@override_settings(USE_COMPILED_MODELS=False)
+class PredictChargesCacheTest(TestCase):
+    def setUp(self):
+        prediction_cache.clear()
+
+    def post(self, data):
+        return self.client.post(
+            reverse("predict_charges"),
+            data=json.dumps(data),
+            content_type="application/json",
+        )
+
+    def test_repeated_quote_skips_model(self):
+        model = registry.get(QUOTE_MODEL)
+        with patch.object(model, "predict", wraps=model.predict) as predict:
+            first = self.post(APPLICANT).json()
+            second = self.post({**APPLICANT, "age": "35"}).json()
+        self.assertEqual(first, second)
+        self.assertEqual(predict.call_count, 1)
+
+    def test_ignored_inputs_and_bmi_noise_share_an_entry(self):
+        model = registry.get(QUOTE_MODEL)
+        with patch.object(model, "predict", wraps=model.predict) as predict:
+            self.post({**APPLICANT, "bmi": 23.12})
+            self.post({**APPLICANT, "bmi": 23.12, "height": 181, "weight": 76})
+            self.post({**APPLICANT, "bmi": 23.1400001})
+            self.post({**APPLICANT, "bmi": 23.3})
+        self.assertEqual(predict.call_count, 2)
+        self.assertEqual(prediction_cache.stats()["size"], 2)
+
+    def test_different_inputs_are_scored(self):
+        model = registry.get(QUOTE_MODEL)
+        with patch.object(model, "predict", wraps=model.predict) as predict:
+            self.post(APPLICANT)
+            self.post({**APPLICANT, "smoker": "yes"})
+        self.assertEqual(predict.call_count, 2)
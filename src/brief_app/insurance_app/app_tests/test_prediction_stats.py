@@ -0,0 +1,82 @@
+from decimal import Decimal
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from insurance_app.models import PredictionHistory, PredictionStats, UserProfile
+
+
+def predict(user, charges):
+    return PredictionHistory.objects.create(
+        user=user,
+        age=30,
+        weight=70,
+        height=175,
+        num_children=0,
+        smoker="No",
+        region="Northeast",
+        sex="Male",
+        predicted_charges=charges,
+    )
+
+
+class PredictionStatsTest(TestCase):
+    def setUp(self):
+        self.user = UserProfile.objects.create_user(username="quoter", password="x")
+
+    def test_new_predictions_update_the_running_stats(self):
+        for charges in (5000.5, 12000, 900.254, 3000):
+            last = predict(self.user, charges)
+        stats = PredictionStats.objects.get(user=self.user)
+        self.assertEqual(stats.count, 4)
+        self.assertEqual(stats.total_charges, Decimal("20900.75"))
+        self.assertEqual(stats.min_charges, Decimal("900.25"))
+        self.assertEqual(stats.max_charges, Decimal("12000.00"))
+        self.assertEqual(stats.last_charges, Decimal("3000.00"))
+        self.assertEqual(stats.last_timestamp, last.timestamp)
+        self.assertEqual(stats.average_charges, Decimal("5225.1875"))
+
+    def test_updating_a_prediction_does_not_count_it_twice(self):
+        prediction = predict(self.user, 1000)
+        prediction.age = 31
+        prediction.save()
+        self.assertEqual(PredictionStats.objects.get(user=self.user).count, 1)
+
+    def test_rebuild_matches_the_history(self):
+        for charges in (100, 300):
+            predict(self.user, charges)
+        PredictionStats.objects.filter(user=self.user).update(count=0)
+        stats = PredictionStats.rebuild(self.user)
+        self.assertEqual((stats.count, stats.total_charges), (2, Decimal("400")))
+        self.assertEqual(stats.last_charges, Decimal("300"))
+
+    def test_users_without_predictions_get_empty_stats(self):
+        stats = PredictionStats.for_user(self.user)
+        self.assertEqual(stats.count, 0)
+        self.assertIsNone(stats.average_charges)
+
+
+class PredictionHistoryViewStatsTest(TestCase):
+    def setUp(self):
+        self.user = UserProfile.objects.create_user(username="viewer", password="x")
+        self.client.force_login(self.user)
+
+    def page_queries(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("prediction_history"))
+        self.assertEqual(response.status_code, 200)
+        return response, [q["sql"] for q in queries]
+
+    def test_totals_come_from_one_lookup(self):
+        for charges in (1000, 2000, 3000):
+            predict(self.user, charges)
+        response, queries = self.page_queries()
+        self.assertEqual(response.context["total_predictions"], 3)
+        self.assertEqual(response.context["average_charges"], Decimal("2000"))
+        self.assertFalse(response.context["is_paginated"])
+
+        history = [q for q in queries if "insurance_app_predictionhistory" in q]
+        self.assertEqual(len(history), 1)
+        self.assertNotIn("COUNT(", history[0].upper())
@@ -0,0 +1,164 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+from unittest.mock import patch
+
+import pandas as pd
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from insurance_app.model_registry import QUOTE_MODEL, registry, resolve_model_path
+from insurance_app.prediction_cache import prediction_cache
+from insurance_app import quote_table
+from insurance_app.quote_table import (
+    QuoteTableNotReady,
+    StaleQuoteTable,
+    build_quote_table,
+    ensure_quote_table,
+    form_bmi_category,
+    grid_path,
+    load_quote_table,
+    lookup_quote,
+    quote_table_registry,
+    read_quote_table,
+)
+from insurance_app.quotes import clamp_prediction
+
+QUOTE = {
+    "height": 175.0,
+    "weight": 70.0,
+    "age": 35,
+    "sex": "male",
+    "smoker": "no",
+    "region": "northeast",
+    "children": 1,
+    "bmi": 22.9,
+    "BMI_category": "Poids normal",
+}
+
+
+class QuoteTableTestCase(SimpleTestCase):
+    def setUp(self):
+        """Builds a small table for a copy of the quote artifact."""
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, "model_1.pickle")
+        shutil.copyfile(resolve_model_path(QUOTE_MODEL), self.path)
+        self.model = registry.get(self.path)
+        self.table = build_quote_table(
+            self.path, self.model, ages=(30, 40), children=(0, 2), bmi=(20.0, 30.0)
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+
+class QuoteTableTest(QuoteTableTestCase):
+    def test_lookup_matches_model_on_grid(self):
+        table = read_quote_table(self.path)
+        for age, smoker, bmi in ((30, "yes", 20.0), (35, "no", 22.9), (40, "no", 30.0)):
+            quote = {
+                **QUOTE,
+                "age": age,
+                "smoker": smoker,
+                "bmi": bmi,
+                "BMI_category": form_bmi_category(bmi),
+            }
+            expected = clamp_prediction(self.model.predict(pd.DataFrame([quote]))[0])
+            self.assertEqual(table.lookup(quote), expected)
+
+    def test_off_grid_inputs_are_not_tabulated(self):
+        self.assertIsNone(self.table.lookup({**QUOTE, "age": 41}))
+        self.assertIsNone(self.table.lookup({**QUOTE, "children": 3}))
+        self.assertIsNone(self.table.lookup({**QUOTE, "bmi": 30.1}))
+        self.assertIsNone(self.table.lookup({**QUOTE, "region": "atlantis"}))
+        self.assertIsNone(self.table.lookup({**QUOTE, "BMI_category": "Surpoids"}))
+
+    def make_stale(self):
+        with open(self.path, "ab") as file:
+            file.write(b"\0")
+        with self.assertRaises(StaleQuoteTable):
+            read_quote_table(self.path)
+
+    def test_stale_table_is_rebuilt_in_the_background(self):
+        self.make_stale()
+        with self.assertRaises(QuoteTableNotReady):
+            load_quote_table(self.path)
+        quote_table._builds[self.path].join()
+        table = load_quote_table(self.path)
+        self.assertEqual(table.cents.shape, self.table.cents.shape)
+
+    def test_lookup_does_not_wait_for_the_build(self):
+        self.make_stale()
+        release = threading.Event()
+        rebuild = quote_table.rebuild_quote_table
+
+        def slow_rebuild(path):
+            release.wait(10)
+            return rebuild(path)
+
+        with patch.object(quote_table, "rebuild_quote_table", slow_rebuild):
+            with override_settings(USE_QUOTE_TABLE=True):
+                self.assertIsNone(lookup_quote(QUOTE, self.path))
+                self.assertIsNone(lookup_quote(QUOTE, self.path))
+            release.set()
+            quote_table._builds[self.path].join()
+        with override_settings(USE_QUOTE_TABLE=True):
+            self.assertEqual(lookup_quote(QUOTE, self.path), self.table.lookup(QUOTE))
+
+    def test_failed_build_is_retried_only_after_the_pickle_changes(self):
+        self.make_stale()
+        with patch.object(
+            quote_table, "rebuild_quote_table", side_effect=ValueError("boom")
+        ) as rebuild, self.assertLogs("insurance_app.quote_table", "ERROR"):
+            for _ in range(2):
+                with self.assertRaises(QuoteTableNotReady):
+                    load_quote_table(self.path)
+                quote_table._builds[self.path].join()
+        self.assertEqual(rebuild.call_count, 1)
+        self.make_stale()
+        with self.assertRaises(QuoteTableNotReady):
+            load_quote_table(self.path)
+        quote_table._builds[self.path].join()
+        load_quote_table(self.path)
+
+    def test_ensure_builds_missing_tables_synchronously(self):
+        self.make_stale()
+        ensure_quote_table(self.path)
+        read_quote_table(self.path)
+
+    def test_lookup_quote_needs_setting(self):
+        with override_settings(USE_QUOTE_TABLE=False):
+            self.assertIsNone(lookup_quote(QUOTE, self.path))
+        with override_settings(USE_QUOTE_TABLE=True):
+            self.assertEqual(lookup_quote(QUOTE, self.path), self.table.lookup(QUOTE))
+
+    def test_table_is_memory_mapped(self):
+        table = read_quote_table(self.path)
+        self.assertEqual(table.cents.filename, grid_path(self.path))
+
+
+@override_settings(USE_QUOTE_TABLE=True, USE_COMPILED_MODELS=False)
+class PredictChargesQuoteTableTest(QuoteTableTestCase, TestCase):
+    def setUp(self):
+        super().setUp()
+        prediction_cache.clear()
+
+    def post(self, data):
+        return self.client.post(
+            reverse("predict_charges"),
+            data=json.dumps({**data, "bmi_category": data["BMI_category"]}),
+            content_type="application/json",
+        )
+
+    def test_grid_quote_skips_model(self):
+        table = read_quote_table(self.path)
+        model = registry.get(QUOTE_MODEL)
+        with patch.object(
+            quote_table_registry, "get", return_value=table
+        ), patch.object(model, "predict", wraps=model.predict) as predict:
+            on_grid = self.post(QUOTE).json()
+            self.post({**QUOTE, "age": 60})
+        self.assertEqual(on_grid["prediction"], table.lookup(QUOTE))
+        self.assertEqual(predict.call_count, 1)
@@ -0,0 +1,165 @@
+import json
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.test import Client, TestCase, override_settings
+from django.urls import reverse
+
+from insurance_app.model_registry import QUOTE_MODEL, registry
+from insurance_app.quotes import clamp_prediction, score_quotes
+
+APPLICANT = {
+    "height": 180,
+    "weight": 75,
+    "age": 35,
+    "sex": "male",
+    "smoker": "no",
+    "region": "northeast",
+    "children": 2,
+    "bmi": 23.15,  # scored at 23.1, on the quote table's 0.1 grid
+    "bmi_category": "Poids normal",
+}
+
+
+def applicants(count):
+    """Builds count distinct valid applicant profiles."""
+    return [
+        {**APPLICANT, "age": 18 + i % 47, "smoker": ("yes", "no")[i % 2]}
+        for i in range(count)
+    ]
+
+
+class ScoreQuotesTest(TestCase):
+    def test_clamp_prediction(self):
+        self.assertEqual(clamp_prediction(1234.5678), 1234.57)
+        self.assertEqual(clamp_prediction(-10.0), 0)
+
+    @override_settings(USE_COMPILED_MODELS=False)
+    def test_one_predict_call_per_chunk_in_input_order(self):
+        model = registry.get(QUOTE_MODEL)
+        rows = applicants(5)
+        with patch.object(model, "predict", wraps=model.predict) as predict:
+            results = list(score_quotes(rows, chunk_size=2))
+        self.assertEqual(predict.call_count, 3)
+        self.assertEqual([r["index"] for r in results], [0, 1, 2, 3, 4])
+
+    def test_matches_single_quote_endpoint(self):
+        rows = applicants(4)
+        batch = [r["prediction"] for r in score_quotes(rows)]
+        single = [
+            self.client.post(
+                reverse("predict_charges"),
+                data=json.dumps(row),
+                content_type="application/json",
+            ).json()["prediction"]
+            for row in rows
+        ]
+        self.assertEqual(batch, single)
+
+    def test_per_row_errors(self):
+        rows = [APPLICANT, {**APPLICANT, "age": "old"}, 42, {**APPLICANT, "sex": "x"}]
+        results = list(score_quotes(rows))
+        self.assertIn("prediction", results[0])
+        self.assertIn("age must be a number", results[1]["error"])
+        self.assertEqual(results[2]["error"], "row must be a JSON object")
+        self.assertIn("sex must be one of", results[3]["error"])
+
+    def test_non_finite_and_huge_numbers_are_row_errors(self):
+        rows = json.loads(
+            json.dumps(
+                [
+                    {**APPLICANT, "children": float("inf")},
+                    {**APPLICANT, "bmi": float("-inf")},
+                    {**APPLICANT, "age": 1e30},
+                    APPLICANT,
+                ]
+            )
+        )
+        results = list(score_quotes(rows))
+        self.assertIn("children is out of range", results[0]["error"])
+        self.assertIn("bmi is out of range", results[1]["error"])
+        self.assertIn("age is out of range", results[2]["error"])
+        self.assertIn("prediction", results[3])
+
+
+class PredictChargesBatchViewTest(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username="broker")
+        self.client.force_login(self.user)
+
+    def test_login_and_csrf_are_required(self):
+        body = json.dumps(applicants(1))
+        resp = Client().post(
+            reverse("predict_charges_batch"), data=body, content_type="application/json"
+        )
+        self.assertEqual(resp.status_code, 302)
+
+        client = Client(enforce_csrf_checks=True)
+        client.force_login(self.user)
+        resp = client.post(
+            reverse("predict_charges_batch"), data=body, content_type="application/json"
+        )
+        self.assertEqual(resp.status_code, 403)
+
+    def test_json_array(self):
+        resp = self.client.post(
+            reverse("predict_charges_batch"),
+            data=json.dumps(applicants(3) + [{}]),
+            content_type="application/json",
+        )
+        self.assertEqual(resp.status_code, 200)
+        data = json.loads(b"".join(resp.streaming_content))
+        self.assertEqual(len(data), 4)
+        self.assertTrue(all("prediction" in r for r in data[:3]))
+        self.assertIn("error", data[3])
+
+    def test_ndjson_stream(self):
+        body = "\n".join(json.dumps(row) for row in applicants(2)) + "\n{oops\n"
+        resp = self.client.post(
+            reverse("predict_charges_batch"),
+            data=body,
+            content_type="application/x-ndjson",
+        )
+        self.assertEqual(resp["Content-Type"], "application/x-ndjson")
+        lines = b"".join(resp.streaming_content).decode().splitlines()
+        results = [json.loads(line) for line in lines]
+        self.assertEqual([r["index"] for r in results], [0, 1, 2])
+        self.assertIn("invalid JSON", results[2]["error"])
+
+    def test_rejects_non_array_body(self):
+        resp = self.client.post(
+            reverse("predict_charges_batch"),
+            data=json.dumps(APPLICANT),
+            content_type="application/json",
+        )
+        self.assertEqual(resp.status_code, 400)
+
+    @override_settings(QUOTE_BATCH_MAX_ROWS=2)
+    def test_too_many_rows(self):
+        for body, content_type in (
+            (json.dumps(applicants(3)), "application/json"),
+            (
+                "\n".join(json.dumps(row) for row in applicants(3)),
+                "application/x-ndjson",
+            ),
+        ):
+            resp = self.client.post(
+                reverse("predict_charges_batch"), data=body, content_type=content_type
+            )
+            self.assertEqual(resp.status_code, 413, content_type)
+
+    def test_model_failure_is_reported_before_streaming(self):
+        with patch(
+            "insurance_app.views.get_predictor", side_effect=FileNotFoundError("gone")
+        ):
+            resp = self.client.post(
+                reverse("predict_charges_batch"),
+                data=json.dumps(applicants(1)),
+                content_type="application/json",
+            )
+        self.assertEqual(resp.status_code, 503)
+        self.assertIn("gone", resp.json()["error"])
+
+    def test_rejects_get(self):
+        resp = self.client.get(reverse("predict_charges_batch"))
+        self.assertEqual(resp.status_code, 405)
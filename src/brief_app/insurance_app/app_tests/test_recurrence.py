@@ -0,0 +1,127 @@
+import time
+from datetime import date, timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+
+from insurance_app.admin import AvailabilityRuleAdminForm
+from insurance_app.models import (
+    Availability,
+    AvailabilityException,
+    AvailabilityRule,
+)
+from insurance_app.recurrence import materialize, plan, weekday_mask
+from insurance_app.slots import SLOT_TIMES, slot_mask
+
+MONDAY = date(2030, 4, 1)
+
+
+class PlanTest(TestCase):
+    def setUp(self):
+        AvailabilityRule.objects.create(
+            name="Weekdays",
+            weekdays=weekday_mask(range(5)),
+            time_slots=SLOT_TIMES,
+            starts_on=MONDAY,
+        )
+        AvailabilityRule.objects.create(
+            name="Saturday mornings in April",
+            weekdays=weekday_mask([5]),
+            time_slots=["09:00", "10:00"],
+            starts_on=MONDAY,
+            ends_on=date(2030, 4, 30),
+        )
+        AvailabilityRule.objects.create(
+            name="Retired",
+            weekdays=weekday_mask(range(7)),
+            time_slots=SLOT_TIMES,
+            starts_on=MONDAY,
+            active=False,
+        )
+        AvailabilityException.objects.create(date=date(2030, 4, 2), time_slots=[])
+        AvailabilityException.objects.create(
+            date=date(2030, 4, 7), time_slots=["12:00"], note="Open day"
+        )
+
+    def test_rules_weekdays_windows_and_exceptions(self):
+        masks = plan(MONDAY, date(2030, 5, 5))
+        self.assertEqual(len(masks), 35)
+        self.assertEqual(masks[MONDAY], slot_mask(SLOT_TIMES))
+        self.assertEqual(masks[date(2030, 4, 2)], 0)  # closed by exception
+        self.assertEqual(masks[date(2030, 4, 6)], slot_mask(["09:00", "10:00"]))
+        self.assertEqual(masks[date(2030, 4, 7)], slot_mask(["12:00"]))  # Sunday
+        self.assertEqual(masks[date(2030, 4, 14)], 0)
+        self.assertEqual(masks[date(2030, 5, 4)], 0)  # Saturday rule has ended
+
+    def test_materialize_replaces_the_range_in_bulk(self):
+        Availability.objects.create(date=date(2030, 4, 2), time_slots=["09:00"])
+        Availability.objects.create(date=MONDAY, time_slots=["09:00"])
+        Availability.objects.create(date=date(2030, 5, 6), time_slots=["09:00"])
+
+        with self.assertNumQueries(6):  # rules, exceptions, upsert, delete + savepoint
+            opened, closed = materialize(MONDAY, date(2030, 4, 30))
+        self.assertEqual((opened, closed), (26, 1))
+        self.assertEqual(Availability.objects.get(date=MONDAY).time_slots, SLOT_TIMES)
+        self.assertFalse(Availability.objects.filter(date=date(2030, 4, 2)).exists())
+        self.assertEqual(  # outside the range, untouched
+            Availability.objects.get(date=date(2030, 5, 6)).time_slots, ["09:00"]
+        )
+
+        self.assertEqual(materialize(MONDAY, date(2030, 4, 30)), (26, 0))
+        self.assertEqual(Availability.objects.count(), 27)
+
+    def test_a_year_takes_well_under_a_second(self):
+        began = time.perf_counter()
+        opened, _ = materialize(date(2031, 1, 1), date(2031, 12, 31))
+        self.assertLess(time.perf_counter() - began, 1)
+        self.assertEqual(opened, 261)  # the weekdays of 2031
+
+
+class GenerateAvailabilityTest(TestCase):
+    def setUp(self):
+        self.rule = AvailabilityRule.objects.create(
+            name="Weekdays",
+            weekdays=weekday_mask(range(5)),
+            time_slots=["09:00"],
+            starts_on=MONDAY,
+            ends_on=MONDAY + timedelta(days=13),
+        )
+
+    def test_command(self):
+        out = StringIO()
+        call_command(
+            "generate_availability", "--start", "2030-04-01", "--days", "7", stdout=out
+        )
+        self.assertIn("2030-04-01 to 2030-04-07: 5 open days", out.getvalue())
+        self.assertEqual(Availability.objects.count(), 5)
+
+    def test_admin_action_covers_the_selected_rules_span(self):
+        admin = get_user_model().objects.create_superuser(username="admin")
+        self.client.force_login(admin)
+        response = self.client.post(
+            reverse("admin:insurance_app_availabilityrule_changelist"),
+            {"action": "generate_availability", "_selected_action": [self.rule.pk]},
+            follow=True,
+        )
+        self.assertContains(response, "10 open days")
+        self.assertEqual(
+            Availability.objects.latest("date").date, MONDAY + timedelta(days=11)
+        )
+
+    def test_admin_form_shows_weekdays_as_checkboxes(self):
+        form = AvailabilityRuleAdminForm(instance=self.rule)
+        self.assertEqual(form.initial["weekdays"], [0, 1, 2, 3, 4])
+        form = AvailabilityRuleAdminForm(
+            data={
+                "name": "Weekends",
+                "weekdays": ["5", "6"],
+                "time_slots": ["10:00"],
+                "starts_on": "2030-04-01",
+                "active": "on",
+            }
+        )
+        self.assertTrue(form.is_valid(), form.errors)
+        self.assertEqual(form.save().weekdays, 0b1100000)
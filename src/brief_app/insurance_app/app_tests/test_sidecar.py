@@ -0,0 +1,74 @@
+import os
+import shutil
+import tempfile
+import threading
+
+from django.test import SimpleTestCase, override_settings
+
+from insurance_app import sidecar
+from insurance_app.model_registry import PROFILE_MODEL, QUOTE_MODEL
+from insurance_app.prediction_cache import prediction_cache
+from insurance_app.quotes import parse_quote, predict_quote
+from insurance_app.sidecar import SidecarServer, decode_row, encode_row, sidecar_predict
+from insurance_app.app_tests.test_quotes import APPLICANT
+
+PROFILE = {
+    "age": 30,
+    "bmi": 22.0,
+    "smoker": "No",
+    "children": 1,
+    "region": "Northeast",
+    "sex": "Male",
+}
+
+
+class WireFormatTest(SimpleTestCase):
+    def test_round_trip(self):
+        quote = parse_quote({**APPLICANT, "bmi_category": "Obésité sévère"})
+        self.assertEqual(decode_row(QUOTE_MODEL, encode_row(QUOTE_MODEL, quote)), quote)
+        self.assertEqual(
+            decode_row(PROFILE_MODEL, encode_row(PROFILE_MODEL, PROFILE)), PROFILE
+        )
+
+
+@override_settings(USE_COMPILED_MODELS=False)
+class SidecarTest(SimpleTestCase):
+    def setUp(self):
+        """Serves the sidecar from a thread on a temporary socket."""
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, "predict.sock")
+        self.server = SidecarServer(self.path)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        sidecar._down_until = 0.0
+        prediction_cache.clear()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.tmp_dir)
+        sidecar._down_until = 0.0
+
+    def test_matches_in_process_prediction(self):
+        quote = parse_quote(APPLICANT)
+        with override_settings(PREDICTION_SIDECAR_SOCKET=self.path):
+            self.assertEqual(sidecar_predict(QUOTE_MODEL, quote), 7193.9)
+            self.assertIsInstance(sidecar_predict(PROFILE_MODEL, PROFILE), float)
+        self.assertEqual(predict_quote(quote), 7193.9)
+
+    def test_model_errors_are_raised(self):
+        quote = parse_quote({**APPLICANT, "region": "atlantis"})
+        with override_settings(PREDICTION_SIDECAR_SOCKET=self.path):
+            with self.assertRaisesMessage(ValueError, "atlantis"):
+                sidecar_predict(QUOTE_MODEL, quote)
+
+    def test_falls_back_when_sidecar_is_down(self):
+        missing = os.path.join(self.tmp_dir, "missing.sock")
+        quote = parse_quote(APPLICANT)
+        with override_settings(PREDICTION_SIDECAR_SOCKET=missing):
+            with self.assertLogs("insurance_app.sidecar", "WARNING"):
+                self.assertIsNone(sidecar_predict(QUOTE_MODEL, quote))
+            self.assertEqual(predict_quote(quote), 7193.9)
+
+    def test_disabled_without_socket(self):
+        with override_settings(PREDICTION_SIDECAR_SOCKET=""):
+            self.assertIsNone(sidecar_predict(QUOTE_MODEL, parse_quote(APPLICANT)))
@@ -0,0 +1,68 @@
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test import TestCase
+
+from insurance_app.models import Appointment, Availability
+from insurance_app.slots import SLOT_TIMES, FULL_MASK, SlotField, slot_mask
+
+
+class SlotStorageTest(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username="client")
+
+    def raw(self, sql, *params):
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return cursor.fetchone()
+
+    def test_columns_hold_integers_and_python_sees_times(self):
+        availability = Availability.objects.create(
+            date=date(2030, 4, 1), time_slots=["18:00", "09:00"]
+        )
+        appointment = Appointment.objects.create(
+            user=self.user, reason="Consultation", date=date(2030, 4, 1), time="10:00"
+        )
+        self.assertEqual(
+            self.raw(
+                "SELECT time_slots FROM insurance_app_availability WHERE id = %s",
+                availability.pk,
+            ),
+            (slot_mask(["09:00", "18:00"]),),
+        )
+        self.assertEqual(
+            self.raw(
+                "SELECT time FROM insurance_app_appointment WHERE id = %s",
+                appointment.pk,
+            ),
+            (1,),
+        )
+        availability.refresh_from_db()
+        appointment.refresh_from_db()
+        self.assertEqual(availability.time_slots, ["09:00", "18:00"])
+        self.assertEqual(appointment.time, "10:00")
+
+    def test_lookups_and_ordering_use_the_grid(self):
+        for time in ("18:00", "09:00", "12:00"):
+            Appointment.objects.create(
+                user=self.user, reason="Consultation", date=date(2030, 4, 1), time=time
+            )
+        self.assertEqual(
+            list(Appointment.objects.order_by("time").values_list("time", flat=True)),
+            ["09:00", "12:00", "18:00"],
+        )
+        self.assertEqual(Appointment.objects.filter(time__in=["12:00"]).count(), 1)
+        with self.assertRaises(ValueError):
+            Appointment.objects.filter(time="12:30").exists()
+
+    def test_off_grid_values_are_rejected(self):
+        field = SlotField()
+        self.assertEqual(field.to_python(3), SLOT_TIMES[3])
+        with self.assertRaises(ValidationError):
+            field.clean("08:00", None)
+        availability = Availability(date=date(2030, 4, 1), time_slots=["07:00"])
+        with self.assertRaises(ValidationError):
+            availability.full_clean()
+        self.assertEqual(slot_mask(SLOT_TIMES), FULL_MASK)
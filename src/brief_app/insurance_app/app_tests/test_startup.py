@@ -0,0 +1,69 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from io import StringIO
+from unittest.mock import patch
+
+from django.conf import settings
+from django.core.management import call_command
+from django.test import SimpleTestCase
+
+from brief_app.startup import profile_startup, write_report
+from insurance_app.management.commands.benchmark_startup import TARGETS, Command
+
+
+class StartupProfileTest(SimpleTestCase):
+    def test_reports_every_boot_phase(self):
+        report = profile_startup()
+        self.assertEqual(
+            list(report["phases"]), ["settings", "apps", "urlconf", "templates"]
+        )
+        self.assertGreaterEqual(report["total_ms"], 0)
+
+    def test_appends_json_lines(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "startup.jsonl")
+            write_report({"total_ms": 1}, path)
+            write_report({"total_ms": 2}, path)
+            with open(path) as file:
+                self.assertEqual(
+                    [json.loads(line) for line in file],
+                    [
+                        {"total_ms": 1},
+                        {"total_ms": 2},
+                    ],
+                )
+
+    def test_manage_py_profiles_when_enabled(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "startup.jsonl")
+            subprocess.run(
+                [sys.executable, "manage.py", "check"],
+                cwd=settings.BASE_DIR,
+                env={**os.environ, "STARTUP_PROFILE": path},
+                capture_output=True,
+                check=True,
+            )
+            with open(path) as file:
+                report = json.loads(file.readline())
+        self.assertEqual(report["argv"], ["manage.py", "check"])
+        self.assertIn("urlconf", report["phases"])
+
+    def test_benchmark_skips_bootstrap_unless_asked(self):
+        report = {"phases": {}, "total_ms": 1, "wall_ms": 2, "max_rss_kb": 3}
+        with patch.object(Command, "_run", return_value=report) as run:
+            call_command("benchmark_startup", "--runs", "1", stdout=StringIO())
+            self.assertNotIn(
+                TARGETS["bootstrap"], [c.args[0] for c in run.call_args_list]
+            )
+            call_command(
+                "benchmark_startup",
+                "--runs",
+                "1",
+                "--targets",
+                "bootstrap",
+                stdout=StringIO(),
+            )
+            run.assert_called_with(TARGETS["bootstrap"])
@@ -0,0 +1,66 @@
+import tempfile
+from io import StringIO
+
+from django.apps import apps
+from django.contrib.staticfiles import finders
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+
+class PrunedStaticFilesTest(TestCase):
+    def test_sources_and_typings_are_not_collected(self):
+        ignore_patterns = apps.get_app_config("staticfiles").ignore_patterns
+        collected = {
+            path
+            for finder in finders.get_finders()
+            for path, _ in finder.list(ignore_patterns)
+        }
+        self.assertIn("flatpickr/dist/flatpickr.min.js", collected)
+        for path in (
+            "flatpickr/src/index.ts",
+            "flatpickr/dist/typings.d.ts",
+            "flatpickr/dist/esm/index.js",
+            "flatpickr/README.md",
+            "images/web-screenshot-1.png",
+        ):
+            self.assertNotIn(path, collected)
+
+
+class StaticBuildStorageTest(TestCase):
+    def test_names_missing_from_the_manifest_stay_unhashed(self):
+        with tempfile.TemporaryDirectory() as static_root:
+            with override_settings(STATIC_ROOT=static_root):
+                self.assertEqual(
+                    staticfiles_storage.url("images/missing.svg"),
+                    "/static/images/missing.svg",
+                )
+
+
+class StaticBuildServingTest(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.static_root = tempfile.TemporaryDirectory()
+        cls.settings_override = override_settings(STATIC_ROOT=cls.static_root.name)
+        cls.settings_override.enable()
+        call_command("build_static", stdout=StringIO())
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.settings_override.disable()
+        cls.static_root.cleanup()
+        super().tearDownClass()
+
+    def test_serves_hashed_brotli_variant_with_far_future_caching(self):
+        url = staticfiles_storage.url("flatpickr/dist/flatpickr.min.css")
+        self.assertRegex(url, r"flatpickr\.min\.[0-9a-f]{12}\.css$")
+
+        response = self.client.get(url, HTTP_ACCEPT_ENCODING="gzip, br")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Encoding"], "br")
+        self.assertIn("immutable", response["Cache-Control"])
+        self.assertIn("max-age=315360000", response["Cache-Control"])
+
+    def test_only_hashed_copies_are_kept(self):
+        self.assertFalse(staticfiles_storage.exists("flatpickr/dist/flatpickr.min.css"))
@@ -20,9 +20,12 @@ from insurance_app.views import (
     message_list_view,
     solve_message,
     predict_charges,
+    predict_charges_batch,
+    predict_charges_async,
     ChangePasswordView,
     get_available_times,
     TestingView,
+    model_status,
 )
 from django.contrib.auth import views as auth_views
 from django.views.generic.base import TemplateView
@@ -110,6 +113,14 @@ class TestUrls(SimpleTestCase):
         url = reverse("predict_charges")
         self.assertEqual(resolve(url).func, predict_charges)
 
+    def test_predict_charges_batch_url_resolves(self):
+        url = reverse("predict_charges_batch")
+        self.assertEqual(resolve(url).func, predict_charges_batch)
+
+    def test_predict_charges_async_url_resolves(self):
+        url = reverse("predict_charges_async")
+        self.assertEqual(resolve(url).func, predict_charges_async)
+
     def test_password_reset_url_resolves(self):
         url = reverse("password_reset")
         self.assertEqual(resolve(url).func.view_class, auth_views.PasswordResetView)
@@ -141,3 +152,7 @@ class TestUrls(SimpleTestCase):
     def test_testing_url_resolves(self):
         url = reverse("testing")
         self.assertEqual(resolve(url).func.view_class, TestingView)
+
+    def test_model_status_url_resolves(self):
+        url = reverse("model_status")
+        self.assertEqual(resolve(url).func, model_status)
@@ -0,0 +1,38 @@
+import time
+
+from django.test import SimpleTestCase, override_settings
+
+from insurance_app.model_registry import PROFILE_MODEL, QUOTE_MODEL, registry
+from insurance_app.warmup import warm_up_models
+
+
+class WarmUpModelsTest(SimpleTestCase):
+    @override_settings(USE_COMPILED_MODELS=False)
+    def test_report_contains_every_step(self):
+        report = warm_up_models(started_at=time.perf_counter())
+        for key in (
+            "import_pandas_ms",
+            "import_sklearn_ms",
+            "load_models_ms",
+            "first_quote_predict_ms",
+            "first_profile_predict_ms",
+            "warm_up_ms",
+            "time_to_first_prediction_ms",
+            "max_rss_kb",
+        ):
+            self.assertIn(key, report)
+        self.assertGreaterEqual(
+            report["time_to_first_prediction_ms"], report["first_quote_predict_ms"]
+        )
+
+    def test_models_stay_loaded_after_warm_up(self):
+        warm_up_models()
+        loads = registry.load_count
+        registry.get(QUOTE_MODEL)
+        registry.get(PROFILE_MODEL)
+        self.assertEqual(registry.load_count, loads)
+
+    @override_settings(USE_COMPILED_MODELS=True)
+    def test_compiled_backend_skips_sklearn_import(self):
+        report = warm_up_models()
+        self.assertNotIn("import_sklearn_ms", report)
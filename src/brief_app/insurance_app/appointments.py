@@ -0,0 +1,102 @@
+"""A user's upcoming appointments and appointment history.
+
+The booking page shows the next ``UPCOMING_LIMIT`` appointments and the most
+recent ``HISTORY_PER_PAGE`` past ones. ``appointment_overview`` fetches both
+in one query: two ``LIMIT``-ed subqueries, each a range scan of the
+``(user, date, time)`` index in opposite directions from today, picked by
+primary key. Older history is paged with ``CursorPaginator`` on the same
+index, starting from the cursor of that first page.
+"""
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Dict, List
+
+from django.db.models import Q
+from django.utils.formats import date_format
+
+from .models import Appointment
+from .pagination import CursorPage, CursorPaginator
+
+UPCOMING_LIMIT = 10
+HISTORY_PER_PAGE = 10
+# (date, time) is unique, so the pair alone is a keyset ordering
+UPCOMING_ORDERING = ("date", "time")
+HISTORY_ORDERING = ("-date", "-time")
+
+
+@dataclass
+class AppointmentOverview:
+    """
+    What the booking page lists.
+
+    Attributes:
+        upcoming (List[Appointment]): The next appointments, soonest first.
+        more_upcoming (bool): Whether there are upcoming appointments beyond
+            ``upcoming``.
+        history (CursorPage): The most recent past appointments, latest first.
+    """
+
+    upcoming: List[Appointment]
+    more_upcoming: bool
+    history: CursorPage
+
+
+def history_paginator(user: Any, today: date) -> CursorPaginator:
+    """Pages a user's appointments before ``today``, latest first."""
+    return CursorPaginator(
+        Appointment.objects.filter(user=user, date__lt=today),
+        HISTORY_ORDERING,
+        HISTORY_PER_PAGE,
+    )
+
+
+def appointment_overview(user: Any, today: date) -> AppointmentOverview:
+    """
+    Fetches a user's next appointments and first history page in one query.
+
+    Args:
+        user (Any): The user whose appointments to list.
+        today (date): The first day that counts as upcoming.
+
+    Returns:
+        AppointmentOverview: The bounded upcoming list and the history page.
+    """
+    paginator = history_paginator(user, today)
+    upcoming = Appointment.objects.filter(user=user, date__gte=today).order_by(
+        *UPCOMING_ORDERING
+    )[: UPCOMING_LIMIT + 1]
+    past = paginator.queryset.order_by(*HISTORY_ORDERING)[: HISTORY_PER_PAGE + 1]
+    rows = list(
+        Appointment.objects.filter(
+            Q(pk__in=upcoming.values("pk")) | Q(pk__in=past.values("pk"))
+        ).order_by(*UPCOMING_ORDERING)
+    )
+
+    upcoming_rows = [row for row in rows if row.date >= today]
+    past_rows = [row for row in reversed(rows) if row.date < today]
+    history = past_rows[:HISTORY_PER_PAGE]
+    return AppointmentOverview(
+        upcoming=upcoming_rows[:UPCOMING_LIMIT],
+        more_upcoming=len(upcoming_rows) > UPCOMING_LIMIT,
+        history=CursorPage(
+            history,
+            (
+                paginator.encode(history[-1], False)
+                if len(past_rows) > HISTORY_PER_PAGE
+                else None
+            ),
+            None,
+        ),
+    )
+
+
+def appointment_json(appointment: Appointment) -> Dict[str, str]:
+    """The fields of an appointment the booking page displays."""
+    return {
+        "reason": appointment.reason,
+        "date": appointment.date.isoformat(),
+        # As the template renders {{ appointment.date }}
+        "date_label": date_format(appointment.date),
+        "time": appointment.time,
+    }
@@ -1,6 +1,36 @@
 from django.apps import AppConfig
+from django.contrib.staticfiles import apps as staticfiles_apps
 
 
 class InsuranceAppConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "insurance_app"
+
+    def ready(self) -> None:
+        # Connects the receivers invalidating the cached job listing
+        from . import jobs  # noqa: F401
+
+
+class StaticFilesConfig(staticfiles_apps.StaticFilesConfig):
+    """
+    ``django.contrib.staticfiles`` without the files no page ever requests.
+
+    ``collectstatic`` and the finders skip these, so they are neither
+    hashed, compressed nor copied into the image: the vendored flatpickr
+    sources, ES module build and TypeScript typings, Stylus sources, the
+    package metadata, and the README screenshots.
+    """
+
+    # Installed explicitly as "insurance_app.apps.StaticFilesConfig"; without
+    # this, "insurance_app" would no longer pick InsuranceAppConfig by default
+    default = False
+
+    ignore_patterns = staticfiles_apps.StaticFilesConfig.ignore_patterns + [
+        "flatpickr/src/*",
+        "flatpickr/dist/esm/*",
+        "flatpickr/package.json",
+        "*.ts",
+        "*.styl",
+        "*.md",
+        "images/*-screenshot*",
+    ]
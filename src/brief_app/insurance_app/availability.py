@@ -0,0 +1,146 @@
+"""Free appointment slots and capacity over a date range.
+
+``Availability.time_slots`` is stored as a bitmask over the slot grid and
+``Appointment.time`` as a slot index (see ``insurance_app.slots``), so the
+free slots of a day are ``offered & ~booked`` and can be computed in SQL:
+the booked mask of a day is ``SUM(1 << slot)`` over its appointments, which
+equals their bitwise OR because ``(date, time)`` is unique. Every helper
+below is one query over the ``date`` index of ``Availability`` with a
+correlated subquery on the ``(date, time)`` index of ``Appointment``.
+"""
+
+import calendar
+from datetime import date, timedelta
+from typing import Dict, List, Tuple
+
+from django.db.models import (
+    Count,
+    ExpressionWrapper,
+    F,
+    IntegerField,
+    OuterRef,
+    QuerySet,
+    Subquery,
+    Sum,
+    Value,
+)
+from django.db.models.expressions import Combinable
+from django.db.models.functions import Coalesce
+
+from .models import Appointment, Availability
+from .slots import SLOT_TIMES
+
+MAX_RANGE_DAYS = 92
+
+
+def month_range(year: int, month: int) -> Tuple[date, date]:
+    """Returns the first and last day of a month."""
+    return date(year, month, 1), date(year, month, calendar.monthrange(year, month)[1])
+
+
+def quarter_range(year: int, quarter: int) -> Tuple[date, date]:
+    """Returns the first and last day of a quarter (1 to 4)."""
+    return month_range(year, 3 * quarter - 2)[0], month_range(year, 3 * quarter)[1]
+
+
+def _integer(expression: Combinable) -> ExpressionWrapper:
+    return ExpressionWrapper(expression, output_field=IntegerField())
+
+
+def booked_mask() -> Coalesce:
+    """The bitmask of booked slots on the outer query's ``date``."""
+    booked = (
+        Appointment.objects.filter(date=OuterRef("date"))
+        .order_by()
+        .values("date")
+        .annotate(mask=Sum(Value(1).bitleftshift(F("time"))))
+        .values("mask")
+    )
+    return Coalesce(Subquery(booked, output_field=IntegerField()), 0)
+
+
+def booked_count() -> Coalesce:
+    """The number of offered slots booked on the outer query's ``date``."""
+    booked = (
+        Appointment.objects.filter(date=OuterRef("date"))
+        .alias(
+            offered=_integer(OuterRef("time_slots").bitrightshift(F("time")).bitand(1))
+        )
+        .filter(offered=1)
+        .order_by()
+        .values("date")
+        .annotate(count=Count("id"))
+        .values("count")
+    )
+    return Coalesce(Subquery(booked, output_field=IntegerField()), 0)
+
+
+def popcount(mask: Combinable) -> ExpressionWrapper:
+    """The number of slots set in a bitmask expression."""
+    bits = [mask.bitrightshift(i).bitand(1) for i in range(len(SLOT_TIMES))]
+    return _integer(sum(bits[1:], bits[0]))
+
+
+def with_free_mask(start: date, end: date) -> QuerySet:
+    """
+    Availability rows of a date range, annotated with their free slots.
+
+    Returns:
+        QuerySet: ``Availability`` rows with an integer ``free`` annotation,
+            the bitmask ``offered & ~booked``.
+    """
+    offered = _integer(F("time_slots"))
+    return Availability.objects.filter(date__range=(start, end)).annotate(
+        free=_integer(offered - offered.bitand(booked_mask()))
+    )
+
+
+def free_slots(start: date, end: date) -> Dict[date, int]:
+    """
+    Computes the free slots of every configured day in a date range.
+
+    Args:
+        start (date): First day, inclusive.
+        end (date): Last day, inclusive.
+
+    Returns:
+        Dict[date, int]: The free-slot bitmask of each day that has an
+            ``Availability`` row; 0 when every configured slot is booked.
+    """
+    return dict(with_free_mask(start, end).values_list("date", "free"))
+
+
+def range_masks(start: date, end: date) -> List[int]:
+    """Returns one free-slot bitmask per day from ``start`` to ``end``."""
+    free = free_slots(start, end)
+    return [
+        free.get(start + timedelta(days=i), 0) for i in range((end - start).days + 1)
+    ]
+
+
+def free_capacity(start: date, end: date) -> Dict[str, int]:
+    """
+    Counts offered, booked and free slots over a date range in one query.
+
+    Only bookings of offered slots count as booked, so ``free`` is always
+    ``offered - booked``.
+
+    Args:
+        start (date): First day, inclusive.
+        end (date): Last day, inclusive.
+
+    Returns:
+        Dict[str, int]: ``offered``, ``booked`` and ``free`` slot counts.
+    """
+    totals = (
+        Availability.objects.filter(date__range=(start, end))
+        .annotate(
+            offered_slots=popcount(_integer(F("time_slots"))),
+            booked_slots=booked_count(),
+        )
+        .aggregate(
+            offered=Coalesce(Sum("offered_slots"), 0),
+            booked=Coalesce(Sum("booked_slots"), 0),
+        )
+    )
+    return {**totals, "free": totals["offered"] - totals["booked"]}
@@ -0,0 +1,226 @@
+"""Micro-batching of single predictions into one ``model.predict`` call.
+
+A one-row ``predict`` on a Pipeline is dominated by fixed per-call overhead, so
+ten concurrent quotes cost nearly ten times what one ten-row call does. With
+``settings.PREDICTION_BATCHING`` on, ``predict_one`` hands the row to a
+per-model ``MicroBatcher``: a dispatcher thread collects the rows that arrive
+within ``PREDICTION_BATCH_WAIT_MS`` of the first one, or up to
+``PREDICTION_BATCH_MAX_SIZE`` rows, scores them in one call and returns each
+caller its own result.
+
+Batching only pays off when requests overlap in one process: threaded Gunicorn
+workers, the async quote endpoint's executor, or a burst on the dev server.
+"""
+
+from __future__ import annotations
+
+import bisect
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from django.conf import settings
+
+from .model_registry import get_predictor
+
+DEFAULT_WAIT_MS = 2.0
+DEFAULT_MAX_BATCH = 64
+
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+QUEUE_WAIT_MS_BUCKETS = (0.5, 1, 2, 5, 10, 20, 50, 100, 250)
+
+# Scores a list of input rows with a model, one result per row
+Scorer = Callable[[Any, List[Dict[str, Any]]], Sequence[Any]]
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram; each observation counts in the first bucket it fits.
+
+    Attributes:
+        buckets (Tuple[float, ...]): Inclusive upper bounds, an overflow bucket follows.
+    """
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self.buckets = tuple(buckets)
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._count = 0
+        self._sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self._counts[bisect.bisect_left(self.buckets, value)] += 1
+        self._count += 1
+        self._sum += value
+
+    def stats(self) -> Dict[str, Any]:
+        labels = [str(bound) for bound in self.buckets] + ["+Inf"]
+        return {
+            "count": self._count,
+            "sum": round(self._sum, 3),
+            "mean": round(self._sum / self._count, 3) if self._count else None,
+            "buckets": dict(zip(labels, self._counts)),
+        }
+
+
+class MicroBatcher:
+    """
+    Coalesces concurrent single-row predictions for one artifact.
+
+    Attributes:
+        name (str): Artifact scored through ``get_predictor``.
+        max_wait (float): Seconds a batch stays open after its first row arrives.
+        max_batch (int): Rows that close a batch immediately.
+
+    Methods:
+        submit(row):
+            Blocks until the row has been scored in some batch and returns its result.
+        stats():
+            Returns the batch-size and queue-wait histograms.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        score: Scorer,
+        max_wait_ms: float = DEFAULT_WAIT_MS,
+        max_batch: int = DEFAULT_MAX_BATCH,
+    ) -> None:
+        self.name = name
+        self.max_wait = max_wait_ms / 1000
+        self.max_batch = max_batch
+        self._score = score
+        self._lock = threading.Lock()
+        self._queue: "queue.Queue[Tuple[float, Dict[str, Any], Future]]"
+        self._pid: Optional[int] = None
+        self.batch_sizes = Histogram(BATCH_SIZE_BUCKETS)
+        self.queue_wait_ms = Histogram(QUEUE_WAIT_MS_BUCKETS)
+
+    def submit(self, row: Dict[str, Any]) -> Any:
+        future: Future = Future()
+        self._ensure_dispatcher().put((time.perf_counter(), row, future))
+        return future.result()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "max_wait_ms": self.max_wait * 1000,
+                "max_batch": self.max_batch,
+                "batch_size": self.batch_sizes.stats(),
+                "queue_wait_ms": self.queue_wait_ms.stats(),
+            }
+
+    def _ensure_dispatcher(self) -> "queue.Queue":
+        # Threads do not survive fork: start one per worker process
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    self._queue = queue.Queue()
+                    threading.Thread(
+                        target=self._run,
+                        args=(self._queue,),
+                        name=f"batcher-{os.path.basename(self.name)}",
+                        daemon=True,
+                    ).start()
+                    self._pid = os.getpid()
+        return self._queue
+
+    def _run(self, pending: "queue.Queue") -> None:
+        while True:
+            batch = [pending.get()]
+            deadline = batch[0][0] + self.max_wait
+            while len(batch) < self.max_batch:
+                timeout = deadline - time.perf_counter()
+                try:
+                    batch.append(
+                        pending.get(timeout=timeout)
+                        if timeout > 0
+                        else pending.get_nowait()
+                    )
+                except queue.Empty:
+                    break
+            self._dispatch(batch)
+
+    def _dispatch(self, batch: List[Tuple[float, Dict[str, Any], Future]]) -> None:
+        started = time.perf_counter()
+        with self._lock:
+            self.batch_sizes.observe(len(batch))
+            for enqueued_at, _, _ in batch:
+                self.queue_wait_ms.observe((started - enqueued_at) * 1000)
+
+        try:
+            model = get_predictor(self.name)
+        except Exception as e:
+            for _, _, future in batch:
+                future.set_exception(e)
+            return
+
+        try:
+            results = self._score(model, [row for _, row, _ in batch])
+        except Exception as e:
+            if len(batch) == 1:
+                batch[0][2].set_exception(e)
+                return
+            # One bad row must not fail its neighbours: score them one by one
+            for _, row, future in batch:
+                try:
+                    future.set_result(self._score(model, [row])[0])
+                except Exception as row_error:
+                    future.set_exception(row_error)
+            return
+
+        for (_, _, future), result in zip(batch, results):
+            future.set_result(result)
+
+
+_batchers: Dict[str, MicroBatcher] = {}
+_batchers_lock = threading.Lock()
+
+
+def get_batcher(name: str, score: Scorer) -> MicroBatcher:
+    """Returns the process-wide batcher for an artifact, creating it on first use."""
+    batcher = _batchers.get(name)
+    if batcher is None:
+        with _batchers_lock:
+            batcher = _batchers.get(name)
+            if batcher is None:
+                batcher = _batchers[name] = MicroBatcher(
+                    name,
+                    score,
+                    max_wait_ms=float(
+                        getattr(settings, "PREDICTION_BATCH_WAIT_MS", DEFAULT_WAIT_MS)
+                    ),
+                    max_batch=int(
+                        getattr(
+                            settings, "PREDICTION_BATCH_MAX_SIZE", DEFAULT_MAX_BATCH
+                        )
+                    ),
+                )
+    return batcher
+
+
+def predict_one(name: str, model: Any, row: Dict[str, Any], score: Scorer) -> Any:
+    """
+    Scores a single row, through the artifact's batcher when batching is enabled.
+
+    Args:
+        name (str): Artifact name of the model.
+        model: The model to use when batching is disabled.
+        row (Dict[str, Any]): One input row for ``score``.
+        score (Scorer): Scores a list of rows with a model.
+
+    Returns:
+        The result ``score`` produced for the row.
+    """
+    if getattr(settings, "PREDICTION_BATCHING", False):
+        return get_batcher(name, score).submit(row)
+    return score(model, [row])[0]
+
+
+def batching_stats() -> Dict[str, Any]:
+    """Returns the histograms of every batcher created in this process."""
+    return {
+        os.path.basename(name): batcher.stats() for name, batcher in _batchers.items()
+    }
@@ -0,0 +1,121 @@
+"""Atomic appointment booking.
+
+``reserve`` books a slot inside one transaction. It first locks the day's
+``Availability`` row (``SELECT ... FOR UPDATE``; on SQLite, which has no row
+locks, a no-op ``UPDATE`` that takes the database write lock so concurrent
+bookings queue instead of failing to upgrade a read lock) and checks that the
+slot is offered, then inserts the appointment. The
+``unique_appointment_slot`` constraint on ``(date, time)`` is what makes a
+double booking impossible: of two concurrent inserts for the same slot, one
+fails with ``IntegrityError``, which ``reserve`` turns into
+``SlotUnavailable`` carrying the nearest free slots to offer instead.
+"""
+
+from datetime import date, datetime, timedelta
+from typing import Any, List, Tuple
+
+from django.db import IntegrityError, connection, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .availability import free_slots
+from .models import Appointment, Availability
+from .slots import SLOT_INDEX, mask_times
+
+SUGGESTION_COUNT = 3
+SUGGESTION_DAYS = 14
+
+TAKEN = "taken"
+NOT_OFFERED = "not_offered"
+
+
+class SlotUnavailable(Exception):
+    """
+    Raised when a slot cannot be booked.
+
+    Attributes:
+        date (date): The requested day.
+        time (str): The requested slot time.
+        reason (str): ``TAKEN`` if someone booked it first, ``NOT_OFFERED``
+            if it is not in the day's availability.
+        suggestions (List[Tuple[date, str]]): The nearest free slots.
+    """
+
+    def __init__(
+        self, day: date, time: str, reason: str, suggestions: List[Tuple[date, str]]
+    ) -> None:
+        super().__init__(f"{day} {time} is {reason.replace('_', ' ')}")
+        self.date = day
+        self.time = time
+        self.reason = reason
+        self.suggestions = suggestions
+
+
+def nearest_free_slots(
+    day: date, time: str, count: int = SUGGESTION_COUNT
+) -> List[Tuple[date, str]]:
+    """
+    Returns the free slots closest in time to a requested one.
+
+    Looks ``SUGGESTION_DAYS`` days either side of ``day``, never before today,
+    with the single query of ``free_slots``.
+
+    Args:
+        day (date): The requested day.
+        time (str): The requested slot time, "HH:MM".
+        count (int): How many slots to return at most.
+
+    Returns:
+        List[Tuple[date, str]]: ``(date, time)`` pairs, nearest first.
+    """
+    today = timezone.localdate()
+    start = max(today, day - timedelta(days=SUGGESTION_DAYS))
+    end = max(today, day) + timedelta(days=SUGGESTION_DAYS)
+    target = datetime.combine(day, datetime.strptime(time, "%H:%M").time())
+
+    candidates = [
+        (free_day, free_time)
+        for free_day, mask in free_slots(start, end).items()
+        for free_time in mask_times(mask)
+    ]
+
+    def distance(slot: Tuple[date, str]) -> Any:
+        moment = datetime.combine(slot[0], datetime.strptime(slot[1], "%H:%M").time())
+        return abs(moment - target), moment
+
+    return sorted(candidates, key=distance)[:count]
+
+
+def reserve(user: Any, reason: str, day: date, time: str) -> Appointment:
+    """
+    Books a slot for a user, or fails without side effects.
+
+    Args:
+        user (Any): The user booking.
+        reason (str): One of ``Appointment.REASON_CHOICES``.
+        day (date): The day of the appointment.
+        time (str): The slot time, "HH:MM".
+
+    Returns:
+        Appointment: The new appointment.
+
+    Raises:
+        SlotUnavailable: If the slot is not offered or already booked.
+    """
+    try:
+        with transaction.atomic():
+            availability = Availability.objects.filter(date=day)
+            if connection.features.has_select_for_update:
+                availability = availability.select_for_update()
+            else:
+                availability.update(date=F("date"))
+            offered = availability.values_list("time_slots", flat=True).first()
+            if time not in SLOT_INDEX or time not in (offered or []):
+                failure = NOT_OFFERED
+            else:
+                return Appointment.objects.create(
+                    user=user, reason=reason, date=day, time=time
+                )
+    except IntegrityError:
+        failure = TAKEN
+    raise SlotUnavailable(day, time, failure, nearest_free_slots(day, time))
@@ -0,0 +1,313 @@
+"""Compiled, sklearn-free form of the linear prediction pipelines.
+
+Both artifacts are Pipelines of a ColumnTransformer (StandardScaler, ordinal and
+one-hot encoders), PolynomialFeatures and a coordinate-descent linear model. At
+prediction time that is scaling, category lookups, a polynomial expansion and
+a dot product. ``compile_pipeline`` flattens a fitted pipeline into plain NumPy
+arrays, ``CompiledModel.save`` writes them to ``<artifact>.npz`` next to the
+pickle, and ``CompiledModel.predict`` evaluates them with NumPy only.
+
+Run ``manage.py export_compiled_models`` after replacing an artifact; the
+export records the pickle's content hash and is refused once it is stale.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Set
+
+import numpy as np
+
+from .model_registry import ModelRegistry, hash_file
+
+COMPILED_SUFFIX = ".npz"
+
+
+class StaleCompiledModel(Exception):
+    """Raised when an export does not match the pickled artifact it came from."""
+
+
+@dataclass
+class InputBlock:
+    """
+    One ColumnTransformer branch, producing consecutive feature columns.
+
+    Attributes:
+        kind (str): ``"scale"``, ``"ordinal"`` or ``"onehot"``.
+        columns (List[str]): Input column names read by the branch.
+        mean (np.ndarray): Scaler means, ``"scale"`` only.
+        scale (np.ndarray): Scaler standard deviations, ``"scale"`` only.
+        categories (List[List[str]]): Known categories per column, encoders only.
+    """
+
+    kind: str
+    columns: List[str]
+    mean: np.ndarray
+    scale: np.ndarray
+    categories: List[List[str]]
+
+    def __post_init__(self) -> None:
+        self.lookups: List[Dict[str, int]] = [
+            {value: code for code, value in enumerate(values)}
+            for values in self.categories
+        ]
+
+    @property
+    def width(self) -> int:
+        if self.kind == "onehot":
+            return sum(len(values) for values in self.categories)
+        return len(self.columns)
+
+
+def _codes(values: Any, lookup: Dict[str, int], column: str) -> np.ndarray:
+    values = values.tolist() if hasattr(values, "tolist") else list(values)
+    try:
+        return np.fromiter(map(lookup.__getitem__, values), np.intp, len(values))
+    except (KeyError, TypeError) as e:
+        unknown = e.args[0] if isinstance(e, KeyError) else "unhashable value"
+        raise ValueError(
+            f"Found unknown categories [{unknown!r}] in column {column!r}"
+        ) from None
+
+
+class CompiledModel:
+    """
+    NumPy evaluation of a scaler/encoder + PolynomialFeatures + linear pipeline.
+
+    ``predict`` accepts anything indexable by column name (a DataFrame or a dict of
+    sequences), so it is a drop-in replacement for ``Pipeline.predict`` in the views.
+
+    Attributes:
+        blocks (List[InputBlock]): ColumnTransformer branches in output order.
+        powers (np.ndarray): Exponent matrix of the polynomial terms with a non-zero
+            coefficient, shape (n_terms, n_inputs).
+        coef (np.ndarray): Coefficients of those terms.
+        intercept (float): Model intercept.
+        source_sha256 (str): Content hash of the pickle the model was compiled from.
+    """
+
+    def __init__(
+        self,
+        blocks: List[InputBlock],
+        powers: np.ndarray,
+        coef: np.ndarray,
+        intercept: float,
+        source_sha256: str = "",
+    ) -> None:
+        self.blocks = blocks
+        self.powers = powers
+        self.coef = coef
+        self.intercept = intercept
+        self.source_sha256 = source_sha256
+        self.n_inputs = sum(block.width for block in blocks)
+
+        # Degree <= 2 polynomials fold into constant + linear + quadratic form,
+        # which is a couple of matrix products instead of one column per term
+        self.quadratic: Optional[np.ndarray] = None
+        degrees = powers.sum(axis=1)
+        if len(degrees) and degrees.max() <= 2:
+            self.constant = intercept + coef[degrees == 0].sum()
+            self.linear = np.zeros(self.n_inputs)
+            self.quadratic = np.zeros((self.n_inputs, self.n_inputs))
+            for exponents, weight in zip(powers, coef):
+                factors = np.repeat(np.arange(self.n_inputs), exponents)
+                if len(factors) == 1:
+                    self.linear[factors[0]] += weight
+                elif len(factors) == 2:
+                    self.quadratic[factors[0], factors[1]] += weight
+
+    def known_categories(self) -> Dict[str, Set[str]]:
+        return {
+            column: set(values)
+            for block in self.blocks
+            for column, values in zip(block.columns, block.categories)
+        }
+
+    def transform(self, X: Mapping[str, Any]) -> np.ndarray:
+        """Applies the ColumnTransformer branches, returning the dense input matrix."""
+        rows = len(np.asarray(X[self.blocks[0].columns[0]]))
+        out = np.zeros((rows, self.n_inputs), dtype=np.float64)
+        offset = 0
+        for block in self.blocks:
+            if block.kind == "scale":
+                for i, column in enumerate(block.columns):
+                    values = np.asarray(X[column], dtype=np.float64)
+                    out[:, offset + i] = (values - block.mean[i]) / block.scale[i]
+            elif block.kind == "ordinal":
+                for i, column in enumerate(block.columns):
+                    out[:, offset + i] = _codes(X[column], block.lookups[i], column)
+            else:
+                start = offset
+                for i, column in enumerate(block.columns):
+                    codes = _codes(X[column], block.lookups[i], column)
+                    out[np.arange(rows), start + codes] = 1.0
+                    start += len(block.categories[i])
+            offset += block.width
+        return out
+
+    def predict(self, X: Mapping[str, Any]) -> np.ndarray:
+        inputs = self.transform(X)
+        if not np.isfinite(inputs).all():
+            raise ValueError("Input X contains NaN or infinity.")
+        if self.quadratic is not None:
+            return (
+                self.constant
+                + inputs @ self.linear
+                + np.einsum("ij,ij->i", inputs @ self.quadratic, inputs)
+            )
+        terms = np.prod(inputs[:, None, :] ** self.powers[None, :, :], axis=2)
+        return terms @ self.coef + self.intercept
+
+    def save(self, path: str) -> None:
+        spec = [
+            {
+                "kind": block.kind,
+                "columns": block.columns,
+                "categories": block.categories,
+            }
+            for block in self.blocks
+        ]
+        arrays = {
+            f"block{i}_{name}": getattr(block, name)
+            for i, block in enumerate(self.blocks)
+            for name in ("mean", "scale")
+        }
+        # Write through a temporary file so readers never see a partial export
+        tmp_path = f"{path}.tmp{os.getpid()}.npz"
+        np.savez(
+            tmp_path,
+            spec=np.array(json.dumps(spec)),
+            powers=self.powers,
+            coef=self.coef,
+            intercept=np.array(self.intercept),
+            source_sha256=np.array(self.source_sha256),
+            **arrays,
+        )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "CompiledModel":
+        with np.load(path, allow_pickle=False) as data:
+            blocks = [
+                InputBlock(
+                    kind=block["kind"],
+                    columns=block["columns"],
+                    mean=data[f"block{i}_mean"],
+                    scale=data[f"block{i}_scale"],
+                    categories=block["categories"],
+                )
+                for i, block in enumerate(json.loads(str(data["spec"])))
+            ]
+            return cls(
+                blocks=blocks,
+                powers=data["powers"],
+                coef=data["coef"],
+                intercept=float(data["intercept"]),
+                source_sha256=str(data["source_sha256"]),
+            )
+
+
+def compiled_path(source_path: str) -> str:
+    return source_path + COMPILED_SUFFIX
+
+
+def _flatten_steps(model: Any) -> List[Any]:
+    steps: List[Any] = []
+    for _, step in getattr(model, "steps", [("", model)]):
+        if hasattr(step, "steps"):
+            steps.extend(_flatten_steps(step))
+        else:
+            steps.append(step)
+    return steps
+
+
+def _compile_column_transformer(transformer: Any) -> List[InputBlock]:
+    if getattr(transformer, "sparse_output_", False):
+        raise NotImplementedError("Sparse ColumnTransformer output is not supported")
+    blocks = []
+    empty = np.zeros(0)
+    for _, step, columns in transformer.transformers_:
+        if isinstance(step, str):
+            if step == "drop":
+                continue
+            raise NotImplementedError(f"Transformer {step!r} is not supported")
+        if not isinstance(columns, list):
+            raise NotImplementedError(f"Column selector {columns!r} is not supported")
+        kind = type(step).__name__
+        if kind == "StandardScaler":
+            mean = step.mean_ if step.mean_ is not None else np.zeros(len(columns))
+            scale = step.scale_ if step.scale_ is not None else np.ones(len(columns))
+            blocks.append(InputBlock("scale", columns, mean, scale, []))
+        elif kind in ("OrdinalEncoder", "OneHotEncoder"):
+            if step.handle_unknown != "error" or getattr(step, "drop", None):
+                raise NotImplementedError(f"{kind} options are not supported")
+            categories = [
+                [str(value) for value in values] for values in step.categories_
+            ]
+            block_kind = "ordinal" if kind == "OrdinalEncoder" else "onehot"
+            blocks.append(InputBlock(block_kind, columns, empty, empty, categories))
+        else:
+            raise NotImplementedError(f"Transformer {kind} is not supported")
+    return blocks
+
+
+def compile_pipeline(model: Any, source_sha256: str = "") -> CompiledModel:
+    """
+    Flattens a fitted pipeline into a CompiledModel.
+
+    Args:
+        model: A Pipeline made of a ColumnTransformer, an optional
+            PolynomialFeatures and a linear estimator exposing ``coef_``.
+        source_sha256 (str): Content hash of the artifact, stored for staleness checks.
+
+    Returns:
+        CompiledModel: The NumPy-only equivalent of ``model.predict``.
+
+    Raises:
+        NotImplementedError: If the pipeline contains an unsupported step or option.
+    """
+    steps = _flatten_steps(model)
+    transformer, *middle, estimator = steps
+    if not hasattr(transformer, "transformers_"):
+        raise NotImplementedError("The pipeline must start with a ColumnTransformer")
+    blocks = _compile_column_transformer(transformer)
+    n_inputs = sum(block.width for block in blocks)
+
+    powers = np.eye(n_inputs, dtype=np.int64)
+    for step in middle:
+        if type(step).__name__ != "PolynomialFeatures":
+            raise NotImplementedError(f"Step {type(step).__name__} is not supported")
+        powers = step.powers_.astype(np.int64)
+
+    coef = np.ravel(estimator.coef_).astype(np.float64)
+    if coef.shape[0] != powers.shape[0]:
+        raise NotImplementedError("Estimator must produce a single output")
+    intercept = float(np.ravel(estimator.intercept_)[0])
+
+    # Terms with a zero coefficient (common with Lasso) never affect the output
+    keep = coef != 0
+    return CompiledModel(blocks, powers[keep], coef[keep], intercept, source_sha256)
+
+
+def export_compiled(source_path: str, model: Any) -> CompiledModel:
+    """Compiles a loaded artifact and writes it next to the pickle."""
+    compiled = compile_pipeline(model, source_sha256=hash_file(source_path))
+    compiled.save(compiled_path(source_path))
+    return compiled
+
+
+def load_compiled(source_path: str) -> CompiledModel:
+    """Registry loader: reads the export of an artifact and checks it is current."""
+    compiled = CompiledModel.load(compiled_path(source_path))
+    if compiled.source_sha256 != hash_file(source_path):
+        raise StaleCompiledModel(
+            f"{compiled_path(source_path)} was exported from a different version of "
+            f"{os.path.basename(source_path)}, run manage.py export_compiled_models"
+        )
+    return compiled
+
+
+# Keyed by the pickle path: swapping the pickle reloads (and re-checks) the export
+compiled_registry = ModelRegistry(loader=load_compiled)
@@ -0,0 +1,113 @@
+"""Set-based resolution of staff contact messages.
+
+Resolving a message deletes it. ``resolve_messages`` takes either explicit
+IDs or a filter and handles any number of messages with a fixed number of
+queries inside one transaction: a locking ``SELECT`` of the matching IDs,
+for the per-ID report, and a single ``DELETE``. ``ContactMessage`` has no
+relations or delete signals, so Django issues the ``DELETE`` directly
+without loading the rows.
+"""
+
+from typing import Any, Dict, Mapping, Optional, Sequence
+
+from django.db import transaction
+from django.db.models import QuerySet
+from django.utils.dateparse import parse_datetime
+
+from .models import ContactMessage
+
+MAX_IDS = 1000
+RESOLVED = "resolved"
+NOT_FOUND = "not_found"
+
+# Filter name -> lookup; values are strings from the JSON request body
+FILTERS = {
+    "email": "email__iexact",
+    "submitted_before": "submitted_at__lt",
+    "submitted_after": "submitted_at__gte",
+}
+DATETIME_FILTERS = {"submitted_before", "submitted_after"}
+
+
+class InvalidSelection(ValueError):
+    """Raised when the IDs or the filter of a resolve request are unusable."""
+
+
+def select_messages(
+    ids: Optional[Sequence[Any]] = None, filters: Optional[Mapping[str, Any]] = None
+) -> QuerySet:
+    """
+    Builds the queryset of messages named by IDs or by a filter.
+
+    Args:
+        ids (Optional[Sequence[Any]]): Message IDs, at most ``MAX_IDS``.
+        filters (Optional[Mapping[str, Any]]): Non-empty mapping of ``FILTERS``
+            names to values, e.g. ``{"submitted_before": "2025-01-01T00:00"}``.
+
+    Returns:
+        QuerySet: The matching messages.
+
+    Raises:
+        InvalidSelection: If both or neither are given, or a value is invalid.
+    """
+    if (ids is None) == (filters is None):
+        raise InvalidSelection("Provide either 'ids' or 'filter'.")
+
+    if ids is not None:
+        if not isinstance(ids, list) or not ids:
+            raise InvalidSelection("'ids' must be a non-empty list.")
+        if len(ids) > MAX_IDS:
+            raise InvalidSelection(f"At most {MAX_IDS} ids per request.")
+        if not all(isinstance(i, int) and not isinstance(i, bool) for i in ids):
+            raise InvalidSelection("'ids' must be integers.")
+        return ContactMessage.objects.filter(id__in=ids)
+
+    if not isinstance(filters, dict) or not filters:
+        raise InvalidSelection("'filter' must be a non-empty object.")
+    lookups = {}
+    for name, value in filters.items():
+        if name not in FILTERS:
+            raise InvalidSelection(f"Unknown filter '{name}'.")
+        if not isinstance(value, str):
+            raise InvalidSelection(f"Filter '{name}' must be a string.")
+        if name in DATETIME_FILTERS:
+            try:
+                value = parse_datetime(value)
+            except ValueError:
+                value = None
+            if value is None:
+                raise InvalidSelection(f"Filter '{name}' must be an ISO datetime.")
+        lookups[FILTERS[name]] = value
+    return ContactMessage.objects.filter(**lookups)
+
+
+def resolve_messages(
+    ids: Optional[Sequence[Any]] = None, filters: Optional[Mapping[str, Any]] = None
+) -> Dict[int, str]:
+    """
+    Deletes the selected messages in one transaction and reports on each ID.
+
+    Args:
+        ids (Optional[Sequence[Any]]): Message IDs to resolve.
+        filters (Optional[Mapping[str, Any]]): Or a filter, see
+            ``select_messages``.
+
+    Returns:
+        Dict[int, str]: ``RESOLVED`` or ``NOT_FOUND`` for every requested ID,
+            or ``RESOLVED`` for every message the filter matched.
+
+    Raises:
+        InvalidSelection: If the selection is invalid.
+    """
+    messages = select_messages(ids, filters)
+    with transaction.atomic():
+        found = set(messages.select_for_update().values_list("id", flat=True))
+        if found and ids is None:
+            # Messages submitted after the SELECT may match the filter too;
+            # bounding by the highest locked ID leaves them for the next run.
+            messages.filter(id__lte=max(found)).delete()
+        elif found:
+            messages.delete()
+    if ids is None:
+        return {message_id: RESOLVED for message_id in sorted(found)}
+    return {i: RESOLVED if i in found else NOT_FOUND for i in ids}
@@ -0,0 +1,105 @@
+"""Bounded thread pool for CPU-bound prediction work under ASGI.
+
+The async quote endpoint must not run ``model.predict`` on the event loop, and
+must not queue work without limit when a burst arrives faster than the models
+can score it. ``PredictionExecutor`` admits at most ``max_workers`` running
+plus ``max_queue`` waiting calls and rejects the rest with ``ExecutorBusy``,
+which the view turns into a 503.
+
+Threads rather than processes: the models live in the shared registry, NumPy
+releases the GIL for the heavy parts, and a process pool would need its own
+copy of every model and pickle each request and result.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from django.conf import settings
+
+DEFAULT_WORKERS = 4
+DEFAULT_QUEUE = 32
+
+
+class ExecutorBusy(Exception):
+    """Raised when every worker is busy and the wait queue is full."""
+
+
+class PredictionExecutor:
+    """
+    Runs blocking callables on a thread pool with admission control.
+
+    Attributes:
+        max_workers (int): Threads scoring concurrently.
+        max_queue (int): Calls allowed to wait for a free thread.
+        rejected (int): Calls refused with ExecutorBusy since start.
+
+    Methods:
+        run(func, *args):
+            Awaits func(*args) on the pool, raising ExecutorBusy when full.
+        stats():
+            Returns the limits, in-flight count and rejection count.
+        shutdown():
+            Stops the pool; it is recreated on the next call.
+    """
+
+    def __init__(
+        self, max_workers: int = DEFAULT_WORKERS, max_queue: int = DEFAULT_QUEUE
+    ) -> None:
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.rejected = 0
+        self._slots = threading.BoundedSemaphore(max_workers + max_queue)
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="predict"
+                )
+            return self._pool
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            raise ExecutorBusy(
+                f"{self.max_workers} predictions running and "
+                f"{self.max_queue} waiting"
+            )
+        with self._lock:
+            self._in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_pool(), func, *args)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+            self._slots.release()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "in_flight": self._in_flight,
+                "rejected": self.rejected,
+            }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+
+prediction_executor = PredictionExecutor(
+    max_workers=int(getattr(settings, "PREDICTION_EXECUTOR_WORKERS", DEFAULT_WORKERS)),
+    max_queue=int(getattr(settings, "PREDICTION_EXECUTOR_QUEUE", DEFAULT_QUEUE)),
+)
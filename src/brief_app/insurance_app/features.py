@@ -0,0 +1,145 @@
+"""Feature encoding for the profile model (``model.pkl``).
+
+``encode_profiles`` maps applicant profiles straight into a preallocated
+float64 array laid out in ``FEATURE_COLUMNS`` order, binning age and BMI with
+``np.digitize`` instead of building a DataFrame and one-hot encoding it.
+``encode_profiles_pandas`` is the original ``PredictChargesView.preprocess_data``
+logic, kept as the reference for parity tests and benchmarks.
+"""
+
+from __future__ import annotations
+
+from typing import Any, List, Mapping, Sequence
+
+import numpy as np
+import pandas as pd
+
+# Columns the profile model expects, in order
+FEATURE_COLUMNS: List[str] = [
+    "smoker",
+    "age",
+    "bmi",
+    "age_category_young_adult",
+    "age_category_early_adulthood",
+    "bmi_category_over_weight",
+    "bmi_category_obese",
+    "children_str_0",
+]
+
+# Upper edges of young_adult / early_adulthood / mid_adulthood (late beyond)
+AGE_BINS = np.array([26, 36, 46])
+# Upper edges of under_weight / normal_weight / over_weight (obese beyond)
+BMI_BINS = np.array([18.5, 25, 30])
+# Young adults are strictly older than this, younger applicants count as late
+YOUNG_ADULT_MIN_AGE = 18
+
+
+def encode_columns(
+    smoker: np.ndarray, age: np.ndarray, bmi: np.ndarray, children: np.ndarray
+) -> np.ndarray:
+    """
+    Encodes column arrays of equal length into the model feature matrix.
+
+    Args:
+        smoker (np.ndarray): "Yes"/"No" strings, anything else encodes as NaN.
+        age (np.ndarray): Ages in years.
+        bmi (np.ndarray): Body mass indexes.
+        children (np.ndarray): Number of children.
+
+    Returns:
+        np.ndarray: A float64 array of shape (n, len(FEATURE_COLUMNS)).
+    """
+    age = np.asarray(age, dtype=np.float64)
+    bmi = np.asarray(bmi, dtype=np.float64)
+    smoker = np.asarray(smoker, dtype=object)
+    children = np.asarray(children)
+
+    out = np.empty((len(age), len(FEATURE_COLUMNS)), dtype=np.float64)
+    out[:, 0] = np.where(smoker == "Yes", 1.0, np.where(smoker == "No", 0.0, np.nan))
+    out[:, 1] = age
+    out[:, 2] = bmi
+
+    age_bin = np.digitize(age, AGE_BINS)
+    out[:, 3] = (age_bin == 0) & (age > YOUNG_ADULT_MIN_AGE)
+    out[:, 4] = age_bin == 1
+
+    bmi_bin = np.digitize(bmi, BMI_BINS)
+    out[:, 5] = bmi_bin == 2
+    out[:, 6] = bmi_bin == 3
+
+    # The original encoding compares str(children) with "0", so 0.0 does not match
+    if children.dtype.kind in "iu":
+        out[:, 7] = children == 0
+    else:
+        out[:, 7] = [str(value) == "0" for value in children]
+    return out
+
+
+def encode_profiles(profiles: Sequence[Mapping[str, Any]]) -> np.ndarray:
+    """
+    Encodes applicant profiles into the model feature matrix.
+
+    Args:
+        profiles (Sequence[Mapping]): Dicts with ``age``, ``bmi``, ``smoker`` and
+            ``children`` keys, as built by ``PredictChargesView.form_valid``.
+
+    Returns:
+        np.ndarray: A float64 array of shape (len(profiles), len(FEATURE_COLUMNS)).
+    """
+    count = len(profiles)
+    return encode_columns(
+        smoker=np.array([p["smoker"] for p in profiles], dtype=object),
+        age=np.fromiter((p["age"] for p in profiles), np.float64, count),
+        bmi=np.fromiter((p["bmi"] for p in profiles), np.float64, count),
+        children=np.array([p["children"] for p in profiles]),
+    )
+
+
+def to_frame(features: np.ndarray) -> pd.DataFrame:
+    """Wraps an encoded matrix in the DataFrame the sklearn pipeline selects from."""
+    return pd.DataFrame(features, columns=FEATURE_COLUMNS, copy=False)
+
+
+def score_profiles(model: Any, profiles: Sequence[Mapping[str, Any]]) -> List[float]:
+    """Scores PredictChargesView profiles in one ``predict`` call, rounded to cents."""
+    return [
+        round(value, 2) for value in model.predict(to_frame(encode_profiles(profiles)))
+    ]
+
+
+def categorize_bmi(bmi: float) -> str:
+    if bmi < 18.5:
+        return "under_weight"
+    elif 18.5 <= bmi < 25:
+        return "normal_weight"
+    elif 25 <= bmi < 30:
+        return "over_weight"
+    else:
+        return "obese"
+
+
+def categorize_age(age: int) -> str:
+    if 18 < age < 26:
+        return "young_adult"
+    elif 26 <= age < 36:
+        return "early_adulthood"
+    elif 36 <= age < 46:
+        return "mid_adulthood"
+    else:
+        return "late_adulthood"
+
+
+def encode_profiles_pandas(profiles: Sequence[Mapping[str, Any]]) -> pd.DataFrame:
+    """Reference encoder: the original per-row pandas ``preprocess_data`` logic."""
+    df = pd.DataFrame(list(profiles))
+    df["smoker"] = df["smoker"].map({"Yes": 1, "No": 0})
+    df["age_category"] = df["age"].apply(categorize_age)
+    df["bmi_category"] = df["bmi"].apply(categorize_bmi)
+    df["children_str"] = df["children"].apply(lambda x: str(x))
+    df = pd.get_dummies(
+        df, columns=["age_category", "bmi_category", "children_str"], dtype=(int)
+    )
+    for col in FEATURE_COLUMNS:
+        if col not in df.columns:
+            df[col] = 0
+    return df[FEATURE_COLUMNS]
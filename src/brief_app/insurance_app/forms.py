@@ -5,7 +5,6 @@ from django.utils.html import format_html
 from django.contrib.auth.forms import PasswordChangeForm
 from django.contrib.auth.hashers import make_password
 from django.forms import DateInput
-from typing import Optional
 
 
 class PredictChargesForm(forms.ModelForm):
@@ -225,14 +224,14 @@ class AppointmentForm(forms.ModelForm):
     """Form for creating or updating an appointment.
 
     This form allows users to select a reason for the appointment, specify the
-    date, and choose a time. It includes validation for the time field to ensure
-    it follows the correct format (HH:MM, 24-hour clock). The date field is
-    rendered with a custom widget for better styling.
+    date, and choose a time. The time is a ``SlotField``, so it only accepts the
+    hourly slots of ``SLOT_TIMES``. The date field is rendered with a custom
+    widget for better styling.
 
     Attributes:
         reason: The reason for the appointment, selected from predefined choices.
         date: The date of the appointment, displayed with a date picker.
-        time: The time of the appointment, validated to ensure it follows the HH:MM format.
+        time: The time of the appointment, one of the slot grid's times.
     """
 
     class Meta:
@@ -246,26 +245,3 @@ class AppointmentForm(forms.ModelForm):
                 }
             ),
         }
-
-    def clean_time(self) -> str:
-        """Validates the time field to ensure it follows the HH:MM format.
-
-        Checks if the time entered is not empty and adheres to a valid 24-hour
-        clock format. Raises a validation error if the time is invalid.
-
-        Returns:
-            str: The validated time string in HH:MM format.
-
-        Raises:
-            forms.ValidationError: If the time format is invalid.
-        """
-        time: Optional[str] = self.cleaned_data.get("time")
-        try:
-            if not time:
-                raise forms.ValidationError("This field is required.")
-            hour, minute = map(int, time.split(":"))
-            if not (0 <= hour < 24 and 0 <= minute < 60):
-                raise forms.ValidationError("Enter a valid time in HH:MM format.")
-        except ValueError as e:
-            raise forms.ValidationError("Time should be in HH:MM format.") from e
-        return time
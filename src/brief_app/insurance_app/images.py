@@ -0,0 +1,128 @@
+"""Responsive variants of the raster images under ``static/images``.
+
+``manage.py optimize_images`` runs offline in the image build, before
+``build_static``. For every PNG or JPEG that ``collectstatic`` would serve,
+it writes AVIF and WebP copies at each width of ``WIDTHS`` smaller than the
+source, plus one at the source width capped to ``MAX_WIDTH``, as
+``images/<stem>-<width>w.<format>`` under ``IMAGE_BUILD_DIR/static``.
+Settings add that directory to ``STATICFILES_DIRS``, so the variants get
+hashed names and far-future caching like every other static file.
+
+The index (``IMAGE_BUILD_DIR/variants.json``) lists each variant with its
+size, and is what the ``{% picture %}`` tag reads to emit ``<source>``
+elements; without it the tag falls back to a plain ``<img>``.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.staticfiles import finders
+
+WIDTHS = (480, 960, 1440)
+MAX_WIDTH = 1920
+# Format, Pillow save options
+FORMATS: Tuple[Tuple[str, Dict[str, Any]], ...] = (
+    ("avif", {"quality": 55, "speed": 6}),
+    ("webp", {"quality": 80, "method": 6}),
+)
+RASTER_EXTENSIONS = (".png", ".jpg", ".jpeg")
+INDEX_NAME = "variants.json"
+
+_index_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+
+def raster_sources() -> Dict[str, str]:
+    """Maps every served raster under ``images/`` to its file on disk."""
+    ignore_patterns = apps.get_app_config("staticfiles").ignore_patterns
+    sources: Dict[str, str] = {}
+    for finder in finders.get_finders():
+        for path, storage in finder.list(ignore_patterns):
+            if path.startswith("images/") and path.lower().endswith(RASTER_EXTENSIONS):
+                sources.setdefault(path, storage.path(path))
+    return sources
+
+
+def variant_widths(width: int, widths: Iterable[int] = WIDTHS) -> List[int]:
+    """Returns the srcset widths for a source ``width`` pixels wide."""
+    largest = min(width, MAX_WIDTH)
+    return sorted({w for w in widths if w < largest} | {largest})
+
+
+def build_variants(
+    sources: Dict[str, str], output_dir: Path, widths: Iterable[int] = WIDTHS
+) -> Dict[str, Any]:
+    """
+    Writes the AVIF and WebP variants of ``sources`` and their index.
+
+    Variants newer than their source are kept as they are.
+
+    Args:
+        sources (Dict[str, str]): Static path to source file, as returned by
+            ``raster_sources``.
+        output_dir (Path): Usually ``settings.IMAGE_BUILD_DIR``.
+        widths (Iterable[int]): Target widths before capping to the source.
+
+    Returns:
+        Dict[str, Any]: The index written to ``variants.json``.
+    """
+    from PIL import Image
+
+    index: Dict[str, Any] = {}
+    for name, source in sorted(sources.items()):
+        stem, _ = os.path.splitext(name)
+        with Image.open(source) as image:
+            image.load()
+            entry: Dict[str, Any] = {
+                "width": image.width,
+                "height": image.height,
+                "bytes": os.path.getsize(source),
+                "variants": {fmt: [] for fmt, _ in FORMATS},
+            }
+            for width in variant_widths(image.width, widths):
+                height = round(image.height * width / image.width)
+                resized = None
+                for fmt, options in FORMATS:
+                    variant = f"{stem}-{width}w.{fmt}"
+                    path = output_dir / "static" / variant
+                    if (
+                        not path.exists()
+                        or path.stat().st_mtime < os.stat(source).st_mtime
+                    ):
+                        if resized is None:
+                            resized = image.resize((width, height), Image.LANCZOS)
+                        path.parent.mkdir(parents=True, exist_ok=True)
+                        resized.save(path, fmt.upper(), **options)
+                    entry["variants"][fmt].append(
+                        {"name": variant, "width": width, "bytes": path.stat().st_size}
+                    )
+        index[name] = entry
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_dir / f"{INDEX_NAME}.tmp"
+    tmp_path.write_text(json.dumps(index, indent=2), encoding="utf-8")
+    os.replace(tmp_path, output_dir / INDEX_NAME)
+    return index
+
+
+def load_index() -> Dict[str, Any]:
+    """Reads ``variants.json``, again only when it changed; empty if missing."""
+    path = os.path.join(settings.IMAGE_BUILD_DIR, INDEX_NAME)
+    try:
+        mtime = os.stat(path).st_mtime
+    except OSError:
+        return {}
+    cached = _index_cache.get(path)
+    if cached is None or cached[0] != mtime:
+        with open(path, encoding="utf-8") as file:
+            cached = (mtime, json.load(file))
+        _index_cache[path] = cached
+    return cached[1]
+
+
+def get_variants(name: str) -> Optional[Dict[str, Any]]:
+    """Returns the index entry of the static image ``name``, if it was built."""
+    return load_index().get(name)
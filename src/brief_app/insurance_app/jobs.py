@@ -0,0 +1,121 @@
+"""Job listing pages for JoinUsView, cached and keyset-paginated.
+
+A page is one indexed query on the ``job_id`` primary key
+(``WHERE job_id > after ORDER BY job_id LIMIT size + 1``), so its cost does
+not depend on how deep the page is or how many jobs exist. Only the listing
+columns and the first ``SUMMARY_LENGTH`` characters of ``description`` are
+selected. The full text is fetched by ``job_description`` when a visitor
+expands a job. The application form lists every job from ``job_choices``,
+just ids and titles.
+
+Pages are cached under a version token that the ``post_save`` and
+``post_delete`` receivers below replace, so any change to a job retires every
+cached page at once. With the default per-process ``LocMemCache`` other
+Gunicorn workers still serve their copy until ``JOB_LISTING_CACHE_TIMEOUT``;
+a shared cache backend makes invalidation immediate.
+"""
+
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models.functions import Left
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Job
+
+PAGE_SIZE = 12
+SUMMARY_LENGTH = 200
+VERSION_KEY = "jobs:version"
+LISTING_FIELDS = ("job_id", "title", "location", "experience")
+
+
+def listing_version() -> int:
+    return cache.get_or_set(VERSION_KEY, time.time_ns, None)
+
+
+@receiver(post_save, sender=Job, dispatch_uid="jobs_listing_post_save")
+@receiver(post_delete, sender=Job, dispatch_uid="jobs_listing_post_delete")
+def invalidate_listing(**kwargs: Any) -> None:
+    """Retires every cached page; a new version token makes them unreachable."""
+    cache.set(VERSION_KEY, time.time_ns(), None)
+
+
+def _fetch_page(
+    after: Optional[int], before: Optional[int], size: int
+) -> Dict[str, Any]:
+    # One extra character tells whether the summary is truncated
+    jobs = Job.objects.annotate(summary=Left("description", SUMMARY_LENGTH + 1))
+    if before is not None:
+        jobs = jobs.filter(job_id__lt=before).order_by("-job_id")
+    else:
+        jobs = jobs.filter(job_id__gt=after or 0).order_by("job_id")
+    rows: List[Dict[str, Any]] = list(
+        jobs.values(*LISTING_FIELDS, "summary")[: size + 1]
+    )
+
+    more = len(rows) > size
+    rows = rows[:size]
+    if before is not None:
+        rows.reverse()
+        has_previous, has_next = more, True
+    else:
+        has_previous, has_next = after is not None, more
+    for row in rows:
+        row["truncated"] = len(row["summary"]) > SUMMARY_LENGTH
+        row["summary"] = row["summary"][:SUMMARY_LENGTH]
+    return {
+        "jobs": rows,
+        "previous_before": rows[0]["job_id"] if rows and has_previous else None,
+        "next_after": rows[-1]["job_id"] if rows and has_next else None,
+    }
+
+
+def job_page(
+    after: Optional[int] = None,
+    before: Optional[int] = None,
+    size: int = PAGE_SIZE,
+) -> Dict[str, Any]:
+    """
+    Returns one page of jobs ordered by ``job_id``, from the cache if possible.
+
+    Args:
+        after (Optional[int]): Start right after this ``job_id`` (next page).
+        before (Optional[int]): End right before this ``job_id`` (previous
+            page); takes precedence over ``after``.
+        size (int): Jobs per page.
+
+    Returns:
+        Dict[str, Any]: ``jobs`` (dicts of the listing fields plus
+            ``summary`` and ``truncated``), and the ``next_after`` /
+            ``previous_before`` cursors, None at either end.
+    """
+    key = f"jobs:{listing_version()}:{after}:{before}:{size}"
+    page = cache.get(key)
+    if page is None:
+        page = _fetch_page(after, before, size)
+        cache.set(key, page, getattr(settings, "JOB_LISTING_CACHE_TIMEOUT", 300))
+    return page
+
+
+def job_choices() -> List[Tuple[int, str]]:
+    """
+    Returns ``(job_id, title)`` of every job, for the application form's select.
+
+    Cached under the same version token as the pages, so it changes with them.
+    """
+    key = f"jobs:{listing_version()}:choices"
+    choices = cache.get(key)
+    if choices is None:
+        choices = list(Job.objects.order_by("job_id").values_list("job_id", "title"))
+        cache.set(key, choices, getattr(settings, "JOB_LISTING_CACHE_TIMEOUT", 300))
+    return choices
+
+
+def job_description(job_id: int) -> Optional[str]:
+    """Returns the full description of a job, or None if it does not exist."""
+    return (
+        Job.objects.filter(job_id=job_id).values_list("description", flat=True).first()
+    )
@@ -0,0 +1,57 @@
+import timeit
+from typing import Any, Callable
+
+import numpy as np
+import pandas as pd
+from django.core.management.base import BaseCommand, CommandParser
+
+from insurance_app.compiled import compile_pipeline
+from insurance_app.features import encode_profiles, to_frame
+from insurance_app.management.commands.benchmark_features import random_profiles
+from insurance_app.model_registry import PROFILE_MODEL, QUOTE_MODEL, registry
+from insurance_app.warmup import SAMPLE_QUOTE
+
+
+def _per_call_us(func: Callable[[], Any], size: int) -> float:
+    number = max(1, 2000 // size)
+    return min(timeit.repeat(func, number=number, repeat=3)) / number * 1e6
+
+
+class Command(BaseCommand):
+    """Compares sklearn Pipeline.predict with the compiled NumPy predictor."""
+
+    help = "Benchmark compiled model latency against the sklearn pipelines."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--sizes",
+            type=int,
+            nargs="+",
+            default=[1, 100, 10_000],
+            help="Batch sizes to benchmark (default: 1 100 10000).",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        quote_model = registry.get(QUOTE_MODEL)
+        profile_model = registry.get(PROFILE_MODEL)
+        compiled_quote = compile_pipeline(quote_model)
+        compiled_profile = compile_pipeline(profile_model)
+
+        self.stdout.write(
+            f"{'model':<16} {'batch':>7} {'sklearn us':>12} {'compiled us':>12} "
+            f"{'speedup':>8} {'max abs diff':>13}"
+        )
+        for size in options["sizes"]:
+            quotes = pd.DataFrame([SAMPLE_QUOTE] * size)
+            profiles = to_frame(encode_profiles(random_profiles(size)))
+            for name, model, compiled, X in (
+                (QUOTE_MODEL, quote_model, compiled_quote, quotes),
+                (PROFILE_MODEL, profile_model, compiled_profile, profiles),
+            ):
+                diff = np.abs(model.predict(X) - compiled.predict(X)).max()
+                sklearn_us = _per_call_us(lambda: model.predict(X), size)
+                compiled_us = _per_call_us(lambda: compiled.predict(X), size)
+                self.stdout.write(
+                    f"{name:<16} {size:>7} {sklearn_us:>12.1f} {compiled_us:>12.1f} "
+                    f"{sklearn_us / compiled_us:>7.1f}x {diff:>13.2e}"
+                )
@@ -0,0 +1,63 @@
+import random
+import timeit
+from typing import Any, Dict, List
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from insurance_app.features import encode_profiles, encode_profiles_pandas
+
+
+def random_profiles(count: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """Builds reproducible random applicant profiles for benchmarking."""
+    rng = random.Random(seed)
+    return [
+        {
+            "age": rng.randint(18, 64),
+            "bmi": round(rng.uniform(15, 45), 1),
+            "smoker": rng.choice(["Yes", "No"]),
+            "children": rng.randint(0, 5),
+            "region": "Northeast",
+            "sex": "Male",
+        }
+        for _ in range(count)
+    ]
+
+
+class Command(BaseCommand):
+    """Compares the per-row cost of the NumPy and pandas feature encoders."""
+
+    help = "Benchmark the profile feature encoder at several batch sizes."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--sizes",
+            type=int,
+            nargs="+",
+            default=[1, 100, 100_000],
+            help="Batch sizes to benchmark (default: 1 100 100000).",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        self.stdout.write(
+            f"{'batch':>8} {'pandas us/row':>15} {'numpy us/row':>14} {'speedup':>8}"
+        )
+        for size in options["sizes"]:
+            profiles = random_profiles(size)
+            # Aim for roughly 0.2 s of work per measurement, at least one run
+            number = max(1, 2000 // size)
+            pandas_s = min(
+                timeit.repeat(
+                    lambda: encode_profiles_pandas(profiles), number=number, repeat=3
+                )
+            )
+            numpy_s = min(
+                timeit.repeat(
+                    lambda: encode_profiles(profiles), number=number, repeat=3
+                )
+            )
+            per_row_pandas = pandas_s / number / size * 1e6
+            per_row_numpy = numpy_s / number / size * 1e6
+            self.stdout.write(
+                f"{size:>8} {per_row_pandas:>15.3f} {per_row_numpy:>14.3f} "
+                f"{per_row_pandas / per_row_numpy:>7.1f}x"
+            )
@@ -0,0 +1,57 @@
+import time
+from typing import Any, Dict, List
+
+from django.core.cache import caches
+from django.core.management.base import BaseCommand, CommandParser
+from django.test import Client, override_settings
+from django.urls import reverse
+
+# The views behind AnonymousPageCacheMixin
+PAGES = [
+    "home",
+    "about",
+    "health_advices",
+    "cybersecurity_awareness",
+    "welcome",
+    "testing",
+]
+
+
+class Command(BaseCommand):
+    """
+    Measures anonymous requests per second on the cached marketing pages.
+
+    Each page is requested ``--requests`` times through Django's WSGI handler
+    (the test client), once with ``PAGE_CACHE_TIMEOUT=0``, which renders every
+    request, header included, and once with the page and fragment caches on.
+    """
+
+    help = "Benchmark the marketing pages with and without the page cache."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--requests", type=int, default=500)
+        parser.add_argument("--timeout", type=int, default=300)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        urls = [reverse(name) for name in PAGES]
+        results: Dict[str, List[float]] = {}
+        for label, timeout in (("uncached", 0), ("cached", options["timeout"])):
+            caches["default"].clear()
+            with override_settings(PAGE_CACHE_TIMEOUT=timeout):
+                results[label] = [self._rps(url, options["requests"]) for url in urls]
+
+        self.stdout.write(f"{'page':<28} {'uncached':>10} {'cached':>10} {'x':>6}")
+        for i, url in enumerate(urls):
+            before, after = results["uncached"][i], results["cached"][i]
+            self.stdout.write(
+                f"{url:<28} {before:>10.0f} {after:>10.0f} {after / before:>6.1f}"
+            )
+
+    def _rps(self, url: str, count: int) -> float:
+        client = Client()
+        client.get(url)  # warm up loaders and the cache
+        start = time.perf_counter()
+        for _ in range(count):
+            response = client.get(url)
+            assert response.status_code == 200, (url, response.status_code)
+        return count / (time.perf_counter() - start)
@@ -0,0 +1,123 @@
+import statistics
+import time
+from typing import Any, Callable, List
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.core.paginator import Paginator
+from django.db import transaction
+from django.db.models import QuerySet
+
+from insurance_app.models import ContactMessage, PredictionHistory, UserProfile
+from insurance_app.pagination import CursorPaginator
+
+
+class Command(BaseCommand):
+    """
+    Compares keyset and OFFSET pagination on large message and history tables.
+
+    ``--rows`` contact messages and ``--rows`` predictions for one user are
+    inserted in a transaction that is rolled back afterwards. For pages at
+    growing depths the command times Django's ``Paginator`` (``COUNT(*)`` plus
+    ``LIMIT/OFFSET``) against ``CursorPaginator`` given the cursor a visitor
+    would hold at that page. Times are the median of ``--repeat`` runs.
+    """
+
+    help = "Benchmark cursor against OFFSET pagination at increasing depths."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--rows", type=int, default=1_000_000)
+        parser.add_argument("--per-page", type=int, default=25)
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        rows, per_page = options["rows"], options["per_page"]
+        with transaction.atomic():
+            user = UserProfile.objects.create_user(username="benchmark_pagination")
+            self._populate(user, rows)
+            tables = [
+                ("messages", ContactMessage.objects.all(), ("-submitted_at", "-id")),
+                (
+                    "history",
+                    PredictionHistory.objects.filter(user=user),
+                    ("-timestamp", "-id"),
+                ),
+            ]
+            for label, queryset, ordering in tables:
+                self._compare(label, queryset, ordering, rows, per_page, options)
+            transaction.set_rollback(True)
+
+    def _populate(self, user: UserProfile, rows: int) -> None:
+        start = time.perf_counter()
+        ContactMessage.objects.bulk_create(
+            (
+                ContactMessage(name=f"Visitor {i}", email="v@example.com", message="Hi")
+                for i in range(rows)
+            ),
+            batch_size=5000,
+        )
+        PredictionHistory.objects.bulk_create(
+            (
+                PredictionHistory(
+                    user=user,
+                    age=30,
+                    weight=70,
+                    height=175,
+                    num_children=0,
+                    smoker="No",
+                    region="Northeast",
+                    sex="Male",
+                    predicted_charges=i % 50000,
+                )
+                for i in range(rows)
+            ),
+            batch_size=5000,
+        )
+        self.stdout.write(
+            f"inserted {rows} rows per table in {time.perf_counter() - start:.1f}s"
+        )
+
+    def _compare(
+        self,
+        label: str,
+        queryset: QuerySet,
+        ordering: tuple,
+        rows: int,
+        per_page: int,
+        options: Any,
+    ) -> None:
+        last_page = max(1, -(-rows // per_page))
+        depths = sorted({1, 10, 100, 1000, last_page // 2, last_page} - {0})
+        depths = [page for page in depths if page <= last_page]
+        ordered = queryset.order_by(*ordering)
+        cursor = CursorPaginator(queryset, ordering, per_page)
+
+        self.stdout.write(f"\n{label}: {'page':>8} {'offset ms':>10} {'cursor ms':>10}")
+        for number in depths:
+            token = None
+            if number > 1:
+                # The row a visitor saw last on the previous page
+                token = cursor.encode(ordered[(number - 1) * per_page - 1], False)
+
+            def offset_page() -> List[Any]:
+                # A new Paginator per request, as ListView builds one
+                return list(Paginator(ordered, per_page).page(number))
+
+            def cursor_page() -> List[Any]:
+                return list(cursor.page(token))
+
+            expected = offset_page()
+            assert cursor_page() == expected, (label, number)
+            self.stdout.write(
+                f"{'':<{len(label) + 1}} {number:>8} "
+                f"{self._time(offset_page, options['repeat']):>10.2f} "
+                f"{self._time(cursor_page, options['repeat']):>10.2f}"
+            )
+
+    @staticmethod
+    def _time(fn: Callable[[], Any], repeat: int) -> float:
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            samples.append((time.perf_counter() - start) * 1000)
+        return statistics.median(samples)
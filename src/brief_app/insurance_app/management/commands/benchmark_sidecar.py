@@ -0,0 +1,154 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+
+from insurance_app.management.commands.loadtest_quotes import random_quotes
+
+
+def memory_kb(pid: int) -> Dict[str, int]:
+    """Reads resident and proportional set size of a process from /proc."""
+    values = {}
+    with open(f"/proc/{pid}/smaps_rollup") as file:
+        for line in file:
+            key, _, rest = line.partition(":")
+            if key in ("Rss", "Pss"):
+                values[key.lower()] = int(rest.split()[0])
+    return values
+
+
+# Prefix of worker lines meant for the parent, other output is skipped
+REPLY = "benchmark_sidecar: "
+
+
+def _read_reply(process: subprocess.Popen) -> str:
+    for line in process.stdout:
+        if line.startswith(REPLY):
+            return line[len(REPLY) :]
+    raise RuntimeError("A benchmark worker exited early")
+
+
+class Command(BaseCommand):
+    """
+    Compares N worker processes scoring in-process with N workers plus the sidecar.
+
+    Each worker is a separate ``manage.py`` process, like a Gunicorn worker
+    without preload. Workers warm up, start together, send ``--requests``
+    distinct quotes each and report their latencies. RSS and PSS are read
+    from /proc while every process is still alive; PSS splits shared pages
+    between the processes that map them.
+    """
+
+    help = "Benchmark total memory and p99 latency with and without the sidecar."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--workers", type=int, default=8)
+        parser.add_argument("--requests", type=int, default=200)
+        parser.add_argument(
+            "--worker", action="store_true", help="Internal: run as one worker."
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if options["worker"]:
+            return self._work(options["requests"])
+
+        self.stdout.write(
+            f"{'mode':<10} {'procs':>5} {'RSS MB':>8} {'PSS MB':>8} "
+            f"{'p50 ms':>8} {'p99 ms':>8}"
+        )
+        self._compare("in-process", options["workers"], options["requests"], None)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            socket_path = os.path.join(tmp_dir, "predict.sock")
+            sidecar = self._spawn(
+                ["run_prediction_sidecar", "--socket", socket_path], {}
+            )
+            try:
+                while not os.path.exists(socket_path):
+                    if sidecar.poll() is not None:
+                        raise RuntimeError("The prediction sidecar exited")
+                    time.sleep(0.05)
+                self._compare(
+                    "sidecar",
+                    options["workers"],
+                    options["requests"],
+                    sidecar,
+                    {"PREDICTION_SIDECAR_SOCKET": socket_path},
+                )
+            finally:
+                sidecar.terminate()
+                sidecar.wait()
+
+    def _spawn(self, argv: List[str], env: Dict[str, str]) -> subprocess.Popen:
+        return subprocess.Popen(
+            [sys.executable, str(settings.BASE_DIR / "manage.py"), *argv],
+            env={**os.environ, "PREDICTION_SIDECAR_SOCKET": "", **env},
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+
+    def _compare(
+        self,
+        mode: str,
+        count: int,
+        requests: int,
+        sidecar: Optional[subprocess.Popen],
+        env: Optional[Dict[str, str]] = None,
+    ) -> None:
+        workers = [
+            self._spawn(
+                ["benchmark_sidecar", "--worker", "--requests", str(requests)],
+                env or {},
+            )
+            for _ in range(count)
+        ]
+        for worker in workers:
+            _read_reply(worker)
+        for worker in workers:
+            worker.stdin.write("go\n")
+            worker.stdin.flush()
+        latencies: List[float] = []
+        for worker in workers:
+            latencies.extend(json.loads(_read_reply(worker)))
+
+        processes = workers + ([sidecar] if sidecar else [])
+        memory = [memory_kb(process.pid) for process in processes]
+        for worker in workers:
+            worker.stdin.close()
+            worker.wait()
+
+        cuts = statistics.quantiles(latencies, n=100)
+        self.stdout.write(
+            f"{mode:<10} {len(processes):>5} "
+            f"{sum(m['rss'] for m in memory) / 1024:>8.1f} "
+            f"{sum(m['pss'] for m in memory) / 1024:>8.1f} "
+            f"{cuts[49]:>8.2f} {cuts[98]:>8.2f}"
+        )
+
+    def _work(self, requests: int) -> None:
+        from insurance_app.prediction_cache import prediction_cache
+        from insurance_app.quotes import parse_quote, predict_quote
+
+        rows = [parse_quote(row) for row in random_quotes(requests, seed=os.getpid())]
+        predict_quote(rows[0])
+        prediction_cache.clear()
+        sys.stdout.write(REPLY + "ready\n")
+        sys.stdout.flush()
+        sys.stdin.readline()
+
+        latencies = []
+        for row in rows:
+            start = time.perf_counter()
+            predict_quote(row)
+            latencies.append((time.perf_counter() - start) * 1000)
+        sys.stdout.write(REPLY + json.dumps(latencies) + "\n")
+        sys.stdout.flush()
+        sys.stdin.read()
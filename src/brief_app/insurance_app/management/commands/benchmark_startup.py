@@ -0,0 +1,113 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+
+# Cold-start targets: a bare manage.py call, what the entrypoint runs before
+# serving, and the app boot
+TARGETS: Dict[str, List[str]] = {
+    "manage.py": ["manage.py", "showmigrations", "--plan"],
+    "bootstrap": ["manage.py", "bootstrap", "--no-exec"],
+    "wsgi": ["-c", "import brief_app.wsgi"],
+}
+# bootstrap migrates and collects static files against the configured database
+# and STATIC_ROOT, so it only runs when asked for with --targets
+DEFAULT_TARGETS = ["manage.py", "wsgi"]
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=settings.BASE_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class Command(BaseCommand):
+    """
+    Measures cold-start time of fresh processes with the startup profiler on.
+
+    Every run is a new interpreter started with ``STARTUP_PROFILE`` pointing to
+    a temporary file, so the report holds the per-phase times of
+    ``brief_app/startup.py`` plus the wall time of the whole process. Medians
+    over ``--runs`` are printed and, with ``--history``, appended as one JSON
+    line tagged with the current commit to compare cold starts across commits.
+    """
+
+    help = "Benchmark cold-start time of manage.py and the WSGI app."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--runs", type=int, default=5)
+        parser.add_argument(
+            "--targets",
+            nargs="+",
+            choices=list(TARGETS),
+            default=DEFAULT_TARGETS,
+            help="Processes to time (default: manage.py wsgi). bootstrap applies "
+            "migrations and collects static files for the configured settings.",
+        )
+        parser.add_argument(
+            "--history",
+            help="JSON lines file to append this run's medians to.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        summary: Dict[str, Any] = {
+            "commit": _git_commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "runs": options["runs"],
+            "targets": {},
+        }
+        for target in options["targets"]:
+            reports = [self._run(TARGETS[target]) for _ in range(options["runs"])]
+            phases = {
+                name: statistics.median(r["phases"][name]["ms"] for r in reports)
+                for name in reports[0]["phases"]
+            }
+            summary["targets"][target] = {
+                "phases_ms": phases,
+                "profiled_ms": statistics.median(r["total_ms"] for r in reports),
+                "wall_ms": statistics.median(r["wall_ms"] for r in reports),
+                "max_rss_kb": statistics.median(r["max_rss_kb"] for r in reports),
+            }
+
+            self.stdout.write(f"{target} (median of {options['runs']} runs)")
+            for name, ms in phases.items():
+                self.stdout.write(f"  {name:<10} {ms:>9.1f} ms")
+            self.stdout.write(
+                f"  {'wall':<10} {summary['targets'][target]['wall_ms']:>9.1f} ms"
+            )
+
+        if options["history"]:
+            with open(options["history"], "a", encoding="utf-8") as file:
+                file.write(json.dumps(summary, sort_keys=True) + "\n")
+
+    def _run(self, argv: List[str]) -> Dict[str, Any]:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "startup.jsonl")
+            start = time.perf_counter()
+            subprocess.run(
+                [sys.executable, *argv],
+                cwd=settings.BASE_DIR,
+                env={**os.environ, "STARTUP_PROFILE": path},
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=True,
+            )
+            wall_ms = (time.perf_counter() - start) * 1000
+            with open(path, encoding="utf-8") as file:
+                report = json.loads(file.readline())
+        report["wall_ms"] = round(wall_ms, 1)
+        return report
@@ -0,0 +1,167 @@
+import os
+import time
+from typing import Any, Dict, List
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import DEFAULT_DB_ALIAS, OperationalError, connections
+from django.db.migrations.executor import MigrationExecutor
+
+
+def wait_for_database(
+    alias: str, max_retries: int, max_interval: float, log=lambda msg: None
+) -> int:
+    """
+    Opens a connection until the database accepts it.
+
+    Retries start at 0.25 s and back off to ``max_interval`` seconds.
+
+    Returns:
+        int: The number of failed attempts before the database answered.
+
+    Raises:
+        CommandError: If it is still unreachable after ``max_retries`` attempts.
+    """
+    connection = connections[alias]
+    interval = 0.25
+    for attempt in range(max_retries):
+        try:
+            connection.ensure_connection()
+            return attempt
+        except OperationalError as e:
+            connection.close()
+            log(f"Database not ready ({e}), retrying in {interval:g}s")
+            time.sleep(interval)
+            interval = min(interval * 2, max_interval)
+    raise CommandError(f"Database not ready after {max_retries} attempts")
+
+
+def pending_migrations(alias: str) -> List[str]:
+    """Returns the migrations ``migrate`` would apply, in order."""
+    executor = MigrationExecutor(connections[alias])
+    plan = executor.migration_plan(executor.loader.graph.leaf_nodes())
+    return [f"{migration.app_label}.{migration.name}" for migration, _ in plan]
+
+
+def static_sources() -> Dict[str, float]:
+    """Maps every file collectstatic would copy to its modification time."""
+    ignore_patterns = apps.get_app_config("staticfiles").ignore_patterns
+    sources = {}
+    for finder in finders.get_finders():
+        for path, storage in finder.list(ignore_patterns):
+            prefix = getattr(storage, "prefix", None)
+            name = os.path.join(prefix, path) if prefix else path
+            sources.setdefault(name, storage.path(path))
+    return {name: os.stat(path).st_mtime for name, path in sources.items()}
+
+
+def static_is_current() -> bool:
+    """
+    Tells whether STATIC_ROOT already holds the output of ``collectstatic``.
+
+    With a manifest storage, the manifest must list every source file and be
+    newer than all of them. Otherwise each source file must have been
+    collected after its last change.
+    """
+    sources = static_sources()
+    storage = staticfiles_storage
+    if hasattr(storage, "load_manifest"):
+        manifest = storage.path(storage.manifest_name)
+        if not os.path.exists(manifest):
+            return False
+        collected, _ = storage.load_manifest()
+        return (
+            set(sources) <= set(collected)
+            and max(sources.values(), default=0) <= os.stat(manifest).st_mtime
+        )
+    for name, mtime in sources.items():
+        try:
+            if os.stat(storage.path(name)).st_mtime < mtime:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+class Command(BaseCommand):
+    """
+    Prepares the container and replaces itself with Gunicorn.
+
+    Replaces the ``showmigrations`` polling loop and the separate ``migrate``
+    and ``collectstatic`` processes of ``app_entrypoint.sh`` with one Django
+    boot: it waits for the database with plain connection attempts, migrates
+    only when the plan is non-empty, collects static files only when
+    STATIC_ROOT is out of date, then ``exec``s Gunicorn.
+    """
+
+    help = "Wait for the database, migrate, collect static files and exec Gunicorn."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS)
+        parser.add_argument("--max-retries", type=int, default=120)
+        parser.add_argument(
+            "--retry-interval",
+            type=float,
+            default=3.0,
+            help="Longest wait between database attempts, in seconds.",
+        )
+        parser.add_argument(
+            "--port", type=int, default=int(os.getenv("GUNICORN_PORT", "8000"))
+        )
+        parser.add_argument(
+            "--no-exec",
+            action="store_true",
+            help="Stop once the app is ready instead of starting Gunicorn.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        started = time.perf_counter()
+        alias = options["database"]
+
+        failures = wait_for_database(
+            alias, options["max_retries"], options["retry_interval"], self.stdout.write
+        )
+        self.stdout.write(f"Database ready after {failures} failed attempts")
+
+        pending = pending_migrations(alias)
+        if pending:
+            self.stdout.write(f"Applying {len(pending)} migrations")
+            call_command("migrate", database=alias, interactive=False)
+        else:
+            self.stdout.write("No migrations to apply")
+
+        if static_is_current():
+            self.stdout.write("Static files are up to date")
+        else:
+            call_command("collectstatic", interactive=False, verbosity=0)
+            self.stdout.write("Collected static files")
+
+        # Gunicorn opens its own connections after forking
+        connections.close_all()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Ready in {(time.perf_counter() - started) * 1000:.0f} ms"
+            )
+        )
+        if options["no_exec"]:
+            return
+
+        argv = [
+            "gunicorn",
+            "brief_app.wsgi:application",
+            "--config",
+            str(settings.BASE_DIR / "gunicorn.conf.py"),
+            "--chdir",
+            str(settings.BASE_DIR),
+            "--bind",
+            f"0.0.0.0:{options['port']}",
+            "--access-logfile",
+            "-",
+        ]
+        self.stdout.write(f"Launching {' '.join(argv)}")
+        self.stdout.flush()
+        os.execvp(argv[0], argv)
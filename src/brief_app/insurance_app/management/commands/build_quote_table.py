@@ -0,0 +1,83 @@
+import os
+import time
+import timeit
+from typing import Any, Callable
+
+import pandas as pd
+from django.core.management.base import BaseCommand, CommandParser
+
+from insurance_app.model_registry import QUOTE_MODEL, registry, resolve_model_path
+from insurance_app.quote_table import (
+    DEFAULT_AGES,
+    DEFAULT_BMI,
+    DEFAULT_CHILDREN,
+    build_quote_table,
+    grid_path,
+    read_quote_table,
+)
+from insurance_app.warmup import SAMPLE_QUOTE
+
+
+def _per_call_us(func: Callable[[], Any], number: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=3)) / number * 1e6
+
+
+class Command(BaseCommand):
+    """Scores the whole discrete quote grid and writes it next to the artifact."""
+
+    help = "Precompute the quote model over every age, children, BMI and enum value."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--artifact",
+            default=QUOTE_MODEL,
+            help="Quote model name or path (default: the public quote model).",
+        )
+        parser.add_argument(
+            "--ages",
+            type=int,
+            nargs=2,
+            default=list(DEFAULT_AGES),
+            metavar=("MIN", "MAX"),
+        )
+        parser.add_argument(
+            "--children",
+            type=int,
+            nargs=2,
+            default=list(DEFAULT_CHILDREN),
+            metavar=("MIN", "MAX"),
+        )
+        parser.add_argument(
+            "--bmi",
+            type=float,
+            nargs=2,
+            default=list(DEFAULT_BMI),
+            metavar=("MIN", "MAX"),
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        path = resolve_model_path(options["artifact"])
+        model = registry.get(path)
+
+        start = time.perf_counter()
+        table = build_quote_table(
+            path, model, options["ages"], options["children"], options["bmi"]
+        )
+        build_seconds = time.perf_counter() - start
+
+        mapped = read_quote_table(path)
+        frame = pd.DataFrame([SAMPLE_QUOTE])
+        lookup_us = _per_call_us(lambda: mapped.lookup(SAMPLE_QUOTE), 100_000)
+        model_us = _per_call_us(lambda: model.predict(frame), 200)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{grid_path(path)}: {table.cents.size} premiums, shape "
+                f"{table.cents.shape}, {os.path.getsize(grid_path(path)) / 1e6:.1f} MB, "
+                f"built in {build_seconds:.2f} s"
+            )
+        )
+        self.stdout.write(
+            f"single quote: table lookup {lookup_us:.2f} us, "
+            f"model predict {model_us:.1f} us"
+        )
@@ -0,0 +1,36 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from insurance_app.compiled import compiled_path, export_compiled
+from insurance_app.model_registry import (
+    PROFILE_MODEL,
+    QUOTE_MODEL,
+    registry,
+    resolve_model_path,
+)
+
+
+class Command(BaseCommand):
+    """Writes the NumPy export of each pickled pipeline next to the artifact."""
+
+    help = "Compile the prediction pipelines to .npz files served without sklearn."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "artifacts",
+            nargs="*",
+            default=[QUOTE_MODEL, PROFILE_MODEL],
+            help="Artifact names or paths (default: both prediction models).",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        for name in options["artifacts"]:
+            path = resolve_model_path(name)
+            compiled = export_compiled(path, registry.get(path))
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{compiled_path(path)}: {compiled.n_inputs} inputs, "
+                    f"{len(compiled.coef)} non-zero terms"
+                )
+            )
@@ -0,0 +1,39 @@
+import time
+from datetime import date, timedelta
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.utils import timezone
+
+from insurance_app.recurrence import GENERATE_DAYS, materialize
+
+
+class Command(BaseCommand):
+    """
+    Writes ``Availability`` rows from the weekly rules and their exceptions.
+
+    The range starts at ``--start`` (today by default) and covers ``--days``
+    days. Existing rows in the range are replaced in bulk; see
+    ``insurance_app.recurrence``. Meant to run from cron, e.g. nightly, so
+    the bookable window keeps rolling forward.
+    """
+
+    help = "Generate availability for a date range from the weekly rules."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--start", type=date.fromisoformat, default=None)
+        parser.add_argument("--days", type=int, default=GENERATE_DAYS)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if options["days"] < 1:
+            raise CommandError("--days must be at least 1.")
+        start = options["start"] or timezone.localdate()
+        end = start + timedelta(days=options["days"] - 1)
+
+        began = time.perf_counter()
+        opened, closed = materialize(start, end)
+        elapsed = (time.perf_counter() - began) * 1000
+        self.stdout.write(
+            f"Generated availability from {start} to {end}: {opened} open days, "
+            f"{closed} days cleared in {elapsed:.0f} ms."
+        )
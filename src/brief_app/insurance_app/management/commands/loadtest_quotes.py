@@ -0,0 +1,156 @@
+import asyncio
+import random
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Tuple
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.test import AsyncClient, Client
+from django.urls import reverse
+
+from insurance_app.executor import PredictionExecutor
+from insurance_app.prediction_cache import prediction_cache
+from insurance_app.quotes import QUOTE_COLUMNS
+from insurance_app.warmup import SAMPLE_QUOTE
+
+
+def random_quotes(count: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """Builds distinct quote payloads, so the prediction cache never answers."""
+    rng = random.Random(seed)
+    base = {field: SAMPLE_QUOTE[column] for field, column in QUOTE_COLUMNS.items()}
+    return [
+        {
+            **base,
+            "age": rng.randint(18, 64),
+            "smoker": rng.choice(["yes", "no"]),
+            "bmi": rng.uniform(18.5, 24.8),
+        }
+        for _ in range(count)
+    ]
+
+
+Result = Tuple[int, float]
+
+
+class Command(BaseCommand):
+    """
+    Fires a burst of concurrent quotes at the sync and async endpoints.
+
+    Both paths are driven in-process through Django's own WSGI and ASGI
+    handlers (the test clients), so the comparison isolates the views, the
+    executor and the backpressure from any particular server. The sync path
+    gets ``--workers`` threads, like Gunicorn sync workers, and every other
+    request waits in the backlog. The async path admits the whole burst on one
+    event loop and scores it on a PredictionExecutor of the same size.
+    """
+
+    help = "Load-test /quote-predict/ (WSGI) against /quote-predict/async/ (ASGI)."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--requests", type=int, default=500)
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=100,
+            help="Requests in flight at once (default: 100).",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="Sync workers, and async executor threads (default: 4).",
+        )
+        parser.add_argument(
+            "--queue",
+            type=int,
+            default=32,
+            help="Async executor wait queue before 503 (default: 32).",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        payloads = random_quotes(options["requests"])
+
+        prediction_cache.clear()
+        sync_results, sync_seconds = self._run_sync(
+            payloads, options["workers"], options["concurrency"]
+        )
+        prediction_cache.clear()
+        executor = PredictionExecutor(options["workers"], options["queue"])
+        async_results, async_seconds = asyncio.run(
+            self._run_async(payloads, executor, options["concurrency"])
+        )
+        executor.shutdown()
+
+        self.stdout.write(
+            f"{'path':<6} {'requests':>8} {'ok':>6} {'503':>6} {'rps':>8} "
+            f"{'p50 ms':>8} {'p99 ms':>8}"
+        )
+        for name, results, seconds in (
+            ("wsgi", sync_results, sync_seconds),
+            ("asgi", async_results, async_seconds),
+        ):
+            self._report(name, results, seconds)
+
+    def _run_sync(
+        self, payloads: List[Dict[str, Any]], workers: int, concurrency: int
+    ) -> Tuple[List[Result], float]:
+        client = Client()
+        url = reverse("predict_charges")
+
+        def post(payload: Dict[str, Any], queued_at: float) -> Result:
+            response = client.post(url, payload, content_type="application/json")
+            return response.status_code, time.perf_counter() - queued_at
+
+        # Clients submit in waves of `concurrency`; workers drain the backlog
+        results: List[Result] = []
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for offset in range(0, len(payloads), concurrency):
+                wave = payloads[offset : offset + concurrency]
+                queued_at = time.perf_counter()
+                futures = [pool.submit(post, payload, queued_at) for payload in wave]
+                results.extend(future.result() for future in futures)
+        return results, time.perf_counter() - start
+
+    async def _run_async(
+        self,
+        payloads: List[Dict[str, Any]],
+        executor: PredictionExecutor,
+        concurrency: int,
+    ) -> Tuple[List[Result], float]:
+        from insurance_app import views
+
+        client = AsyncClient()
+        url = reverse("predict_charges_async")
+        shared, views.prediction_executor = views.prediction_executor, executor
+
+        async def post(payload: Dict[str, Any], queued_at: float) -> Result:
+            response = await client.post(url, payload, content_type="application/json")
+            return response.status_code, time.perf_counter() - queued_at
+
+        results: List[Result] = []
+        start = time.perf_counter()
+        try:
+            for offset in range(0, len(payloads), concurrency):
+                wave = payloads[offset : offset + concurrency]
+                queued_at = time.perf_counter()
+                results.extend(
+                    await asyncio.gather(*(post(p, queued_at) for p in wave))
+                )
+        finally:
+            views.prediction_executor = shared
+        return results, time.perf_counter() - start
+
+    def _report(self, name: str, results: List[Result], seconds: float) -> None:
+        ok = [latency for status, latency in results if status == 200]
+        rejected = sum(1 for status, _ in results if status == 503)
+        if len(ok) >= 2:
+            cuts = statistics.quantiles(ok, n=100)
+            p50, p99 = cuts[49] * 1000, cuts[98] * 1000
+        else:
+            p50 = p99 = float("nan")
+        self.stdout.write(
+            f"{name:<6} {len(results):>8} {len(ok):>6} {rejected:>6} "
+            f"{len(ok) / seconds:>8.1f} {p50:>8.1f} {p99:>8.1f}"
+        )
@@ -0,0 +1,62 @@
+import time
+from pathlib import Path
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+
+from insurance_app.images import WIDTHS, build_variants, raster_sources
+
+
+class Command(BaseCommand):
+    """
+    Writes AVIF/WebP ``srcset`` variants of the served raster images.
+
+    Runs offline: it only reads the source images and writes into
+    ``IMAGE_BUILD_DIR``, which ``build_static`` then hashes and collects.
+    Prints a size report comparing each original with its largest variant
+    per format, and the totals.
+    """
+
+    help = "Generate responsive AVIF and WebP variants of the static images."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--widths", type=int, nargs="+", default=list(WIDTHS))
+        parser.add_argument(
+            "--output",
+            type=Path,
+            default=None,
+            help="Defaults to the IMAGE_BUILD_DIR setting.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        output_dir = options["output"] or Path(settings.IMAGE_BUILD_DIR)
+        start = time.perf_counter()
+        index = build_variants(raster_sources(), output_dir, options["widths"])
+        elapsed = time.perf_counter() - start
+
+        self.stdout.write(
+            f"{'image':<32} {'original':>10} {'avif':>10} {'webp':>10}  widths"
+        )
+        totals = {"original": 0, "avif": 0, "webp": 0}
+        for name, entry in index.items():
+            largest = {
+                fmt: variants[-1]["bytes"]
+                for fmt, variants in entry["variants"].items()
+            }
+            totals["original"] += entry["bytes"]
+            for fmt, size in largest.items():
+                totals[fmt] += size
+            widths = ",".join(str(v["width"]) for v in entry["variants"]["webp"])
+            self.stdout.write(
+                f"{name:<32} {entry['bytes'] / 1024:>8.0f}KB "
+                f"{largest['avif'] / 1024:>8.0f}KB {largest['webp'] / 1024:>8.0f}KB  "
+                f"{widths}"
+            )
+        self.stdout.write(
+            f"{'total (full width)':<32} {totals['original'] / 1024:>8.0f}KB "
+            f"{totals['avif'] / 1024:>8.0f}KB {totals['webp'] / 1024:>8.0f}KB"
+        )
+        self.stdout.write(
+            f"Built {len(index)} images in {elapsed:.1f}s into {output_dir}"
+        )
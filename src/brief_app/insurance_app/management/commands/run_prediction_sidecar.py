@@ -0,0 +1,40 @@
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from insurance_app.sidecar import SidecarServer
+from insurance_app.warmup import warm_up_models
+
+
+class Command(BaseCommand):
+    """Serves both prediction models to local workers over a Unix socket."""
+
+    help = "Run the prediction sidecar shared by every Gunicorn worker."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--socket",
+            default=getattr(settings, "PREDICTION_SIDECAR_SOCKET", ""),
+            help="Socket path (default: settings.PREDICTION_SIDECAR_SOCKET).",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        path = options["socket"]
+        if not path:
+            raise CommandError("Pass --socket or set PREDICTION_SIDECAR_SOCKET")
+
+        report = warm_up_models(freeze=True)
+        server = SidecarServer(path)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Prediction sidecar listening on {path} "
+                f"(models warm in {report['warm_up_ms']:.1f} ms)"
+            )
+        )
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
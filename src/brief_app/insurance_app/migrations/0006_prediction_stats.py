@@ -0,0 +1,81 @@
+# Generated by Django 5.2.1 on 2026-10-18 09:41
+
+import django.db.models.deletion
+from decimal import Decimal
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Max, Min, OuterRef, Subquery, Sum
+
+
+def backfill_stats(apps, schema_editor):
+    """Computes the stats of every user who already has predictions, in one query."""
+    PredictionHistory = apps.get_model("insurance_app", "PredictionHistory")
+    PredictionStats = apps.get_model("insurance_app", "PredictionStats")
+    latest = PredictionHistory.objects.filter(user_id=OuterRef("user_id")).order_by(
+        "-timestamp", "-id"
+    )
+    totals = (
+        PredictionHistory.objects.order_by()
+        .values("user_id")
+        .annotate(
+            count=Count("id"),
+            total_charges=Sum("predicted_charges"),
+            min_charges=Min("predicted_charges"),
+            max_charges=Max("predicted_charges"),
+            last_charges=Subquery(latest.values("predicted_charges")[:1]),
+            last_timestamp=Subquery(latest.values("timestamp")[:1]),
+        )
+    )
+    PredictionStats.objects.bulk_create(
+        (PredictionStats(**row) for row in totals.iterator()), batch_size=1000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("insurance_app", "0005_availability"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PredictionStats",
+            fields=[
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="prediction_stats",
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                ("count", models.PositiveIntegerField(default=0)),
+                (
+                    "total_charges",
+                    models.DecimalField(
+                        decimal_places=2, default=Decimal("0"), max_digits=16
+                    ),
+                ),
+                (
+                    "min_charges",
+                    models.DecimalField(decimal_places=2, max_digits=10, null=True),
+                ),
+                (
+                    "max_charges",
+                    models.DecimalField(decimal_places=2, max_digits=10, null=True),
+                ),
+                (
+                    "last_charges",
+                    models.DecimalField(decimal_places=2, max_digits=10, null=True),
+                ),
+                ("last_timestamp", models.DateTimeField(null=True)),
+            ],
+            options={
+                "verbose_name": "Prediction statistics",
+                "verbose_name_plural": "Prediction statistics",
+            },
+        ),
+        migrations.RunPython(backfill_stats, migrations.RunPython.noop),
+    ]
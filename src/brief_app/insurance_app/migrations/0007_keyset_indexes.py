@@ -0,0 +1,30 @@
+# Generated by Django 5.2.1 on 2026-10-18 09:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("insurance_app", "0006_prediction_stats"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="predictionhistory",
+            name="insurance_a_user_id_e18215_idx",
+        ),
+        migrations.AddIndex(
+            model_name="contactmessage",
+            index=models.Index(
+                fields=["-submitted_at", "-id"], name="insurance_a_submitt_52e2fc_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="predictionhistory",
+            index=models.Index(
+                fields=["user", "-timestamp", "-id"],
+                name="insurance_a_user_id_bbd498_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.1 on 2026-10-18 09:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("insurance_app", "0007_keyset_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="appointment",
+            index=models.Index(
+                fields=["date", "time"], name="insurance_a_date_bd6f67_idx"
+            ),
+        ),
+    ]
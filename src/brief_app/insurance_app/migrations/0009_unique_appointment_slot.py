@@ -0,0 +1,49 @@
+# Generated by Django 5.2.1 on 2026-10-18 09:57
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def check_double_bookings(apps, schema_editor):
+    """Refuses to migrate while any slot is booked more than once."""
+    Appointment = apps.get_model("insurance_app", "Appointment")
+    doubles = (
+        Appointment.objects.order_by()
+        .values("date", "time")
+        .annotate(bookings=Count("id"))
+        .filter(bookings__gt=1)
+    )
+    conflicts = {
+        f"{slot['date']} {slot['time']}": list(
+            Appointment.objects.filter(date=slot["date"], time=slot["time"])
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+        for slot in doubles
+    }
+    if conflicts:
+        raise RuntimeError(
+            f"Appointments share a slot: {conflicts}; "
+            "move all but one booking per slot before migrating."
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("insurance_app", "0008_appointment_date_time_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(check_double_bookings, migrations.RunPython.noop),
+        migrations.RemoveIndex(
+            model_name="appointment",
+            name="insurance_a_date_bd6f67_idx",
+        ),
+        migrations.AddConstraint(
+            model_name="appointment",
+            constraint=models.UniqueConstraint(
+                fields=("date", "time"), name="unique_appointment_slot"
+            ),
+        ),
+    ]
@@ -0,0 +1,128 @@
+# Generated by Django 5.2.1 on 2026-10-18 11:20
+
+import insurance_app.slots
+from django.db import migrations, models
+
+SLOT_TIMES = [f"{hour:02d}:00" for hour in range(9, 19)]
+SLOT_INDEX = {time: i for i, time in enumerate(SLOT_TIMES)}
+
+
+def pack_time_slots(apps, schema_editor):
+    """Packs each JSON list of times into a bitmask; off-grid times are dropped."""
+    Availability = apps.get_model("insurance_app", "Availability")
+    rows = list(Availability.objects.only("id", "time_slots"))
+    for row in rows:
+        row.slot_mask = sum(
+            1 << SLOT_INDEX[time] for time in set(row.time_slots) if time in SLOT_INDEX
+        )
+    Availability.objects.bulk_update(rows, ["slot_mask"], batch_size=500)
+
+
+def unpack_time_slots(apps, schema_editor):
+    Availability = apps.get_model("insurance_app", "Availability")
+    rows = list(Availability.objects.only("id", "slot_mask"))
+    for row in rows:
+        row.time_slots = [
+            time for i, time in enumerate(SLOT_TIMES) if row.slot_mask >> i & 1
+        ]
+    Availability.objects.bulk_update(rows, ["time_slots"], batch_size=500)
+
+
+def index_appointment_times(apps, schema_editor):
+    """Stores each appointment time as its slot index."""
+    Appointment = apps.get_model("insurance_app", "Appointment")
+    off_grid = list(
+        Appointment.objects.exclude(time__in=SLOT_TIMES).values_list("id", flat=True)
+    )
+    if off_grid:
+        raise RuntimeError(
+            f"Appointments {off_grid} are not on the 09:00-18:00 hourly grid; "
+            "move or delete them before migrating."
+        )
+    for time, index in SLOT_INDEX.items():
+        Appointment.objects.filter(time=time).update(slot=index)
+
+
+def time_appointment_slots(apps, schema_editor):
+    Appointment = apps.get_model("insurance_app", "Appointment")
+    for time, index in SLOT_INDEX.items():
+        Appointment.objects.filter(slot=index).update(time=time)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("insurance_app", "0009_unique_appointment_slot"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="availability",
+            name="slot_mask",
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.RunPython(pack_time_slots, unpack_time_slots),
+        migrations.RemoveField(
+            model_name="availability",
+            name="time_slots",
+        ),
+        migrations.RenameField(
+            model_name="availability",
+            old_name="slot_mask",
+            new_name="time_slots",
+        ),
+        migrations.AlterField(
+            model_name="availability",
+            name="time_slots",
+            field=insurance_app.slots.SlotMaskField(default=list),
+        ),
+        migrations.RemoveConstraint(
+            model_name="appointment",
+            name="unique_appointment_slot",
+        ),
+        migrations.AddField(
+            model_name="appointment",
+            name="slot",
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.RunPython(index_appointment_times, time_appointment_slots),
+        # Lets the migration be reversed with appointments in the table
+        migrations.AlterField(
+            model_name="appointment",
+            name="time",
+            field=models.CharField(default="09:00", max_length=10),
+        ),
+        migrations.RemoveField(
+            model_name="appointment",
+            name="time",
+        ),
+        migrations.RenameField(
+            model_name="appointment",
+            old_name="slot",
+            new_name="time",
+        ),
+        migrations.AlterField(
+            model_name="appointment",
+            name="time",
+            field=insurance_app.slots.SlotField(
+                choices=[
+                    ("09:00", "09:00"),
+                    ("10:00", "10:00"),
+                    ("11:00", "11:00"),
+                    ("12:00", "12:00"),
+                    ("13:00", "13:00"),
+                    ("14:00", "14:00"),
+                    ("15:00", "15:00"),
+                    ("16:00", "16:00"),
+                    ("17:00", "17:00"),
+                    ("18:00", "18:00"),
+                ]
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="appointment",
+            constraint=models.UniqueConstraint(
+                fields=("date", "time"), name="unique_appointment_slot"
+            ),
+        ),
+    ]
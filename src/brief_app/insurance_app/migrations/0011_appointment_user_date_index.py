@@ -0,0 +1,19 @@
+# Generated by Django 5.2.1 on 2026-10-18 11:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("insurance_app", "0010_slot_storage"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="appointment",
+            index=models.Index(
+                fields=["user", "date", "time"], name="insurance_a_user_id_f95912_idx"
+            ),
+        ),
+    ]
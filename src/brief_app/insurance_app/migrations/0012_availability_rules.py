@@ -0,0 +1,54 @@
+# Generated by Django 5.2.1 on 2026-10-18 12:05
+
+import insurance_app.slots
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("insurance_app", "0011_appointment_user_date_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AvailabilityException",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField(unique=True)),
+                (
+                    "time_slots",
+                    insurance_app.slots.SlotMaskField(blank=True, default=list),
+                ),
+                ("note", models.CharField(blank=True, max_length=100)),
+            ],
+        ),
+        migrations.CreateModel(
+            name="AvailabilityRule",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=100)),
+                ("weekdays", models.PositiveSmallIntegerField(default=31)),
+                ("time_slots", insurance_app.slots.SlotMaskField(default=list)),
+                ("starts_on", models.DateField()),
+                ("ends_on", models.DateField(blank=True, null=True)),
+                ("active", models.BooleanField(default=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,255 @@
+"""Process-wide registry for the pickled prediction pipelines.
+
+Each artifact under ``insurance_app/model`` is unpickled once per worker and
+kept in memory. Entries are keyed by path and versioned by modification time
+and content hash, so replacing a file on disk is picked up by the next
+request without restarting the process.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import pickle
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Set, Union
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+MODEL_DIR = os.path.join(settings.BASE_DIR, "insurance_app", "model")
+
+# Pipeline used by the live quote form (``predict_charges``)
+QUOTE_MODEL = "model_1.pickle"
+# Pipeline used by the logged-in profile form (``PredictChargesView``)
+PROFILE_MODEL = "model.pkl"
+
+
+@dataclass(frozen=True)
+class ModelVersion:
+    """Identity of an artifact on disk.
+
+    Attributes:
+        path (str): Absolute path of the artifact.
+        mtime_ns (int): Modification time in nanoseconds.
+        size (int): File size in bytes.
+        sha256 (str): Hex digest of the file content.
+    """
+
+    path: str
+    mtime_ns: int
+    size: int
+    sha256: str
+
+    @property
+    def tag(self) -> str:
+        """Short version tag derived from the content hash."""
+        return self.sha256[:12]
+
+
+@dataclass
+class LoadedModel:
+    """A model held by the registry together with its version and load timing."""
+
+    model: Any
+    version: ModelVersion
+    loaded_at: float
+    load_seconds: float
+
+
+def resolve_model_path(name: Union[str, os.PathLike]) -> str:
+    """Returns the absolute path of an artifact, relative names being looked up in MODEL_DIR."""
+    path = os.fspath(name)
+    if not os.path.isabs(path):
+        path = os.path.join(MODEL_DIR, path)
+    return os.path.abspath(path)
+
+
+def hash_file(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(65536), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def unpickle(path: str) -> Any:
+    """Default registry loader."""
+    with open(path, "rb") as file:
+        return pickle.load(file)
+
+
+class ModelRegistry:
+    """
+    Thread-safe cache of unpickled models keyed by absolute path.
+
+    Every lookup costs a single ``os.stat``. The file is re-read only when its
+    modification time or size changed, and re-unpickled only when its content
+    hash changed as well. A different ``loader`` can be given to build something
+    else from the artifact, such as its compiled form.
+
+    Methods:
+        get(name):
+            Returns the loaded model for an artifact, loading or reloading it if needed.
+        get_entry(name):
+            Same as ``get`` but returns the LoadedModel with version information.
+        version(name):
+            Returns the short version tag of the currently active artifact.
+        add_listener(callback):
+            Registers a callable invoked with the path whenever an artifact is swapped.
+        stats():
+            Returns load count, cumulative load time and active versions.
+        clear():
+            Drops every loaded model and resets the counters.
+    """
+
+    def __init__(self, loader: Callable[[str], Any] = unpickle) -> None:
+        self._loader = loader
+        self._entries: Dict[str, LoadedModel] = {}
+        self._lock = threading.RLock()
+        self._listeners: List[Callable[[str], None]] = []
+        self.load_count = 0
+        self.load_seconds = 0.0
+
+    def get(self, name: Union[str, os.PathLike]) -> Any:
+        return self.get_entry(name).model
+
+    def get_entry(self, name: Union[str, os.PathLike]) -> LoadedModel:
+        path = resolve_model_path(name)
+        stat = os.stat(path)
+        entry = self._entries.get(path)
+        if entry is not None and self._is_current(entry.version, stat):
+            return entry
+
+        with self._lock:
+            # Another thread may have reloaded while we waited for the lock
+            entry = self._entries.get(path)
+            stat = os.stat(path)
+            if entry is not None and self._is_current(entry.version, stat):
+                return entry
+            return self._load(path, stat, entry)
+
+    def version(self, name: Union[str, os.PathLike]) -> str:
+        return self.get_entry(name).version.tag
+
+    def add_listener(self, callback: Callable[[str], None]) -> None:
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "load_count": self.load_count,
+                "load_seconds": round(self.load_seconds, 6),
+                "models": {
+                    os.path.basename(path): {
+                        "path": path,
+                        "version": entry.version.tag,
+                        "sha256": entry.version.sha256,
+                        "mtime_ns": entry.version.mtime_ns,
+                        "loaded_at": entry.loaded_at,
+                        "load_seconds": round(entry.load_seconds, 6),
+                    }
+                    for path, entry in self._entries.items()
+                },
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            paths = list(self._entries)
+            self._entries.clear()
+            self.load_count = 0
+            self.load_seconds = 0.0
+        for path in paths:
+            self._notify(path)
+
+    @staticmethod
+    def _is_current(version: ModelVersion, stat: os.stat_result) -> bool:
+        return version.mtime_ns == stat.st_mtime_ns and version.size == stat.st_size
+
+    def _load(
+        self, path: str, stat: os.stat_result, previous: Optional[LoadedModel]
+    ) -> LoadedModel:
+        sha256 = hash_file(path)
+        version = ModelVersion(
+            path=path, mtime_ns=stat.st_mtime_ns, size=stat.st_size, sha256=sha256
+        )
+
+        # Touched but unchanged content: keep the object already in memory
+        if previous is not None and previous.version.sha256 == sha256:
+            entry = LoadedModel(
+                model=previous.model,
+                version=version,
+                loaded_at=previous.loaded_at,
+                load_seconds=previous.load_seconds,
+            )
+            self._entries[path] = entry
+            return entry
+
+        start = time.perf_counter()
+        model = self._loader(path)
+        elapsed = time.perf_counter() - start
+
+        entry = LoadedModel(
+            model=model, version=version, loaded_at=time.time(), load_seconds=elapsed
+        )
+        self._entries[path] = entry
+        self.load_count += 1
+        self.load_seconds += elapsed
+        logger.info(
+            "Loaded model %s version %s in %.1f ms",
+            os.path.basename(path),
+            version.tag,
+            elapsed * 1000,
+        )
+        if previous is not None:
+            self._notify(path)
+        return entry
+
+    def _notify(self, path: str) -> None:
+        for callback in list(self._listeners):
+            try:
+                callback(path)
+            except Exception:
+                logger.exception("Model registry listener failed for %s", path)
+
+
+registry = ModelRegistry()
+
+# Artifacts we already warned about falling back to the pickled pipeline for
+_compiled_fallbacks: Set[Union[str, os.PathLike]] = set()
+
+
+def get_model(name: Union[str, os.PathLike]) -> Any:
+    """Returns the shared, already unpickled model for an artifact name or path."""
+    return registry.get(name)
+
+
+def get_predictor_entry(name: Union[str, os.PathLike]) -> LoadedModel:
+    """
+    Returns the registry entry the views should call ``predict`` on for an artifact.
+
+    With ``settings.USE_COMPILED_MODELS`` this is the exported CompiledModel, which
+    needs neither sklearn nor unpickling. Without it, or when no up-to-date export
+    exists, it is the pickled pipeline from the registry. Both are versioned by
+    the content hash of the pickle.
+    """
+    if getattr(settings, "USE_COMPILED_MODELS", False):
+        from .compiled import StaleCompiledModel, compiled_registry
+
+        try:
+            return compiled_registry.get_entry(name)
+        except (FileNotFoundError, StaleCompiledModel) as e:
+            if name not in _compiled_fallbacks:
+                _compiled_fallbacks.add(name)
+                logger.warning("Compiled model unavailable for %s: %s", name, e)
+    return registry.get_entry(name)
+
+
+def get_predictor(name: Union[str, os.PathLike]) -> Any:
+    """Returns the model from ``get_predictor_entry``."""
+    return get_predictor_entry(name).model
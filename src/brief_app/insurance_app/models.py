@@ -1,12 +1,17 @@
 from __future__ import annotations
-from typing import List, Tuple
+from typing import Any, List, Optional, Tuple
 from datetime import date
+from decimal import Decimal
 
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Count, F, Max, Min, Sum, Value
+from django.db.models.functions import Coalesce, Greatest, Least
 from django.contrib.auth.models import AbstractUser
 from django.db.models import Manager
 from django.contrib.auth import get_user_model
 
+from .slots import SlotField, SlotMaskField
+
 
 class UserProfile(AbstractUser):
     """Extends the default Django user model to include additional personal information
@@ -113,7 +118,10 @@ class PredictionHistory(models.Model):
         ordering: List[str] = ["-timestamp"]
         verbose_name: str = "Insurance Prediction"
         verbose_name_plural: str = "Insurance Predictions"
-        indexes: List[models.Index] = [models.Index(fields=["user", "-timestamp"])]
+        # Serves the keyset pages of the history view, ordered by (timestamp, id)
+        indexes: List[models.Index] = [
+            models.Index(fields=["user", "-timestamp", "-id"])
+        ]
 
     @property
     def bmi(self) -> float:
@@ -122,10 +130,121 @@ class PredictionHistory(models.Model):
             return 0.0
         return round(self.weight / ((self.height / 100) ** 2), 1)
 
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        """Saves the prediction and, for a new one, adds it to the user's stats."""
+        if not self._state.adding:
+            super().save(*args, **kwargs)
+            return
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            PredictionStats.record(self)
+
     def __str__(self) -> str:
         return f"{self.user} prediction @ {self.timestamp:%Y-%m-%d}"
 
 
+class PredictionStats(models.Model):
+    """
+    Running totals of a user's prediction history, one row per user.
+
+    Updated in the same transaction as every new PredictionHistory row (see
+    ``PredictionHistory.save``), so pages show the totals with one primary
+    key lookup instead of aggregating the history. ``bulk_create`` and
+    deletions bypass it; ``rebuild`` recomputes a user's row from scratch.
+
+    Attributes:
+        user (OneToOneField): The user, also the primary key.
+        count (PositiveIntegerField): Number of predictions.
+        total_charges, min_charges, max_charges (DecimalField): Sum, lowest
+            and highest predicted charges.
+        last_charges (DecimalField), last_timestamp (DateTimeField): The
+            latest prediction.
+    """
+
+    user: models.OneToOneField = models.OneToOneField(
+        UserProfile,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="prediction_stats",
+    )
+    count: models.PositiveIntegerField = models.PositiveIntegerField(default=0)
+    total_charges: models.DecimalField = models.DecimalField(
+        max_digits=16, decimal_places=2, default=Decimal("0")
+    )
+    min_charges: models.DecimalField = models.DecimalField(
+        max_digits=10, decimal_places=2, null=True
+    )
+    max_charges: models.DecimalField = models.DecimalField(
+        max_digits=10, decimal_places=2, null=True
+    )
+    last_charges: models.DecimalField = models.DecimalField(
+        max_digits=10, decimal_places=2, null=True
+    )
+    last_timestamp: models.DateTimeField = models.DateTimeField(null=True)
+
+    class Meta:
+        verbose_name: str = "Prediction statistics"
+        verbose_name_plural: str = "Prediction statistics"
+
+    @property
+    def average_charges(self) -> Optional[Decimal]:
+        if not self.count:
+            return None
+        return self.total_charges / self.count
+
+    @classmethod
+    def for_user(cls, user: UserProfile) -> PredictionStats:
+        """Returns the user's stats, or empty ones if they never predicted."""
+        stats = cls.objects.filter(user=user).first()
+        return stats if stats is not None else cls(user=user)
+
+    @classmethod
+    def record(cls, prediction: PredictionHistory) -> None:
+        """
+        Adds one new prediction to its user's stats.
+
+        A single UPDATE with F() expressions, so concurrent predictions of the
+        same user cannot lose each other's increments.
+        """
+        charges = Decimal(str(prediction.predicted_charges)).quantize(Decimal("0.01"))
+        cls.objects.get_or_create(user_id=prediction.user_id)
+        cls.objects.filter(user_id=prediction.user_id).update(
+            count=F("count") + 1,
+            total_charges=F("total_charges") + charges,
+            min_charges=Least(Coalesce("min_charges", Value(charges)), Value(charges)),
+            max_charges=Greatest(
+                Coalesce("max_charges", Value(charges)), Value(charges)
+            ),
+            last_charges=charges,
+            last_timestamp=prediction.timestamp,
+        )
+
+    @classmethod
+    def rebuild(cls, user: UserProfile) -> PredictionStats:
+        """Recomputes the user's stats from their whole prediction history."""
+        history = PredictionHistory.objects.filter(user=user)
+        totals = history.aggregate(
+            count=Count("id"),
+            total_charges=Sum("predicted_charges"),
+            min_charges=Min("predicted_charges"),
+            max_charges=Max("predicted_charges"),
+        )
+        last = history.order_by("-timestamp", "-id").first()
+        stats, _ = cls.objects.update_or_create(
+            user=user,
+            defaults={
+                **totals,
+                "total_charges": totals["total_charges"] or Decimal("0"),
+                "last_charges": last.predicted_charges if last else None,
+                "last_timestamp": last.timestamp if last else None,
+            },
+        )
+        return stats
+
+    def __str__(self) -> str:
+        return f"{self.user} prediction stats ({self.count})"
+
+
 class JobApplication(models.Model):
     """Job application submitted by a candidate."""
 
@@ -161,20 +280,61 @@ class ContactMessage(models.Model):
     message: models.TextField = models.TextField()
     submitted_at: models.DateTimeField = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        # Serves the keyset pages of the staff message list
+        indexes: List[models.Index] = [models.Index(fields=["-submitted_at", "-id"])]
+
     def __str__(self) -> str:
         return f"Message from {self.name} ({self.email})"
 
 
 class Availability(models.Model):
-    """Availability of time slots for a specific date."""
+    """Availability of time slots for a specific date.
+
+    ``time_slots`` reads and writes a list of "HH:00" times; the column is a
+    bitmask over the slot grid (see ``insurance_app.slots``).
+    """
 
     date: models.DateField = models.DateField(unique=True)
-    time_slots: models.JSONField = models.JSONField(default=list)
+    time_slots: SlotMaskField = SlotMaskField(default=list)
 
     def __str__(self) -> str:
         return f"{self.date} - {', '.join(self.time_slots)}"
 
 
+class AvailabilityRule(models.Model):
+    """A weekly recurring set of slots, e.g. Mon-Fri 09:00-18:00.
+
+    ``weekdays`` is a bitmask with bit ``i`` for ``date.weekday() == i``
+    (Monday is bit 0). Rules are turned into ``Availability`` rows by
+    ``insurance_app.recurrence.materialize``.
+    """
+
+    name: models.CharField = models.CharField(max_length=100)
+    weekdays: models.PositiveSmallIntegerField = models.PositiveSmallIntegerField(
+        default=0b0011111  # Monday to Friday
+    )
+    time_slots: SlotMaskField = SlotMaskField(default=list)
+    starts_on: models.DateField = models.DateField()
+    # Open-ended when empty
+    ends_on: models.DateField = models.DateField(null=True, blank=True)
+    active: models.BooleanField = models.BooleanField(default=True)
+
+    def __str__(self) -> str:
+        return self.name
+
+
+class AvailabilityException(models.Model):
+    """A date whose slots replace those of the rules; no slots means closed."""
+
+    date: models.DateField = models.DateField(unique=True)
+    time_slots: SlotMaskField = SlotMaskField(default=list, blank=True)
+    note: models.CharField = models.CharField(max_length=100, blank=True)
+
+    def __str__(self) -> str:
+        return f"{self.date} - {', '.join(self.time_slots) or 'closed'}"
+
+
 class Appointment(models.Model):
     """Appointment made by a user."""
 
@@ -189,7 +349,18 @@ class Appointment(models.Model):
     )
     reason: models.CharField = models.CharField(max_length=50, choices=REASON_CHOICES)
     date: models.DateField = models.DateField(default=date(2025, 2, 3))
-    time: models.CharField = models.CharField(max_length=10)
+    # "HH:00" in Python, the slot's index in the grid in the database
+    time: SlotField = SlotField()
+
+    class Meta:
+        # One appointment per (date, slot); also serves the booked-slot lookups
+        constraints: List[models.BaseConstraint] = [
+            models.UniqueConstraint(
+                fields=["date", "time"], name="unique_appointment_slot"
+            )
+        ]
+        # A user's upcoming and past appointments, read in either direction
+        indexes: List[models.Index] = [models.Index(fields=["user", "date", "time"])]
 
     def __str__(self) -> str:
         return f"{self.reason} on {self.date} at {self.time}"
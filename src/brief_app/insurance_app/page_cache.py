@@ -0,0 +1,111 @@
+"""Full-page cache for anonymous visitors of the static marketing pages.
+
+Django's ``cache_page`` keys entries on every header named in ``Vary``, and
+these pages vary on ``Cookie`` (the session middleware adds it as soon as the
+header reads ``user``). Any cookie, such as ``csrftoken`` from an earlier
+form or an analytics cookie, would give every visitor their own entry.
+
+The only cookies that change these pages are the session (who is logged in)
+and the messages cookie, so ``AnonymousPageCacheMixin`` keys the entry on the
+host and path alone and only uses it for requests that carry neither. The
+pages take no query parameters, so the query string is left out of the key
+unless a view allow-lists parameters in ``page_cache_params``; otherwise
+``?x=<random>`` would store a new copy of the page on every request. Responses that
+would set a cookie (a CSRF token was rendered, the session was modified) are
+never stored. Every response keeps ``Vary: Cookie``, so browsers and shared
+caches still keep the anonymous and logged-in versions apart.
+"""
+
+import hashlib
+from typing import Any, Dict, Iterable, Tuple
+
+from django.conf import settings
+from django.contrib.messages.storage.cookie import CookieStorage
+from django.core.cache import caches
+from django.http import HttpRequest, HttpResponse
+from django.utils.cache import has_vary_header, patch_vary_headers
+
+KEY_PREFIX = "page"
+
+
+def page_cache_key(request: HttpRequest, params: Iterable[str] = ()) -> str:
+    """Keys a page on its host, path and the allow-listed query parameters."""
+    url = request.build_absolute_uri(request.path)
+    query = [(name, request.GET.getlist(name)) for name in sorted(params)]
+    if any(values for _, values in query):
+        url += "?" + repr(query)
+    return f"{KEY_PREFIX}:{hashlib.md5(url.encode()).hexdigest()}"
+
+
+def is_anonymous_request(request: HttpRequest) -> bool:
+    """Whether the page can only render as it does for a new visitor."""
+    return request.method in ("GET", "HEAD") and not (
+        settings.SESSION_COOKIE_NAME in request.COOKIES
+        or CookieStorage.cookie_name in request.COOKIES
+    )
+
+
+def is_cacheable_response(request: HttpRequest, response: HttpResponse) -> bool:
+    """Whether ``response`` is the same for every anonymous visitor."""
+    session = getattr(request, "session", None)
+    return (
+        response.status_code == 200
+        and not response.streaming
+        and not response.cookies
+        and not has_vary_header(response, "*")
+        and "private" not in response.get("Cache-Control", "")
+        # A rendered {% csrf_token %} makes the middleware set a cookie
+        and not request.META.get("CSRF_COOKIE_NEEDS_UPDATE")
+        and not (session is not None and session.modified)
+    )
+
+
+class AnonymousPageCacheMixin:
+    """
+    Serves ``GET`` requests of anonymous visitors from the page cache.
+
+    Attributes:
+        page_cache_timeout (Optional[int]): Seconds to keep a page; defaults
+            to the ``PAGE_CACHE_TIMEOUT`` setting, and 0 disables the cache.
+        page_cache_params (Tuple[str, ...]): Query parameters that change the
+            page and so get their own entries; all others are ignored.
+    """
+
+    page_cache_timeout = None
+    page_cache_params: Tuple[str, ...] = ()
+
+    def get_page_cache_timeout(self) -> int:
+        if self.page_cache_timeout is not None:
+            return self.page_cache_timeout
+        return getattr(settings, "PAGE_CACHE_TIMEOUT", 0)
+
+    def dispatch(self, request: HttpRequest, *args: Any, **kwargs: Any) -> Any:
+        timeout = self.get_page_cache_timeout()
+        if not timeout or not is_anonymous_request(request):
+            response = super().dispatch(request, *args, **kwargs)
+            patch_vary_headers(response, ("Cookie",))
+            return response
+
+        cache = caches[getattr(settings, "PAGE_CACHE_ALIAS", "default")]
+        key = page_cache_key(request, self.page_cache_params)
+        response = cache.get(key)
+        if response is not None:
+            return response
+
+        response = super().dispatch(request, *args, **kwargs)
+        patch_vary_headers(response, ("Cookie",))
+
+        def store(rendered: HttpResponse) -> None:
+            if is_cacheable_response(request, rendered):
+                cache.set(key, rendered, timeout)
+
+        if hasattr(response, "render") and callable(response.render):
+            response.add_post_render_callback(store)
+        else:
+            store(response)
+        return response
+
+
+def page_cache_settings(request: HttpRequest) -> Dict[str, Any]:
+    """Context processor exposing the timeout of the cached header fragment."""
+    return {"page_cache_timeout": getattr(settings, "PAGE_CACHE_TIMEOUT", 0)}
@@ -0,0 +1,184 @@
+"""Keyset (cursor) pagination for the long, time-ordered lists.
+
+``CursorPaginator`` pages a queryset on a unique ordering such as
+``("-timestamp", "-id")``. A page is one query, ``WHERE (timestamp, id) <
+(last seen) ORDER BY timestamp DESC, id DESC LIMIT per_page + 1``, which a
+composite index on the ordering answers by seeking to the cursor and reading
+just those rows. Unlike
+Django's ``Paginator`` there is no ``COUNT(*)`` and no ``OFFSET``, so page
+1000 costs the same as page 1.
+
+Cursors are the ordering values of the first or last row of a page, signed
+with ``django.core.signing`` so they are opaque to clients and cannot be
+forged into arbitrary filters. The ordering fields must be concrete,
+non-nullable fields of the model, the last one unique (usually ``id``).
+"""
+
+from typing import Any, Iterator, List, Optional, Sequence, Tuple
+
+from django.core import signing
+from django.core.exceptions import ValidationError
+from django.db.models import Model, Q, QuerySet
+
+SALT = "insurance_app.pagination"
+
+
+class InvalidCursor(Exception):
+    """Raised when a cursor token is malformed, tampered with or stale."""
+
+
+class CursorPage:
+    """
+    One page of a ``CursorPaginator``.
+
+    Attributes:
+        object_list (List[Model]): The rows of the page, in the paginator's
+            ordering.
+        next_cursor (Optional[str]): Token of the following page, or None on
+            the last page.
+        previous_cursor (Optional[str]): Token of the preceding page, or None
+            on the first page.
+    """
+
+    def __init__(
+        self,
+        object_list: List[Model],
+        next_cursor: Optional[str],
+        previous_cursor: Optional[str],
+    ) -> None:
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __iter__(self) -> Iterator[Model]:
+        return iter(self.object_list)
+
+    def __len__(self) -> int:
+        return len(self.object_list)
+
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    def has_previous(self) -> bool:
+        return self.previous_cursor is not None
+
+    def has_other_pages(self) -> bool:
+        return self.has_next() or self.has_previous()
+
+
+class CursorPaginator:
+    """
+    Pages a queryset with keyset conditions instead of ``OFFSET``.
+
+    Args:
+        queryset (QuerySet): The rows to page; its own ordering is replaced.
+        ordering (Sequence[str]): Field names, ``-`` for descending, whose
+            combined values are unique, e.g. ``("-submitted_at", "-id")``.
+        per_page (int): Rows per page.
+    """
+
+    def __init__(
+        self, queryset: QuerySet, ordering: Sequence[str], per_page: int
+    ) -> None:
+        self.queryset = queryset
+        self.ordering = tuple(ordering)
+        self.per_page = per_page
+        self.fields = [
+            queryset.model._meta.get_field(name.lstrip("-")) for name in ordering
+        ]
+
+    def page(self, cursor: Optional[str] = None) -> CursorPage:
+        """
+        Returns the page a cursor points to.
+
+        Args:
+            cursor (Optional[str]): A ``next_cursor`` or ``previous_cursor``
+                from an earlier page; None for the first page.
+
+        Returns:
+            CursorPage: The page, with the cursors of its neighbours.
+
+        Raises:
+            InvalidCursor: If the cursor was not issued by this paginator.
+        """
+        if cursor is None:
+            backwards, values = False, None
+        else:
+            backwards, values = self.decode(cursor)
+
+        ordering = self._reverse(self.ordering) if backwards else self.ordering
+        rows = self.queryset.order_by(*ordering)
+        if values is not None:
+            rows = rows.filter(self._after(ordering, values))
+        rows = list(rows[: self.per_page + 1])
+
+        more = len(rows) > self.per_page
+        rows = rows[: self.per_page]
+        if backwards:
+            rows.reverse()
+            has_previous, has_next = more, True
+        else:
+            has_previous, has_next = values is not None, more
+        return CursorPage(
+            rows,
+            self.encode(rows[-1], False) if rows and has_next else None,
+            self.encode(rows[0], True) if rows and has_previous else None,
+        )
+
+    def encode(self, row: Model, backwards: bool) -> str:
+        """Returns the token of the page that starts after (or ends before) a row."""
+        values = [self._serialize(getattr(row, field.attname)) for field in self.fields]
+        return signing.dumps(
+            {"o": self.ordering, "b": backwards, "v": values}, salt=SALT, compress=True
+        )
+
+    def decode(self, cursor: str) -> Tuple[bool, List[Any]]:
+        """
+        Verifies a token and returns its direction and ordering values.
+
+        Raises:
+            InvalidCursor: If the signature, the ordering or a value is wrong.
+        """
+        try:
+            data = signing.loads(cursor, salt=SALT)
+            if tuple(data["o"]) != self.ordering or len(data["v"]) != len(self.fields):
+                raise InvalidCursor("Cursor belongs to a different ordering.")
+            values = [
+                field.to_python(value) for field, value in zip(self.fields, data["v"])
+            ]
+            return bool(data["b"]), values
+        except (
+            signing.BadSignature,
+            ValidationError,
+            KeyError,
+            TypeError,
+            ValueError,
+        ) as e:
+            raise InvalidCursor(str(e)) from e
+
+    def _after(self, ordering: Sequence[str], values: Sequence[Any]) -> Q:
+        # (a, b, c) > (x, y, z) as an OR of prefixes, each ending in a strict
+        # comparison. The OR alone makes SQLite scan the index from the top;
+        # the redundant a >= x in front lets it seek to the cursor instead.
+        condition = Q()
+        for i, name in enumerate(ordering):
+            q = Q(**{self.fields[j].name: values[j] for j in range(i)})
+            lookup = "lt" if name.startswith("-") else "gt"
+            q &= Q(**{f"{self.fields[i].name}__{lookup}": values[i]})
+            condition |= q
+        lookup = "lte" if ordering[0].startswith("-") else "gte"
+        return Q(**{f"{self.fields[0].name}__{lookup}": values[0]}) & condition
+
+    @staticmethod
+    def _reverse(ordering: Sequence[str]) -> Tuple[str, ...]:
+        return tuple(
+            name[1:] if name.startswith("-") else f"-{name}" for name in ordering
+        )
+
+    @staticmethod
+    def _serialize(value: Any) -> Any:
+        # Dates and datetimes round-trip through str() and field.to_python()
+        # with full precision; DjangoJSONEncoder would drop microseconds.
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return value
+        return str(value)
@@ -0,0 +1,44 @@
+"""The prediction stack, imported on first use.
+
+Everything the views need that pulls in NumPy, pandas or scikit-learn is
+re-exported here, and ``views.py`` only imports this module inside the views
+that predict. Booting Django, loading the URLconf, running ``manage.py`` and
+serving pages such as ``HomeView`` or ``JoinUsView`` therefore never pay for
+the scientific stack; the first quote does, unless Gunicorn already warmed it
+up in the master (see ``warmup.py``).
+
+``app_tests/test_import_time.py`` fails if booting Django imports any of them.
+"""
+
+from .compiled import compiled_registry
+from .features import (
+    categorize_age,
+    categorize_bmi,
+    encode_profiles,
+    score_profiles,
+    to_frame,
+)
+from .prediction_cache import cached_prediction, prediction_cache
+from .quotes import (
+    iter_ndjson,
+    max_rows,
+    parse_quote,
+    predict_quote,
+    score_quotes,
+)
+
+__all__ = [
+    "cached_prediction",
+    "categorize_age",
+    "categorize_bmi",
+    "compiled_registry",
+    "encode_profiles",
+    "iter_ndjson",
+    "max_rows",
+    "parse_quote",
+    "predict_quote",
+    "prediction_cache",
+    "score_profiles",
+    "score_quotes",
+    "to_frame",
+]
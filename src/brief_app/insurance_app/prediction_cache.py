@@ -0,0 +1,185 @@
+"""Bounded in-process cache of quote predictions.
+
+The live quote form posts to ``/quote-predict/`` on every input change, so the
+same applicant is scored over and over while a field is being adjusted. Both
+quote views look predictions up here first, keyed on the version of the
+model that produced them and on the inputs its ColumnTransformer reads. Inputs
+the model ignores (the quote form's height and weight) are left out of the key.
+For models that read the BMI directly, it is rounded to the quote table's 0.1
+step and the model scores that rounded BMI, so the cached value is exactly the
+one the key describes. Models that derive features from the raw inputs, like
+the profile model's BMI category, are keyed on their exact inputs. The cache
+is cleared whenever the model registry swaps an artifact.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Mapping, Set, Tuple
+
+from django.conf import settings
+
+from .compiled import compiled_registry
+from .model_registry import get_predictor_entry, registry
+from .quote_table import quantize_bmi
+
+DEFAULT_MAXSIZE = 4096
+DEFAULT_TTL = 3600.0
+
+
+class PredictionCache:
+    """
+    Thread-safe LRU cache with a per-entry time to live.
+
+    Attributes:
+        maxsize (int): Maximum number of entries, the least recently used is evicted.
+        ttl (float): Seconds after which an entry is recomputed, 0 disables expiry.
+        hits (int): Number of lookups answered from the cache.
+        misses (int): Number of lookups that had to compute the value.
+
+    Methods:
+        get_or_compute(key, compute):
+            Returns the cached value for key, calling compute() on a miss.
+        clear():
+            Drops every entry, keeping the counters.
+        stats():
+            Returns size, hits, misses and hit rate.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE, ttl: float = DEFAULT_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        now = time.monotonic()
+        with self._lock:
+            item = self._data.get(key)
+            if item is not None and (not self.ttl or now - item[0] < self.ttl):
+                self._data.move_to_end(key)
+                self.hits += 1
+                return item[1]
+            self.misses += 1
+
+        # Computed outside the lock; errors propagate and are not cached
+        value = compute()
+
+        with self._lock:
+            self._data[key] = (now, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return value
+
+    def clear(self, *args: Any) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+            }
+
+
+prediction_cache = PredictionCache(
+    maxsize=int(getattr(settings, "PREDICTION_CACHE_SIZE", DEFAULT_MAXSIZE)),
+    ttl=float(getattr(settings, "PREDICTION_CACHE_TTL", DEFAULT_TTL)),
+)
+
+# A swapped artifact makes every cached prediction stale
+registry.add_listener(prediction_cache.clear)
+compiled_registry.add_listener(prediction_cache.clear)
+
+
+def feature_columns(model: Any) -> Set[str]:
+    """
+    Returns the input columns a model's ColumnTransformer reads.
+
+    Walks nested Pipelines like ``quotes.known_categories``; compiled models
+    list the columns of their input blocks. Empty when the model does not
+    select columns by name.
+    """
+    if hasattr(model, "blocks"):
+        return {column for block in model.blocks for column in block.columns}
+    found: Set[str] = set()
+    steps = list(getattr(model, "steps", []))
+    while steps:
+        _, step = steps.pop(0)
+        steps.extend(getattr(step, "steps", []))
+        for _, transformer, columns in getattr(step, "transformers_", []):
+            if transformer == "drop" or not isinstance(columns, list):
+                continue
+            found.update(column for column in columns if isinstance(column, str))
+    return found
+
+
+def canonical_inputs(model: Any, inputs: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Returns the inputs a model is scored on, with the BMI on the 0.1 grid.
+
+    The BMI is only rounded when the model reads it as a column; models fed
+    derived features (the profile model encodes its own BMI category from the
+    raw profile fields) get their inputs unchanged, since rounding could move
+    a BMI across a category boundary.
+    """
+    canonical = dict(inputs)
+    columns = feature_columns(model)
+    if "bmi" in columns and columns <= inputs.keys() and inputs["bmi"] is not None:
+        canonical["bmi"] = quantize_bmi(inputs["bmi"])
+    return canonical
+
+
+def cache_key(name: str, entry: Any, inputs: Mapping[str, Any]) -> Hashable:
+    """
+    Builds the cache key of ``canonical_inputs`` for a loaded artifact.
+
+    Only the inputs the model reads are kept. Models fed derived features are
+    keyed on every input.
+    """
+    columns = feature_columns(entry.model)
+    if not columns or not columns <= inputs.keys():
+        columns = set(inputs)
+    return (
+        name,
+        entry.version.tag,
+        type(entry.model).__name__,
+        tuple(sorted((column, inputs[column]) for column in columns)),
+    )
+
+
+def cached_prediction(
+    name: str,
+    inputs: Mapping[str, Any],
+    predict: Callable[[Any, Dict[str, Any]], float],
+) -> float:
+    """
+    Returns ``predict(model, row)`` for an applicant, reusing an earlier result.
+
+    Args:
+        name (str): Artifact name passed to ``get_predictor_entry``.
+        inputs (Mapping[str, Any]): Parsed, typed model inputs. The ones the
+            model reads form the cache key together with the model version and
+            backend, so callers must convert numbers before calling.
+        predict (Callable[[Any, Dict[str, Any]], float]): Scores ``row``, the
+            ``canonical_inputs`` of the applicant, with the given model.
+
+    Returns:
+        float: The prediction.
+    """
+    entry = get_predictor_entry(name)
+    row = canonical_inputs(entry.model, inputs)
+    return prediction_cache.get_or_compute(
+        cache_key(name, entry, row), lambda: predict(entry.model, row)
+    )
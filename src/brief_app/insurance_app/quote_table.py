@@ -0,0 +1,370 @@
+"""Precomputed premiums for the whole discrete quote space.
+
+Every input of the quote model is bounded: age and children are small integers,
+sex, smoker and region are enums, and BMI can be quantized to one decimal. The
+public form derives the BMI category from the BMI, so it adds no dimension of
+its own. ``build_quote_table`` scores the full grid once and stores the
+premiums, in cents, as ``<artifact>.grid.npy`` next to the pickle with the axes
+and the pickle's content hash in ``<artifact>.grid.json``.
+
+With ``settings.USE_QUOTE_TABLE`` the quote endpoint answers from a read-only
+memory map of that file with a single array index. Requests outside the grid,
+or whose BMI category does not match their BMI, still go to the model. Tables
+are built offline by the management command or the Gunicorn warm-up; when a
+request finds the table missing or built from another pickle, it is rebuilt
+in a background thread and quotes go to the model until it is mapped.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
+
+import numpy as np
+from django.conf import settings
+
+from .model_registry import QUOTE_MODEL, ModelRegistry, hash_file, registry
+
+logger = logging.getLogger(__name__)
+
+GRID_SUFFIX = ".grid.npy"
+META_SUFFIX = ".grid.json"
+
+# Default grid bounds, inclusive; override with manage.py build_quote_table
+DEFAULT_AGES = (18, 100)
+DEFAULT_CHILDREN = (0, 5)
+DEFAULT_BMI = (15.0, 55.0)
+BMI_STEP = 0.1
+
+# Upper bounds used by the quote form's JavaScript to derive the category
+FORM_BMI_CATEGORIES = (
+    (18.5, "Sous-poids"),
+    (24.9, "Poids normal"),
+    (29.9, "Surpoids"),
+    (40.0, "Obésité"),
+)
+SEVERE_OBESITY = "Obésité sévère"
+
+ENUM_AXES = ("sex", "smoker", "region")
+
+
+def grid_path(source_path: str) -> str:
+    return source_path + GRID_SUFFIX
+
+
+def meta_path(source_path: str) -> str:
+    return source_path + META_SUFFIX
+
+
+def quantize_bmi(bmi: float) -> float:
+    """Rounds a BMI to the nearest ``BMI_STEP``, the resolution of the grid."""
+    return round(round(float(bmi) / BMI_STEP) * BMI_STEP, 1)
+
+
+def form_bmi_category(bmi: float) -> str:
+    """Returns the BMI category the quote form sends for a BMI."""
+    for upper, category in FORM_BMI_CATEGORIES:
+        if bmi < upper:
+            return category
+    return SEVERE_OBESITY
+
+
+class StaleQuoteTable(Exception):
+    """Raised when a table does not match the pickled artifact it was built from."""
+
+
+class QuoteTableNotReady(OSError):
+    """Raised while the table of an artifact is being built in the background."""
+
+
+class QuoteTable:
+    """
+    Premiums for every point of the quote grid, indexed in O(1).
+
+    Attributes:
+        cents (np.ndarray): Premiums in cents, shaped
+            ``(sex, smoker, region, children, age, bmi)``.
+        axes (Dict[str, Any]): Categories of the enum axes and inclusive
+            ``[min, max]`` bounds of the numeric ones.
+        source_sha256 (str): Content hash of the pickle the table was built from.
+    """
+
+    def __init__(
+        self, cents: np.ndarray, axes: Dict[str, Any], source_sha256: str
+    ) -> None:
+        self.cents = cents
+        self.axes = axes
+        self.source_sha256 = source_sha256
+        self._codes = {
+            name: {value: code for code, value in enumerate(axes[name])}
+            for name in ENUM_AXES
+        }
+        self._age_min, self._age_max = axes["age"]
+        self._children_min, self._children_max = axes["children"]
+        self._bmi_min = axes["bmi"][0]
+        self._bmi_steps = self.cents.shape[-1]
+
+    def lookup(self, inputs: Mapping[str, Any]) -> Optional[float]:
+        """
+        Returns the premium for parsed quote inputs, or None when off the grid.
+
+        Args:
+            inputs (Mapping[str, Any]): Typed model inputs as built by
+                ``predict_charges`` (``age``, ``children``, ``bmi``, ``sex``,
+                ``smoker``, ``region`` and ``BMI_category``).
+
+        Returns:
+            Optional[float]: The rounded, non-negative premium.
+        """
+        try:
+            sex = self._codes["sex"][inputs["sex"]]
+            smoker = self._codes["smoker"][inputs["smoker"]]
+            region = self._codes["region"][inputs["region"]]
+        except (KeyError, TypeError):
+            return None
+        age = inputs["age"] - self._age_min
+        children = inputs["children"] - self._children_min
+        step = round((inputs["bmi"] - self._bmi_min) / BMI_STEP)
+        if not (
+            0 <= age <= self._age_max - self._age_min
+            and 0 <= children <= self._children_max - self._children_min
+            and 0 <= step < self._bmi_steps
+        ):
+            return None
+        bmi = round(self._bmi_min + step * BMI_STEP, 1)
+        if inputs["BMI_category"] != form_bmi_category(bmi):
+            return None
+        return int(self.cents[sex, smoker, region, children, age, step]) / 100
+
+    @property
+    def nbytes(self) -> int:
+        return self.cents.nbytes
+
+
+def _grid_columns(axes: Dict[str, Any]) -> Tuple[Tuple[int, ...], Dict[str, Any]]:
+    """Returns the table shape and one model input column per grid point."""
+    ages = np.arange(axes["age"][0], axes["age"][1] + 1)
+    children = np.arange(axes["children"][0], axes["children"][1] + 1)
+    bmis = np.round(
+        np.arange(
+            round((axes["bmi"][1] - axes["bmi"][0]) / BMI_STEP) + 1, dtype=np.float64
+        )
+        * BMI_STEP
+        + axes["bmi"][0],
+        1,
+    )
+    shape = tuple(len(axes[name]) for name in ENUM_AXES) + (
+        len(children),
+        len(ages),
+        len(bmis),
+    )
+    sex, smoker, region, child, age, bmi = np.indices(shape).reshape(len(shape), -1)
+    bmi_values = bmis[bmi]
+    categories = np.array([form_bmi_category(value) for value in bmis], dtype=object)
+    return shape, {
+        "height": np.zeros(len(bmi)),
+        "weight": np.zeros(len(bmi)),
+        "age": ages[age],
+        "sex": np.asarray(axes["sex"], dtype=object)[sex],
+        "smoker": np.asarray(axes["smoker"], dtype=object)[smoker],
+        "region": np.asarray(axes["region"], dtype=object)[region],
+        "children": children[child],
+        "bmi": bmi_values,
+        "BMI_category": categories[bmi],
+    }
+
+
+def build_quote_table(
+    source_path: str,
+    model: Any,
+    ages=DEFAULT_AGES,
+    children=DEFAULT_CHILDREN,
+    bmi=DEFAULT_BMI,
+    chunk_size: int = 100_000,
+) -> QuoteTable:
+    """
+    Scores every grid point with the quote model and writes the table to disk.
+
+    Args:
+        source_path (str): Path of the pickled quote model.
+        model: The loaded quote model.
+        ages, children, bmi: Inclusive ``(min, max)`` bounds of the numeric axes.
+        chunk_size (int): Rows per ``predict`` call, bounding peak memory.
+
+    Returns:
+        QuoteTable: The in-memory table that was written.
+    """
+    import pandas as pd
+
+    from .quotes import known_categories
+
+    categories = known_categories(model)
+    axes: Dict[str, Any] = {
+        "sex": sorted(categories["sex"]),
+        "smoker": sorted(categories["smoker"]),
+        "region": sorted(categories["region"]),
+        "age": [int(ages[0]), int(ages[1])],
+        "children": [int(children[0]), int(children[1])],
+        "bmi": [float(bmi[0]), float(bmi[1])],
+    }
+    shape, columns = _grid_columns(axes)
+    size = int(np.prod(shape))
+
+    cents = np.empty(size, dtype=np.int32)
+    for start in range(0, size, chunk_size):
+        chunk = pd.DataFrame(
+            {
+                name: values[start : start + chunk_size]
+                for name, values in columns.items()
+            }
+        )
+        raw = np.asarray(model.predict(chunk), dtype=np.float64)
+        # Same rounding and clamping as clamp_prediction, kept exact as cents
+        cents[start : start + chunk_size] = np.maximum(np.round(raw * 100), 0)
+
+    table = QuoteTable(cents.reshape(shape), axes, hash_file(source_path))
+    save_quote_table(source_path, table)
+    return table
+
+
+def save_quote_table(source_path: str, table: QuoteTable) -> None:
+    # Write through temporary files so readers never map a partial table;
+    # the metadata goes last and is what marks the table as current
+    for path, write in (
+        (grid_path(source_path), lambda file: np.save(file, table.cents)),
+        (
+            meta_path(source_path),
+            lambda file: file.write(
+                json.dumps(
+                    {"axes": table.axes, "source_sha256": table.source_sha256}
+                ).encode()
+            ),
+        ),
+    ):
+        tmp_path = f"{path}.tmp{os.getpid()}"
+        with open(tmp_path, "wb") as file:
+            write(file)
+        os.replace(tmp_path, path)
+
+
+def read_quote_table(source_path: str) -> QuoteTable:
+    """Memory-maps the table of an artifact and checks it is current."""
+    with open(meta_path(source_path), encoding="utf-8") as file:
+        meta = json.load(file)
+    if meta["source_sha256"] != hash_file(source_path):
+        raise StaleQuoteTable(
+            f"{grid_path(source_path)} was built from a different version of "
+            f"{os.path.basename(source_path)}"
+        )
+    cents = np.load(grid_path(source_path), mmap_mode="r")
+    return QuoteTable(cents, meta["axes"], meta["source_sha256"])
+
+
+def rebuild_quote_table(source_path: str) -> QuoteTable:
+    """Builds the table of an artifact with the bounds of its previous table."""
+    bounds: List[Any] = [DEFAULT_AGES, DEFAULT_CHILDREN, DEFAULT_BMI]
+    try:
+        with open(meta_path(source_path), encoding="utf-8") as file:
+            axes = json.load(file)["axes"]
+        bounds = [axes["age"], axes["children"], axes["bmi"]]
+    except (OSError, ValueError, KeyError):
+        pass
+    return build_quote_table(source_path, registry.get(source_path), *bounds)
+
+
+def ensure_quote_table(source_path: str) -> None:
+    """Builds the table of an artifact unless a current one is on disk."""
+    try:
+        read_quote_table(source_path)
+    except (FileNotFoundError, StaleQuoteTable, ValueError):
+        rebuild_quote_table(source_path)
+
+
+# Background builds by pickle path, so a request never waits for one
+_builds: Dict[str, threading.Thread] = {}
+_builds_lock = threading.Lock()
+
+# (mtime_ns, size) of pickles whose build failed, retried once they change
+_failed_builds: Dict[str, Tuple[int, int]] = {}
+
+
+def _signature(path: str) -> Tuple[int, int]:
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _build_in_background(source_path: str) -> None:
+    signature = _signature(source_path)
+    try:
+        rebuild_quote_table(source_path)
+    except Exception:
+        _failed_builds[source_path] = signature
+        logger.exception("Building the quote table of %s failed", source_path)
+    else:
+        _failed_builds.pop(source_path, None)
+        logger.info("Quote table of %s is ready", source_path)
+
+
+def start_build(source_path: str) -> threading.Thread:
+    """Starts building the table of an artifact, unless a build is running."""
+    with _builds_lock:
+        thread = _builds.get(source_path)
+        if thread is None or not thread.is_alive():
+            thread = threading.Thread(
+                target=_build_in_background,
+                args=(source_path,),
+                name="quote-table-build",
+                daemon=True,
+            )
+            _builds[source_path] = thread
+            thread.start()
+        return thread
+
+
+def load_quote_table(source_path: str) -> QuoteTable:
+    """Registry loader: maps the current table or starts building it."""
+    thread = _builds.get(source_path)
+    if thread is None or not thread.is_alive():
+        try:
+            return read_quote_table(source_path)
+        except (FileNotFoundError, StaleQuoteTable, ValueError):
+            if _failed_builds.get(source_path) == _signature(source_path):
+                raise QuoteTableNotReady(f"{grid_path(source_path)} failed to build")
+            start_build(source_path)
+    raise QuoteTableNotReady(f"{grid_path(source_path)} is being built")
+
+
+# Keyed by the pickle path: swapping the pickle rebuilds and remaps the table
+quote_table_registry = ModelRegistry(loader=load_quote_table)
+
+# Artifacts we already warned about falling back to the model for
+_table_failures: Set[str] = set()
+
+
+def lookup_quote(inputs: Mapping[str, Any], name: str = QUOTE_MODEL) -> Optional[float]:
+    """
+    Returns the tabulated premium for quote inputs when the table is enabled.
+
+    Args:
+        inputs (Mapping[str, Any]): Typed model inputs, see ``QuoteTable.lookup``.
+        name (str): Artifact name of the quote model.
+
+    Returns:
+        Optional[float]: The premium, or None if ``settings.USE_QUOTE_TABLE`` is off,
+            the inputs are off the grid or the table is not built yet or cannot be.
+    """
+    if not getattr(settings, "USE_QUOTE_TABLE", False):
+        return None
+    try:
+        table = quote_table_registry.get(name)
+    except QuoteTableNotReady:
+        return None
+    except OSError as e:
+        if name not in _table_failures:
+            _table_failures.add(name)
+            logger.warning("Quote table unavailable for %s: %s", name, e)
+        return None
+    return table.lookup(inputs)
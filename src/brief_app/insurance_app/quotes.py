@@ -0,0 +1,246 @@
+"""Scoring helpers for the public quote model (``model_1.pickle``).
+
+``predict_charges`` scores one applicant per request through ``parse_quote`` and
+``predict_quote``; ``score_quotes`` scores any number of them by validating
+fields column-wise, building one DataFrame per chunk and calling
+``model.predict`` once per chunk. Both score the BMI rounded to the quote
+table's 0.1 step, like the prediction cache does, and apply the same rounding
+and non-negative clamping through ``clamp_prediction``.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set
+
+import numpy as np
+import pandas as pd
+from django.conf import settings
+
+from .batching import predict_one
+from .model_registry import QUOTE_MODEL, get_predictor
+from .prediction_cache import cached_prediction
+from .quote_table import lookup_quote, quantize_bmi
+from .sidecar import sidecar_predict
+
+# JSON field -> model column, in the order predict_charges builds its row
+QUOTE_COLUMNS: Dict[str, str] = {
+    "height": "height",
+    "weight": "weight",
+    "age": "age",
+    "sex": "sex",
+    "smoker": "smoker",
+    "region": "region",
+    "children": "children",
+    "bmi": "bmi",
+    "bmi_category": "BMI_category",
+}
+FLOAT_FIELDS = ("height", "weight", "bmi")
+INT_FIELDS = ("age", "children")
+
+DEFAULT_CHUNK_SIZE = 1000
+DEFAULT_MAX_ROWS = 10_000
+# Integer fields are cast to int64; larger magnitudes would overflow
+INT_LIMIT = 2**63
+
+
+def clamp_prediction(value: float) -> float:
+    """Rounds a raw model output to cents and clamps it at zero."""
+    return max(round(value, 2), 0)
+
+
+def parse_quote(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Converts one ``/quote-predict/`` payload into typed model inputs.
+
+    Args:
+        data (Dict[str, Any]): The decoded JSON body.
+
+    Returns:
+        Dict[str, Any]: One value per model column, in ``QUOTE_COLUMNS`` order.
+
+    Raises:
+        TypeError, ValueError: If a numeric field is missing or not a number.
+    """
+    inputs = {}
+    for field, column in QUOTE_COLUMNS.items():
+        value = data.get(field)
+        if field in FLOAT_FIELDS:
+            value = float(value)
+        elif field in INT_FIELDS:
+            value = int(value)
+        inputs[column] = value
+    return inputs
+
+
+def predict_quote(inputs: Dict[str, Any]) -> float:
+    """
+    Prices one applicant parsed by ``parse_quote``.
+
+    The opt-in precomputed table is tried first, then the prediction sidecar
+    if one is configured, then the model in this process. Repeated
+    quotes for the same inputs are served from the prediction cache, and with
+    ``settings.PREDICTION_BATCHING`` concurrent ones share a ``predict`` call.
+    """
+    prediction = lookup_quote(inputs)
+    if prediction is None:
+        prediction = sidecar_predict(QUOTE_MODEL, inputs)
+    if prediction is None:
+        prediction = cached_prediction(
+            QUOTE_MODEL,
+            inputs,
+            lambda model, row: predict_one(QUOTE_MODEL, model, row, score_quote_rows),
+        )
+    return prediction
+
+
+def score_quote_rows(model: Any, rows: List[Dict[str, Any]]) -> List[float]:
+    """Scores rows of ``parse_quote`` inputs in one ``predict`` call."""
+    # The DataFrame keeps the column order the model expects
+    return [clamp_prediction(value) for value in model.predict(pd.DataFrame(rows))]
+
+
+def known_categories(model: Any) -> Dict[str, Set[str]]:
+    """
+    Returns the categories seen at fit time for each categorical model column.
+
+    Walks nested Pipelines down to the ColumnTransformer and reads ``categories_``
+    from its fitted encoders, so validation follows whatever artifact is active.
+    Compiled models report the categories they were exported with.
+    """
+    if hasattr(model, "known_categories"):
+        return model.known_categories()
+    found: Dict[str, Set[str]] = {}
+    steps = list(getattr(model, "steps", []))
+    while steps:
+        _, step = steps.pop(0)
+        steps.extend(getattr(step, "steps", []))
+        for _, transformer, columns in getattr(step, "transformers_", []):
+            categories = getattr(transformer, "categories_", None)
+            if categories is None or not isinstance(columns, list):
+                continue
+            for column, values in zip(columns, categories):
+                found[column] = {str(value) for value in values}
+    return found
+
+
+def _chunk_size() -> int:
+    return int(getattr(settings, "QUOTE_BATCH_CHUNK_SIZE", DEFAULT_CHUNK_SIZE))
+
+
+def max_rows() -> int:
+    """The most rows one batch request may score."""
+    return int(getattr(settings, "QUOTE_BATCH_MAX_ROWS", DEFAULT_MAX_ROWS))
+
+
+def _score_chunk(
+    model: Any, rows: List[Any], categories: Dict[str, Set[str]]
+) -> List[Dict[str, Any]]:
+    errors: List[List[str]] = [[] for _ in rows]
+    malformed: Set[int] = set()
+    records = []
+    for position, row in enumerate(rows):
+        if isinstance(row, dict):
+            records.append(row)
+            continue
+        # Not an object (or an unparsable NDJSON line): report only that
+        records.append({})
+        malformed.add(position)
+        errors[position].append(
+            str(row) if isinstance(row, ValueError) else "row must be a JSON object"
+        )
+
+    def reject(positions: Iterable[int], message: str) -> None:
+        for position in positions:
+            if position not in malformed:
+                errors[position].append(message)
+
+    frame = pd.DataFrame.from_records(records, columns=list(QUOTE_COLUMNS))
+
+    # Column-wise validation: one vectorized pass per field
+    for field in FLOAT_FIELDS + INT_FIELDS:
+        values = pd.to_numeric(frame[field], errors="coerce").astype("float64")
+        missing = values.isna()
+        reject(values.index[missing], f"{field} must be a number")
+        # json.loads accepts Infinity, and int64 cannot hold inf or huge values
+        out_of_range = ~missing & ~np.isfinite(values)
+        if field in INT_FIELDS:
+            out_of_range |= values.abs() >= INT_LIMIT
+        reject(values.index[out_of_range], f"{field} is out of range")
+        frame[field] = values.where(~(missing | out_of_range), 0)
+    for field in INT_FIELDS:
+        frame[field] = frame[field].astype("int64")
+    frame["bmi"] = frame["bmi"].map(quantize_bmi)
+
+    for field, column in QUOTE_COLUMNS.items():
+        allowed = categories.get(column)
+        if allowed is not None:
+            invalid = ~frame[field].isin(allowed)
+            reject(frame.index[invalid], f"{field} must be one of {sorted(allowed)}")
+
+    valid = [position for position, messages in enumerate(errors) if not messages]
+    predictions: Dict[int, float] = {}
+    if valid:
+        batch = frame.iloc[valid].rename(columns=QUOTE_COLUMNS)
+        try:
+            for position, value in zip(valid, model.predict(batch)):
+                predictions[position] = clamp_prediction(float(value))
+        except Exception as e:
+            reject(valid, str(e))
+
+    return [
+        (
+            {"prediction": predictions[position]}
+            if position in predictions
+            else {"error": "; ".join(errors[position])}
+        )
+        for position in range(len(rows))
+    ]
+
+
+def iter_ndjson(lines: Iterable[bytes]) -> Iterator[Any]:
+    """Parses NDJSON lazily, yielding a ValueError in place of an unparsable line."""
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError as e:
+            yield ValueError(f"invalid JSON: {e}")
+
+
+def score_quotes(
+    rows: Iterable[Any], chunk_size: Optional[int] = None, model: Optional[Any] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Scores applicant profiles in input order, one ``model.predict`` per chunk.
+
+    Args:
+        rows (Iterable): Applicant dicts using the ``/quote-predict/`` JSON fields.
+            Consumed lazily, so a streamed request body is never fully buffered.
+        chunk_size (int, optional): Rows per model call, defaults to
+            ``settings.QUOTE_BATCH_CHUNK_SIZE`` or 1000.
+        model (Any, optional): The quote model, if the caller already loaded it
+            (e.g. to fail before a streamed response starts).
+
+    Yields:
+        dict: ``{"index": i, "prediction": p}`` or ``{"index": i, "error": msg}``.
+    """
+    size = chunk_size or _chunk_size()
+    if model is None:
+        model = get_predictor(QUOTE_MODEL)
+    categories = known_categories(model)
+
+    index = 0
+    chunk: List[Any] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            for result in _score_chunk(model, chunk, categories):
+                yield {"index": index, **result}
+                index += 1
+            chunk = []
+    if chunk:
+        for result in _score_chunk(model, chunk, categories):
+            yield {"index": index, **result}
+            index += 1
@@ -0,0 +1,110 @@
+"""Weekly availability rules, materialized into ``Availability`` rows.
+
+Staff describe opening hours once, as ``AvailabilityRule`` rows such as
+"Mon-Fri 09:00-18:00", and override single dates with
+``AvailabilityException`` rows (holidays, short days). ``materialize``
+computes the slot bitmask of every day in a range from the active rules and
+exceptions, then writes the whole range at once: one ``bulk_create`` with
+``update_conflicts`` on ``date`` for the open days and one ``DELETE`` for the
+closed ones. A year is a handful of queries, with no per-row ``save()``.
+
+Within the range, the rules replace whatever ``Availability`` held before;
+one-off changes belong in exceptions so they survive the next run.
+"""
+
+from datetime import date, timedelta
+from typing import Dict, Iterable, Tuple
+
+from django.db import transaction
+from django.db.models import Q
+
+from .models import Availability, AvailabilityException, AvailabilityRule
+from .slots import slot_mask
+
+GENERATE_DAYS = 365
+BATCH_SIZE = 500
+
+WEEKDAY_CHOICES = [
+    (0, "Monday"),
+    (1, "Tuesday"),
+    (2, "Wednesday"),
+    (3, "Thursday"),
+    (4, "Friday"),
+    (5, "Saturday"),
+    (6, "Sunday"),
+]
+
+
+def weekday_mask(weekdays: Iterable[int]) -> int:
+    """Packs weekday numbers (Monday is 0) into a bitmask."""
+    return sum(1 << day for day in set(weekdays))
+
+
+def plan(start: date, end: date) -> Dict[date, int]:
+    """
+    Computes the slots the rules and exceptions give each day of a range.
+
+    Args:
+        start (date): First day, inclusive.
+        end (date): Last day, inclusive.
+
+    Returns:
+        Dict[date, int]: The slot bitmask of every day from ``start`` to
+            ``end``; 0 for closed days.
+    """
+    rules = [
+        (weekdays, slot_mask(times), starts_on, ends_on or end)
+        for weekdays, times, starts_on, ends_on in AvailabilityRule.objects.filter(
+            Q(ends_on__isnull=True) | Q(ends_on__gte=start),
+            active=True,
+            starts_on__lte=end,
+        ).values_list("weekdays", "time_slots", "starts_on", "ends_on")
+    ]
+    exceptions = {
+        day: slot_mask(times)
+        for day, times in AvailabilityException.objects.filter(
+            date__range=(start, end)
+        ).values_list("date", "time_slots")
+    }
+
+    masks = {}
+    for offset in range((end - start).days + 1):
+        day = start + timedelta(days=offset)
+        if day in exceptions:
+            masks[day] = exceptions[day]
+            continue
+        bit, mask = 1 << day.weekday(), 0
+        for weekdays, slots, starts_on, ends_on in rules:
+            if weekdays & bit and starts_on <= day <= ends_on:
+                mask |= slots
+        masks[day] = mask
+    return masks
+
+
+def materialize(start: date, end: date) -> Tuple[int, int]:
+    """
+    Writes the planned availability of a date range in bulk.
+
+    Args:
+        start (date): First day, inclusive.
+        end (date): Last day, inclusive.
+
+    Returns:
+        Tuple[int, int]: The number of open days written and of existing
+            ``Availability`` rows deleted because their day is now closed.
+    """
+    masks = plan(start, end)
+    open_days = [
+        Availability(date=day, time_slots=mask) for day, mask in masks.items() if mask
+    ]
+    closed_days = [day for day, mask in masks.items() if not mask]
+    with transaction.atomic():
+        Availability.objects.bulk_create(
+            open_days,
+            batch_size=BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=["date"],
+            update_fields=["time_slots"],
+        )
+        deleted, _ = Availability.objects.filter(date__in=closed_days).delete()
+    return len(open_days), deleted
@@ -0,0 +1,244 @@
+"""Local prediction sidecar shared by every Gunicorn worker.
+
+``manage.py run_prediction_sidecar`` starts one process that owns the loaded
+pipelines and listens on a Unix domain socket. With
+``settings.PREDICTION_SIDECAR_SOCKET`` set, the views send each applicant
+there with ``sidecar_predict`` instead of scoring it in the worker, so the
+workers never need to load sklearn or the models. The sidecar serves every
+connection on its own thread and funnels the rows through the same
+``MicroBatcher`` and prediction cache the views use in-process.
+
+Wire format, big-endian, one request and one response per frame on a
+persistent connection::
+
+    request:  model (B) | payload length (I) | row
+    response: status (B) | payload length (I) | prediction (d) or UTF-8 error
+
+A row is the model's ``SCHEMAS`` fields in order: numbers as ``d``/``q``,
+strings as a length (H) followed by UTF-8 bytes.
+
+When the socket is missing, refuses connections or times out, the caller
+gets None and scores in-process; the sidecar is retried after
+``RETRY_SECONDS``.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import socket
+import socketserver
+import struct
+import threading
+import time
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from django.conf import settings
+
+from .model_registry import PROFILE_MODEL, QUOTE_MODEL
+
+logger = logging.getLogger(__name__)
+
+HEADER = struct.Struct("!BI")
+STRING_LENGTH = struct.Struct("!H")
+OK, ERROR = 0, 1
+
+TIMEOUT_SECONDS = 2.0
+RETRY_SECONDS = 5.0
+
+# Row layout per model: field name and struct code ("s" for strings)
+SCHEMAS: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    QUOTE_MODEL: (
+        ("height", "d"),
+        ("weight", "d"),
+        ("age", "q"),
+        ("sex", "s"),
+        ("smoker", "s"),
+        ("region", "s"),
+        ("children", "q"),
+        ("bmi", "d"),
+        ("BMI_category", "s"),
+    ),
+    PROFILE_MODEL: (
+        ("age", "q"),
+        ("bmi", "d"),
+        ("smoker", "s"),
+        ("children", "q"),
+        ("region", "s"),
+        ("sex", "s"),
+    ),
+}
+MODEL_CODES: List[str] = list(SCHEMAS)
+
+
+class SidecarUnavailable(Exception):
+    """Raised when the sidecar cannot be reached."""
+
+
+def encode_row(name: str, row: Mapping[str, Any]) -> bytes:
+    parts = []
+    for field, code in SCHEMAS[name]:
+        if code == "s":
+            data = str(row[field]).encode()
+            parts.append(STRING_LENGTH.pack(len(data)) + data)
+        else:
+            parts.append(struct.pack("!" + code, row[field]))
+    return b"".join(parts)
+
+
+def decode_row(name: str, payload: bytes) -> Dict[str, Any]:
+    row: Dict[str, Any] = {}
+    offset = 0
+    for field, code in SCHEMAS[name]:
+        if code == "s":
+            (length,) = STRING_LENGTH.unpack_from(payload, offset)
+            offset += STRING_LENGTH.size
+            row[field] = payload[offset : offset + length].decode()
+            offset += length
+        else:
+            (row[field],) = struct.unpack_from("!" + code, payload, offset)
+            offset += struct.calcsize("!" + code)
+    return row
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    data = bytearray()
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("connection closed")
+        data += chunk
+    return bytes(data)
+
+
+def _recv_frame(sock: socket.socket) -> Tuple[int, bytes]:
+    kind, length = HEADER.unpack(_recv_exact(sock, HEADER.size))
+    return kind, _recv_exact(sock, length)
+
+
+def _send_frame(sock: socket.socket, kind: int, payload: bytes) -> None:
+    sock.sendall(HEADER.pack(kind, len(payload)) + payload)
+
+
+class SidecarClient:
+    """
+    Thread-safe client keeping one connection per calling thread.
+
+    Methods:
+        predict(name, row):
+            Scores one row in the sidecar, raising SidecarUnavailable or ValueError.
+    """
+
+    def __init__(self, path: str, timeout: float = TIMEOUT_SECONDS) -> None:
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connection(self) -> socket.socket:
+        sock = getattr(self._local, "sock", None)
+        if sock is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            try:
+                sock.connect(self.path)
+            except OSError:
+                sock.close()
+                raise
+            self._local.sock = sock
+        return sock
+
+    def _reset(self) -> None:
+        sock = getattr(self._local, "sock", None)
+        self._local.sock = None
+        if sock is not None:
+            sock.close()
+
+    def predict(self, name: str, row: Mapping[str, Any]) -> float:
+        payload = encode_row(name, row)
+        try:
+            sock = self._connection()
+            _send_frame(sock, MODEL_CODES.index(name), payload)
+            status, body = _recv_frame(sock)
+        except OSError as e:
+            self._reset()
+            raise SidecarUnavailable(str(e)) from e
+        if status != OK:
+            raise ValueError(body.decode())
+        return struct.unpack("!d", body)[0]
+
+
+_client: Optional[SidecarClient] = None
+_down_until = 0.0
+
+
+def sidecar_predict(name: str, row: Mapping[str, Any]) -> Optional[float]:
+    """
+    Scores a row in the sidecar when ``settings.PREDICTION_SIDECAR_SOCKET`` is set.
+
+    Args:
+        name (str): ``QUOTE_MODEL`` or ``PROFILE_MODEL``.
+        row (Mapping[str, Any]): The typed inputs, with the fields of ``SCHEMAS[name]``.
+
+    Returns:
+        Optional[float]: The prediction, or None if the sidecar is disabled or
+            unreachable and the caller should score in-process.
+
+    Raises:
+        ValueError: If the sidecar rejected the row.
+    """
+    global _client, _down_until
+    path = getattr(settings, "PREDICTION_SIDECAR_SOCKET", "")
+    if not path or time.monotonic() < _down_until:
+        return None
+    if _client is None or _client.path != path:
+        _client = SidecarClient(path)
+    try:
+        return _client.predict(name, row)
+    except SidecarUnavailable as e:
+        _down_until = time.monotonic() + RETRY_SECONDS
+        logger.warning("Prediction sidecar at %s unavailable: %s", path, e)
+        return None
+
+
+class SidecarHandler(socketserver.BaseRequestHandler):
+    """Serves the frames of one worker connection until it closes."""
+
+    def handle(self) -> None:
+        while True:
+            try:
+                code, payload = _recv_frame(self.request)
+            except (ConnectionError, OSError):
+                return
+            try:
+                prediction = predict_row(MODEL_CODES[code], payload)
+            except Exception as e:
+                _send_frame(self.request, ERROR, str(e).encode())
+            else:
+                _send_frame(self.request, OK, struct.pack("!d", prediction))
+
+
+def predict_row(name: str, payload: bytes) -> float:
+    """Sidecar side: scores one encoded row through the cache and batcher."""
+    from .batching import get_batcher
+    from .features import score_profiles
+    from .prediction_cache import cached_prediction
+    from .quotes import score_quote_rows
+
+    score = score_quote_rows if name == QUOTE_MODEL else score_profiles
+    row = decode_row(name, payload)
+    return float(
+        cached_prediction(
+            name,
+            row,
+            lambda model, canonical: get_batcher(name, score).submit(canonical),
+        )
+    )
+
+
+class SidecarServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: str) -> None:
+        if os.path.exists(path):
+            os.unlink(path)
+        super().__init__(path, SidecarHandler)
@@ -0,0 +1,109 @@
+"""The appointment slot grid and the model fields that store it compactly.
+
+Appointments are booked in the hourly slots of ``SLOT_TIMES`` (09:00 to
+18:00). In the database a slot is its small-integer index in the grid
+(``SlotField``), and a day's set of slots is a bitmask with bit ``i`` for
+``SLOT_TIMES[i]`` (``SlotMaskField``). Python code keeps seeing ``"HH:00"``
+strings and lists of them, so forms, templates and lookups such as
+``filter(time="10:00")`` work unchanged, while SQL can index, compare and
+aggregate plain integers.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional
+
+from django import forms
+from django.core.exceptions import ValidationError
+from django.db import models
+from django.utils.functional import cached_property
+
+SLOT_TIMES: List[str] = [f"{hour:02d}:00" for hour in range(9, 19)]
+SLOT_INDEX: Dict[str, int] = {time: i for i, time in enumerate(SLOT_TIMES)}
+SLOT_CHOICES = [(time, time) for time in SLOT_TIMES]
+FULL_MASK = (1 << len(SLOT_TIMES)) - 1
+
+
+def slot_mask(times: Iterable[str]) -> int:
+    """Packs slot times into a bitmask; times off the grid are ignored."""
+    mask = 0
+    for time in times:
+        if time in SLOT_INDEX:
+            mask |= 1 << SLOT_INDEX[time]
+    return mask
+
+
+def mask_times(mask: int) -> List[str]:
+    """Unpacks a bitmask into its slot times, in grid order."""
+    return [time for i, time in enumerate(SLOT_TIMES) if mask >> i & 1]
+
+
+def _slot_time(value: Any) -> str:
+    if isinstance(value, int) and 0 <= value < len(SLOT_TIMES):
+        return SLOT_TIMES[value]
+    if value in SLOT_INDEX:
+        return value
+    raise ValidationError(f"{value!r} is not a slot between 09:00 and 18:00.")
+
+
+class SlotField(models.PositiveSmallIntegerField):
+    """A slot time, stored as its index in ``SLOT_TIMES``."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        kwargs.setdefault("choices", SLOT_CHOICES)
+        super().__init__(*args, **kwargs)
+
+    def from_db_value(self, value: Optional[int], *args: Any) -> Optional[str]:
+        return None if value is None else SLOT_TIMES[value]
+
+    def to_python(self, value: Any) -> Optional[str]:
+        return None if value in (None, "") else _slot_time(value)
+
+    def get_prep_value(self, value: Any) -> Optional[int]:
+        if value is None or isinstance(value, int):
+            return value
+        try:
+            return SLOT_INDEX[value]
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Field '{self.name}' expected a slot time") from e
+
+    @cached_property
+    def validators(self) -> List[Any]:
+        # The integer range validators would compare "HH:00" strings with ints
+        return list(self._validators)
+
+    def value_to_string(self, obj: models.Model) -> str:
+        return self.value_from_object(obj) or ""
+
+
+class SlotMaskField(models.PositiveSmallIntegerField):
+    """A set of slot times, stored as a bitmask over ``SLOT_TIMES``."""
+
+    def from_db_value(self, value: Optional[int], *args: Any) -> Optional[List[str]]:
+        return None if value is None else mask_times(value)
+
+    def to_python(self, value: Any) -> Optional[List[str]]:
+        if value is None or isinstance(value, list):
+            return None if value is None else [_slot_time(t) for t in value]
+        try:
+            return mask_times(int(value))
+        except (TypeError, ValueError) as e:
+            raise ValidationError(f"{value!r} is not a set of slots.") from e
+
+    def get_prep_value(self, value: Any) -> Optional[int]:
+        if value is None or isinstance(value, int):
+            return value
+        return slot_mask(value)
+
+    @cached_property
+    def validators(self) -> List[Any]:
+        return list(self._validators)
+
+    def value_to_string(self, obj: models.Model) -> str:
+        return str(self.get_prep_value(self.value_from_object(obj)))
+
+    def formfield(self, **kwargs: Any) -> forms.Field:
+        return forms.MultipleChoiceField(
+            choices=SLOT_CHOICES,
+            widget=forms.CheckboxSelectMultiple,
+            required=not self.blank,
+            label=kwargs.get("label", self.verbose_name.capitalize()),
+        )
@@ -0,0 +1,45 @@
+from django import template
+from django.templatetags.static import static
+from django.utils.html import format_html, format_html_join
+
+from insurance_app.images import get_variants
+
+register = template.Library()
+
+
+@register.simple_tag
+def picture(name, alt="", sizes="100vw", loading="lazy", **attrs):
+    """
+    Renders a static image as ``<picture>`` with AVIF and WebP ``srcset``s.
+
+    Usage: ``{% picture "images/image.png" alt="Team" sizes="50vw" class="w-full" %}``.
+    The ``<img>`` keeps the original file as fallback and carries its
+    intrinsic size to avoid layout shifts. Images ``optimize_images`` has not
+    processed render as a plain ``<img>``.
+    """
+    entry = get_variants(name)
+    img_attrs = {"alt": alt, "loading": loading, "decoding": "async", **attrs}
+    if entry:
+        img_attrs.update(width=entry["width"], height=entry["height"])
+    img = format_html(
+        '<img src="{}"{}>',
+        static(name),
+        format_html_join("", ' {}="{}"', sorted(img_attrs.items())),
+    )
+    if not entry:
+        return img
+
+    sources = format_html_join(
+        "",
+        '<source type="image/{}" srcset="{}" sizes="{}">',
+        (
+            (
+                fmt,
+                ", ".join(f"{static(v['name'])} {v['width']}w" for v in variants),
+                sizes,
+            )
+            for fmt, variants in entry["variants"].items()
+            if variants
+        ),
+    )
+    return format_html("<picture>{}{}</picture>", sources, img)
@@ -2,13 +2,17 @@ from django.urls import path
 from django.contrib.auth import views as auth_views
 from .views import (
     solve_message,
+    solve_messages,
     predict_charges,
+    predict_charges_batch,
+    predict_charges_async,
     CustomLoginView,
     SignupView,
     HomeView,
     UserProfileView,
     AboutView,
     JoinUsView,
+    job_description_view,
     ApplyView,
     TemplateView,
     apply,
@@ -24,7 +28,10 @@ from .views import (
     PredictionHistoryView,
     book_appointment,
     get_available_times,
+    appointment_history,
+    available_slots,
     TestingView,
+    model_status,
 )
 
 
@@ -43,10 +50,20 @@ urlpatterns = [
         name="prediction_history",
     ),
     path("book/", book_appointment, name="book_appointment"),
+    path(
+        "book/history/",
+        appointment_history,
+        name="appointment_history",
+    ),
     # path('admin-appointments/', admin_appointment_list, name='admin_appointment_list'),
     # Other website pages
     path("about/", AboutView.as_view(), name="about"),
     path("join-us/", JoinUsView.as_view(), name="join_us"),
+    path(
+        "join-us/<int:job_id>/description/",
+        job_description_view,
+        name="job_description",
+    ),
     path("apply/", apply, name="apply"),
     path("contact/", contact_view, name="contact"),
     path("contact-us/", contact_view_user, name="contact_form"),
@@ -63,8 +80,11 @@ urlpatterns = [
         name="cybersecurity_awareness",
     ),
     path("messages/", message_list_view, name="messages_list"),
+    path("solve-message/", solve_messages, name="solve_messages"),
     path("solve-message/<int:message_id>/", solve_message, name="solve_message"),
     path("quote-predict/", predict_charges, name="predict_charges"),
+    path("quote-predict/batch/", predict_charges_batch, name="predict_charges_batch"),
+    path("quote-predict/async/", predict_charges_async, name="predict_charges_async"),
     # Password (Change or Reset) URLs
     path(
         "password_reset/",
@@ -99,5 +119,7 @@ urlpatterns = [
     ),  # Change within profile
     # administration
     path("get-available-times/", get_available_times, name="get_available_times"),
+    path("available-slots/", available_slots, name="available_slots"),
     path("testing/", TestingView.as_view(), name="testing"),
+    path("model-status/", model_status, name="model_status"),
 ]
@@ -7,11 +7,9 @@ from django.urls import reverse_lazy
 from django.views.generic import TemplateView
 from .models import (
     UserProfile,
-    Job,
     ContactMessage,
     PredictionHistory,
-    Appointment,
-    Availability,
+    PredictionStats,
 )
 from .forms import (
     UserProfileForm,
@@ -21,35 +19,52 @@ from .forms import (
     PredictChargesForm,
     AppointmentForm,
 )
+from .model_registry import get_predictor, registry, PROFILE_MODEL, QUOTE_MODEL
+from .executor import ExecutorBusy, prediction_executor
+from .batching import batching_stats, predict_one
+from .sidecar import sidecar_predict
+from .page_cache import AnonymousPageCacheMixin
+from .jobs import job_choices, job_description, job_page
+from .availability import MAX_RANGE_DAYS, free_slots, month_range, range_masks
+from .slots import SLOT_TIMES, mask_times
+from .appointments import appointment_json, appointment_overview, history_paginator
+from .booking import NOT_OFFERED, TAKEN, SlotUnavailable, reserve
+from .contact_messages import NOT_FOUND, RESOLVED, InvalidSelection, resolve_messages
+from .pagination import CursorPage, CursorPaginator, InvalidCursor
 from django.http import (
     HttpResponse,
     HttpRequest,
     JsonResponse,
     HttpResponseBase,
+    StreamingHttpResponse,
 )
 import pickle
+from itertools import islice
+from datetime import date
 import json
-from django.views.decorators.csrf import csrf_exempt
 from django.contrib.auth import logout, get_user_model
-from django.conf import settings
 from django.views import View
-import pandas as pd
-import os
 from django.contrib.admin.views.decorators import staff_member_required
 from django.views.generic import ListView
-from django.db.models import Avg
 from django.contrib.auth.decorators import login_required
 from django.utils import timezone
-from typing import Dict, Any, Optional, Union, Type, cast
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple, Union, Type, cast
 from django.forms import Form
+from django.core.exceptions import NON_FIELD_ERRORS
 from django.contrib.auth.forms import AuthenticationForm
 from django.contrib.auth.models import AbstractUser, AnonymousUser, AbstractBaseUser
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+# The prediction stack (NumPy, pandas, scikit-learn) lives in .prediction and is
+# imported inside the views that predict, so other pages never load it.
+
 
 User: Type[AbstractBaseUser] = get_user_model()
 
 
-class HomeView(TemplateView):
+class HomeView(AnonymousPageCacheMixin, TemplateView):
     """
     Renders the homepage.
 
@@ -69,7 +84,7 @@ class HomeView(TemplateView):
     template_name = "insurance_app/home.html"  # Home Page View Template
 
 
-class TestingView(TemplateView):
+class TestingView(AnonymousPageCacheMixin, TemplateView):
     """
     Renders the testing page.
 
@@ -89,7 +104,7 @@ class TestingView(TemplateView):
     template_name = "insurance_app/base_final.html"  # Home Page View Template
 
 
-class AboutView(TemplateView):
+class AboutView(AnonymousPageCacheMixin, TemplateView):
     """
     Renders the 'About Us' page.
 
@@ -136,10 +151,51 @@ class JoinUsView(TemplateView):
 
     def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
         context = super().get_context_data(**kwargs)
-        context["jobs"] = Job.objects.all()
+        context.update(
+            job_page(
+                after=_int_param(self.request, "after"),
+                before=_int_param(self.request, "before"),
+            )
+        )
+        # The application form offers every job, not just this page's
+        context["job_choices"] = job_choices()
         return context
 
 
+def _int_param(request: HttpRequest, name: str) -> Optional[int]:
+    """Reads an integer query parameter, ignoring missing or malformed ones."""
+    try:
+        return int(request.GET[name])
+    except (KeyError, ValueError):
+        return None
+
+
+def _cursor_page(paginator: CursorPaginator, request: HttpRequest) -> CursorPage:
+    """Returns the page named by ``?cursor=``, or the first page if it is invalid."""
+    try:
+        return paginator.page(request.GET.get("cursor"))
+    except InvalidCursor:
+        return paginator.page()
+
+
+def job_description_view(request: HttpRequest, job_id: int) -> JsonResponse:
+    """
+    Returns the full description of a job, for the 'Read more' expansion.
+
+    Args:
+        request (HttpRequest): The HTTP request object.
+        job_id (int): The ID of the job.
+
+    Returns:
+        JsonResponse: {'job_id': ..., 'description': ...}, or
+            {'error': 'Job not found.'} with HTTP 404.
+    """
+    description = job_description(job_id)
+    if description is None:
+        return JsonResponse({"error": "Job not found."}, status=404)
+    return JsonResponse({"job_id": job_id, "description": description})
+
+
 class ApplyView(TemplateView):
     """
     Handles job application submissions and displays a thank-you page.
@@ -208,7 +264,7 @@ def apply(request: HttpRequest) -> HttpResponse:
     return redirect("join_us")
 
 
-class HealthAdvicesView(TemplateView):
+class HealthAdvicesView(AnonymousPageCacheMixin, TemplateView):
     """Renders the health advices page.
 
     Provides a view for the application's health advices page.
@@ -219,7 +275,7 @@ class HealthAdvicesView(TemplateView):
     )
 
 
-class CybersecurityAwarenessView(TemplateView):
+class CybersecurityAwarenessView(AnonymousPageCacheMixin, TemplateView):
     """Renders the cybersecurity awareness page.
 
     Provides a view for the application's cybersecurity awareness page.
@@ -229,7 +285,7 @@ class CybersecurityAwarenessView(TemplateView):
 
 
 # Welcome view (used to modified homepage)
-class WelcomeView(TemplateView):
+class WelcomeView(AnonymousPageCacheMixin, TemplateView):
     """Renders the welcome page.
 
     Provides a view for the application's welcome page.
@@ -306,13 +362,17 @@ def contact_view_user(request: HttpRequest) -> HttpResponse:
     return render(request, "insurance_app/contact_form_user.html")
 
 
+MESSAGES_PER_PAGE = 25
+
+
 @staff_member_required
 def message_list_view(request: HttpRequest) -> HttpResponse:
     """
     Displays a list of contact messages for staff members.
 
-    This view retrieves all contact messages from the database, orders them by submission
-    time in descending order (most recent first), and renders them in a template.
+    This view retrieves contact messages from the database, orders them by submission
+    time in descending order (most recent first), and renders them in a template,
+    ``MESSAGES_PER_PAGE`` at a time with keyset pagination (``?cursor=``).
     Access to this view is restricted to staff members.
 
     Args:
@@ -320,20 +380,70 @@ def message_list_view(request: HttpRequest) -> HttpResponse:
 
     Returns:
         HttpResponse: Renders the 'messages_list.html' template with the following context:
-            - `messages` (QuerySet): A list of all contact messages, ordered by submission time.
+            - `messages` (List[ContactMessage]): One page of contact messages, ordered by
+              submission time.
+            - `page_obj` (CursorPage): The page, with its next and previous cursors.
     """
-    messages = ContactMessage.objects.all().order_by(
-        "-submitted_at"
+    paginator = CursorPaginator(
+        ContactMessage.objects.all(), ("-submitted_at", "-id"), MESSAGES_PER_PAGE
     )  # Most recent first
-    return render(request, "insurance_app/messages_list.html", {"messages": messages})
+    page = _cursor_page(paginator, request)
+    return render(
+        request,
+        "insurance_app/messages_list.html",
+        {"messages": page.object_list, "page_obj": page},
+    )
+
 
+@staff_member_required
+def solve_messages(request: HttpRequest) -> JsonResponse:
+    """
+    Resolves (deletes) many contact messages in one request.
+
+    The JSON body names the messages either by ID, ``{"ids": [1, 2, 3]}`` (at most
+    ``MAX_IDS``), or by filter, ``{"filter": {"submitted_before": "2025-01-01T00:00"}}``
+    with ``email``, ``submitted_before`` and ``submitted_after`` as filters. They are
+    deleted with one set-based statement inside a transaction.
 
-@csrf_exempt
+    Args:
+        request (HttpRequest): The HTTP request object.
+
+    Returns:
+        JsonResponse:
+            - If successful: {'success': True, 'resolved': n, 'results': {id: status}},
+              where status is 'resolved' or 'not_found'
+            - If the body is invalid: {'success': False, 'error': ...} (HTTP 400)
+            - If the request method is invalid: {'success': False, 'error': 'Invalid
+              request method.'} (HTTP 405)
+    """
+    if request.method != "POST":
+        return JsonResponse(
+            {"success": False, "error": "Invalid request method."}, status=405
+        )
+    try:
+        payload = json.loads(request.body)
+        if not isinstance(payload, dict):
+            raise InvalidSelection("Expected a JSON object.")
+        results = resolve_messages(payload.get("ids"), payload.get("filter"))
+    except ValueError as e:  # includes InvalidSelection
+        return JsonResponse({"success": False, "error": str(e)}, status=400)
+    return JsonResponse(
+        {
+            "success": True,
+            "resolved": sum(status == RESOLVED for status in results.values()),
+            "results": {str(i): status for i, status in results.items()},
+        }
+    )
+
+
+@staff_member_required
 def solve_message(request: HttpRequest, message_id: int) -> JsonResponse:
     """
     Handles the deletion of a contact message.
 
-    This view processes a POST request to delete a specific contact message by its ID.
+    This view processes a POST request to delete a specific contact message by its ID,
+    through the same ``resolve_messages`` path as ``solve_messages``, and like it is
+    limited to staff members.
     If the message exists, it is deleted, and a success response is returned.
     If the message does not exist, an error response is returned.
     Only POST requests are allowed; other request methods will result in an error response.
@@ -349,14 +459,11 @@ def solve_message(request: HttpRequest, message_id: int) -> JsonResponse:
             - If the request method is invalid: {'success': False, 'error': 'Invalid request method.'} (HTTP 400)
     """
     if request.method == "POST":
-        try:
-            contact_message = ContactMessage.objects.get(id=message_id)
-            contact_message.delete()
-            return JsonResponse({"success": True})
-        except ContactMessage.DoesNotExist:
+        if resolve_messages([message_id])[message_id] == NOT_FOUND:
             return JsonResponse(
                 {"success": False, "error": "Message not found."}, status=404
             )
+        return JsonResponse({"success": True})
     return JsonResponse(
         {"success": False, "error": "Invalid request method."}, status=400
     )
@@ -398,44 +505,10 @@ def predict_charges(request: HttpRequest) -> Union[HttpResponse, JsonResponse]:
             # Parse the JSON data from the request body
             data = json.loads(request.body)
 
-            # Extract data from the JSON
-            height = float(data.get("height"))
-            weight = float(data.get("weight"))
-            age = int(data.get("age"))
-            sex = data.get("sex")
-            smoker = data.get("smoker")
-            region = data.get("region")
-            children = int(data.get("children"))
-            bmi = float(data.get("bmi"))
-            bmi_category = data.get("bmi_category")
-
-            # Load model from pickle
-            model_path = "insurance_app/model/model_1.pickle"
-            with open(model_path, "rb") as file:
-                model = pickle.load(file)
-
-            # Prepare data as a DataFrame (ensure the order matches your model's expected input)
-            input_data = pd.DataFrame(
-                [
-                    {
-                        "height": height,
-                        "weight": weight,
-                        "age": age,
-                        "sex": sex,
-                        "smoker": smoker,
-                        "region": region,
-                        "children": children,
-                        "bmi": bmi,
-                        "BMI_category": bmi_category,
-                    }
-                ]
-            )
-
-            # Make the prediction
-            prediction = round(model.predict(input_data)[0], 2)
+            from . import prediction as stack
 
-            # Ensure prediction is non-negative
-            prediction = max(prediction, 0)
+            # Extract typed model inputs from the JSON and price them
+            prediction = stack.predict_quote(stack.parse_quote(data))
 
             # Return prediction as JSON response
             return JsonResponse({"prediction": prediction})
@@ -447,6 +520,155 @@ def predict_charges(request: HttpRequest) -> Union[HttpResponse, JsonResponse]:
     return JsonResponse({"error": "Invalid request method"}, status=405)
 
 
+async def predict_charges_async(request: HttpRequest) -> JsonResponse:
+    """
+    Async variant of the ``predict_charges`` POST endpoint for ASGI servers.
+
+    Parsing happens on the event loop; the prediction runs on the bounded
+    ``prediction_executor`` so a burst of quotes never blocks the loop.
+
+    Args:
+        request (HttpRequest): The HTTP request object.
+
+    Returns:
+        JsonResponse:
+            - On success: The predicted insurance charge.
+            - If the input is invalid: An error message with status 400.
+            - If the prediction pool is saturated: An error message with status
+              503 and a ``Retry-After`` header.
+            - If the request method is not POST: Status 405.
+    """
+    if request.method != "POST":
+        return JsonResponse({"error": "Invalid request method"}, status=405)
+
+    from . import prediction as stack
+
+    try:
+        inputs = stack.parse_quote(json.loads(request.body))
+        prediction = await prediction_executor.run(stack.predict_quote, inputs)
+    except ExecutorBusy as e:
+        response = JsonResponse({"error": str(e)}, status=503)
+        response["Retry-After"] = "1"
+        return response
+    except Exception as e:
+        return JsonResponse({"error": str(e)}, status=400)
+
+    return JsonResponse({"prediction": prediction})
+
+
+NDJSON_CONTENT_TYPES = (
+    "application/x-ndjson",
+    "application/ndjson",
+    "application/jsonl",
+)
+
+
+@login_required
+def predict_charges_batch(
+    request: HttpRequest,
+) -> Union[JsonResponse, StreamingHttpResponse]:
+    """
+    Predicts insurance charges for many applicants in one request.
+
+    Accepts either a JSON array of applicant objects or an NDJSON stream (one object
+    per line, ``Content-Type: application/x-ndjson``) using the same fields as
+    ``predict_charges``. Rows are validated column-wise and scored in chunks with one
+    ``model.predict`` call each. Results stream back in input order in the same
+    format as the request: a JSON array, or one JSON object per line.
+
+    The model is loaded and the rows counted before the response starts, so those
+    failures get a proper status instead of a broken 200 stream. Only logged-in
+    users may score batches, and as a session-authenticated POST the request
+    needs a CSRF token.
+
+    Args:
+        request (HttpRequest): The HTTP request object.
+
+    Returns:
+        StreamingHttpResponse: One ``{"index": i, "prediction": p}`` or
+            ``{"index": i, "error": msg}`` item per input row.
+        JsonResponse: An error with status 400 if the body is not a JSON array,
+            405 if the request method is not POST, 413 if there are more than
+            ``settings.QUOTE_BATCH_MAX_ROWS`` rows, or 503 if the model cannot
+            be loaded.
+    """
+    if request.method != "POST":
+        return JsonResponse({"error": "Invalid request method"}, status=405)
+
+    from . import prediction as stack
+
+    try:
+        model = get_predictor(QUOTE_MODEL)
+    except Exception as e:
+        return JsonResponse({"error": f"Quote model unavailable: {e}"}, status=503)
+
+    limit = stack.max_rows()
+    ndjson = request.content_type in NDJSON_CONTENT_TYPES
+    if ndjson:
+        # Bounded by the row limit, like the JSON array body
+        rows = list(islice(stack.iter_ndjson(request), limit + 1))
+    else:
+        try:
+            rows = json.loads(request.body)
+        except ValueError as e:
+            return JsonResponse({"error": str(e)}, status=400)
+        if not isinstance(rows, list):
+            return JsonResponse(
+                {"error": "Expected a JSON array of applicant profiles"}, status=400
+            )
+    if len(rows) > limit:
+        return JsonResponse(
+            {"error": f"Too many rows; at most {limit} per request"}, status=413
+        )
+
+    results = stack.score_quotes(rows, model=model)
+    if ndjson:
+        return StreamingHttpResponse(
+            (json.dumps(result) + "\n" for result in results),
+            content_type="application/x-ndjson",
+        )
+
+    def stream_array():
+        yield "["
+        for result in results:
+            yield ("," if result["index"] else "") + json.dumps(result)
+        yield "]"
+
+    return StreamingHttpResponse(stream_array(), content_type="application/json")
+
+
+@staff_member_required
+def model_status(request: HttpRequest) -> JsonResponse:
+    """
+    Reports the state of the model registry for staff members.
+
+    Args:
+        request (HttpRequest): The HTTP request object.
+
+    Returns:
+        JsonResponse: The load count, cumulative load time and the active version
+            of every loaded artifact, for the pickled and the compiled models, and
+            the prediction cache, async executor and micro-batching counters.
+    """
+    from . import prediction as stack
+
+    return JsonResponse(
+        {
+            **registry.stats(),
+            "compiled": stack.compiled_registry.stats(),
+            "prediction_cache": stack.prediction_cache.stats(),
+            "executor": prediction_executor.stats(),
+            "batching": batching_stats(),
+        }
+    )
+
+
+SLOT_ERRORS = {
+    TAKEN: "This slot has just been booked. Please pick another time.",
+    NOT_OFFERED: "This time is not available on that day.",
+}
+
+
 @login_required
 def book_appointment(request: HttpRequest) -> HttpResponse:
     """
@@ -457,7 +679,9 @@ def book_appointment(request: HttpRequest) -> HttpResponse:
 
     Functionality:
     - If the request is POST, it processes the appointment form.
-    - Saves the appointment if the form is valid, associating it with the logged-in user.
+    - Reserves the slot if the form is valid, associating it with the logged-in user.
+      The reservation is atomic; if the slot is not offered or was just booked by
+      someone else, the form is shown again with HTTP 409 and the nearest free slots.
     - Displays success messages upon successful booking.
     - Redirects back to the booking page after submission.
     - If the request is GET, it renders the appointment form.
@@ -470,35 +694,50 @@ def book_appointment(request: HttpRequest) -> HttpResponse:
         HttpResponse: Renders the `book_appointment.html` template with:
             - `today` (date): The current date.
             - `form` (AppointmentForm): The form for booking an appointment.
-            - `upcoming_appointments` (QuerySet): The user's upcoming appointments, ordered by date.
-            - `past_appointments` (QuerySet): The user's past appointments, ordered by date (descending).
+            - `upcoming_appointments` (List[Appointment]): The user's next appointments, soonest first.
+            - `more_upcoming` (bool): Whether more upcoming appointments exist.
+            - `past_appointments` (CursorPage): The user's latest past appointments; older
+              ones are fetched from `appointment_history` with its `next_cursor`.
+            - `suggested_slots` (List[Tuple[date, str]]): The nearest free slots after a conflict.
     """
     today = timezone.now().date()  # Get today's date in YYYY-MM-DD format
 
     # Handle form submission (POST request)
+    status = 200
+    suggested_slots: List[Tuple[date, str]] = []
     if request.method == "POST":
         form = AppointmentForm(request.POST)
-        if form.is_valid():
-            # Save the appointment data
-            appointment = form.save(commit=False)
-            appointment.user = request.user  # Associate the logged-in user
-            appointment.save()
-
-            messages.success(request, "Your appointment has been booked successfully!")
-            return redirect(
-                "book_appointment"
-            )  # Redirect to the same page after saving
+        # The form's own check of the (date, time) constraint only means the
+        # slot is taken; when it is the only error, reserve() reports that
+        # with the nearest free slots
+        slot_taken = form.errors.keys() == {NON_FIELD_ERRORS} and form.has_error(
+            NON_FIELD_ERRORS, "unique_together"
+        )
+        if form.is_valid() or slot_taken:
+            try:
+                # Reserve the slot atomically for the logged-in user
+                reserve(
+                    request.user,
+                    form.cleaned_data["reason"],
+                    form.cleaned_data["date"],
+                    form.cleaned_data["time"],
+                )
+            except SlotUnavailable as e:
+                form.add_error("time", SLOT_ERRORS[e.reason])
+                suggested_slots = e.suggestions
+                status = 409
+            else:
+                messages.success(
+                    request, "Your appointment has been booked successfully!"
+                )
+                return redirect(
+                    "book_appointment"
+                )  # Redirect to the same page after saving
     else:
         form = AppointmentForm()
 
-    # Get upcoming and past appointments for display
-    upcoming_appointments = Appointment.objects.filter(
-        user=request.user, date__gte=today
-    ).order_by("date")
-
-    past_appointments = Appointment.objects.filter(
-        user=request.user, date__lt=today
-    ).order_by("-date")
+    # Get the next appointments and the latest past ones in one query
+    overview = appointment_overview(request.user, today)
 
     return render(
         request,
@@ -506,9 +745,40 @@ def book_appointment(request: HttpRequest) -> HttpResponse:
         {
             "today": today,
             "form": form,
-            "upcoming_appointments": upcoming_appointments,
-            "past_appointments": past_appointments,
+            "upcoming_appointments": overview.upcoming,
+            "more_upcoming": overview.more_upcoming,
+            "past_appointments": overview.history,
+            "suggested_slots": suggested_slots,
         },
+        status=status,
+    )
+
+
+@login_required
+def appointment_history(request: HttpRequest) -> JsonResponse:
+    """
+    Returns a page of the user's past appointments, for "Show older" on the booking page.
+
+    Args:
+        request (HttpRequest): A GET request with the `cursor` of the previous page.
+
+    Returns:
+        JsonResponse: {'appointments': [...], 'next_cursor': ...}, latest first, with
+            `next_cursor` None on the last page; {'error': ...} with HTTP 400 for a bad
+            cursor or 405 for other methods.
+    """
+    if request.method != "GET":
+        return JsonResponse({"error": "Invalid request method"}, status=405)
+    paginator = history_paginator(request.user, timezone.now().date())
+    try:
+        page = paginator.page(request.GET.get("cursor"))
+    except InvalidCursor:
+        return JsonResponse({"error": "Invalid cursor."}, status=400)
+    return JsonResponse(
+        {
+            "appointments": [appointment_json(row) for row in page],
+            "next_cursor": page.next_cursor,
+        }
     )
 
 
@@ -517,8 +787,9 @@ def get_available_times(request: HttpRequest) -> JsonResponse:
     Retrieves available time slots for a given date.
 
     This function handles a GET request with a 'date' parameter and returns
-    the available time slots for that date in JSON format. If no availability
-    is found, an empty list is returned.
+    the time slots for that date that are configured in ``Availability`` and
+    not yet booked, in JSON format. If no availability is found, an empty list
+    is returned.
 
     Args:
         request (HttpRequest): The HTTP request object containing GET parameters.
@@ -530,13 +801,52 @@ def get_available_times(request: HttpRequest) -> JsonResponse:
             }
             If no availability is found or no date is provided, an empty list is returned.
     """
-    if date := request.GET.get("date"):
-        try:
-            availability = Availability.objects.get(date=date)
-            return JsonResponse({"times": availability.time_slots})
-        except Availability.DoesNotExist:
-            return JsonResponse({"times": []})
-    return JsonResponse({"times": []})
+    try:
+        day = date.fromisoformat(request.GET["date"])
+    except (KeyError, ValueError):
+        return JsonResponse({"times": []})
+    return JsonResponse({"times": mask_times(free_slots(day, day).get(day, 0))})
+
+
+def available_slots(request: HttpRequest) -> JsonResponse:
+    """
+    Returns the free slots of every day in a date range, for the date picker.
+
+    The range is either ``?month=YYYY-MM`` or ``?start=YYYY-MM-DD&end=YYYY-MM-DD``
+    (inclusive, at most ``MAX_RANGE_DAYS`` days). Each day is a bitmask over
+    ``slots``: bit ``i`` is set when ``slots[i]`` is free.
+
+    Args:
+        request (HttpRequest): The HTTP request object containing GET parameters.
+
+    Returns:
+        JsonResponse: {'start': ..., 'end': ..., 'slots': [...], 'days': [mask, ...]}
+            with one mask per day from start to end, or {'error': ...} with
+            HTTP 400 if the range is missing or invalid.
+    """
+    try:
+        if "month" in request.GET:
+            year, month = map(int, request.GET["month"].split("-"))
+            start, end = month_range(year, month)
+        else:
+            start = date.fromisoformat(request.GET["start"])
+            end = date.fromisoformat(request.GET["end"])
+    except (KeyError, ValueError):
+        return JsonResponse(
+            {"error": "Provide month=YYYY-MM or start and end dates."}, status=400
+        )
+    if not 0 <= (end - start).days < MAX_RANGE_DAYS:
+        return JsonResponse(
+            {"error": f"The range must span 1 to {MAX_RANGE_DAYS} days."}, status=400
+        )
+    return JsonResponse(
+        {
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "slots": SLOT_TIMES,
+            "days": range_masks(start, end),
+        }
+    )
 
 
 class SignupView(CreateView):
@@ -810,7 +1120,7 @@ class PredictChargesView(LoginRequiredMixin, UpdateView):
             Prepares the input data by performing necessary transformations and encoding for prediction.
 
         load_model():
-            Loads the pre-trained model from a pickle file for prediction.
+            Returns the pre-trained model from the shared model registry.
 
     Args:
         request (HttpRequest): The HTTP request object.
@@ -864,16 +1174,26 @@ class PredictChargesView(LoginRequiredMixin, UpdateView):
             "sex": user_profile.sex,
         }
 
-        # Preprocess and predict
-        preprocessed_data = self.preprocess_data(prediction_data)
-        model = self.load_model()
+        # Score in the prediction sidecar when one is configured and up
+        prediction_value = sidecar_predict(PROFILE_MODEL, prediction_data)
 
-        if not model:
-            messages.error(self.request, "Failed to load prediction model.")
-            return self.form_invalid(form)
+        if prediction_value is None:
+            from . import prediction as stack
+
+            model = self.load_model()
+
+            if not model:
+                messages.error(self.request, "Failed to load prediction model.")
+                return self.form_invalid(form)
 
-        predicted_charges = model.predict(preprocessed_data)
-        prediction_value = round(predicted_charges[0], 2)
+            # Preprocess and predict, unless this profile was already scored
+            prediction_value = stack.cached_prediction(
+                PROFILE_MODEL,
+                prediction_data,
+                lambda model, row: predict_one(
+                    PROFILE_MODEL, model, row, stack.score_profiles
+                ),
+            )
 
         # Save prediction history
         PredictionHistory.objects.create(
@@ -902,74 +1222,24 @@ class PredictChargesView(LoginRequiredMixin, UpdateView):
         return super().form_invalid(form)
 
     def categorize_bmi(self, bmi: float) -> str:
-        if bmi < 18.5:
-            return "under_weight"
-        elif 18.5 <= bmi < 25:
-            return "normal_weight"
-        elif 25 <= bmi < 30:
-            return "over_weight"
-        else:
-            return "obese"
+        from . import prediction as stack
+
+        return stack.categorize_bmi(bmi)
 
     def categorize_age(self, age: int) -> str:
-        if 18 < age < 26:
-            return "young_adult"
-        elif 26 <= age < 36:
-            return "early_adulthood"
-        elif 36 <= age < 46:
-            return "mid_adulthood"
-        else:
-            return "late_adulthood"
-
-    def preprocess_data(self, data: Dict[str, Any]) -> pd.DataFrame:
-        # Define the expected columns (must match the model's input requirements)
-        expected_columns = [
-            "smoker",
-            "age",
-            "bmi",
-            "age_category_young_adult",
-            "age_category_early_adulthood",
-            "bmi_category_over_weight",
-            "bmi_category_obese",
-            "children_str_0",
-        ]
-
-        # Create a DataFrame from the input data
-        df = pd.DataFrame([data])
-
-        # Convert smoker to binary (1 for "Yes", 0 for "No")
-        df["smoker"] = df["smoker"].map({"Yes": 1, "No": 0})
-
-        # Categorize age and bmi
-        df["age_category"] = df["age"].apply(self.categorize_age)
-        df["bmi_category"] = df["bmi"].apply(self.categorize_bmi)
-
-        # Convert children to string (for one-hot encoding)
-        df["children_str"] = df["children"].apply(lambda x: str(x))
-
-        # Perform one-hot encoding for categorical columns
-        df = pd.get_dummies(
-            df, columns=["age_category", "bmi_category", "children_str"], dtype=(int)
-        )
+        from . import prediction as stack
 
-        # Ensure all expected columns are present
-        for col in expected_columns:
-            if col not in df.columns:
-                df[col] = 0  # Add missing columns with default value 0
+        return stack.categorize_age(age)
 
-        # Reorder columns to match the model's expectations
-        df = df[expected_columns]
+    def preprocess_data(self, data: Dict[str, Any]) -> "pd.DataFrame":
+        from . import prediction as stack
 
-        return df
+        # Encode straight into the model's expected columns (see features.py)
+        return stack.to_frame(stack.encode_profiles([data]))
 
     def load_model(self) -> Optional[Any]:
         try:
-            model_path = os.path.join(
-                settings.BASE_DIR, "insurance_app/model/model.pkl"
-            )
-            with open(model_path, "rb") as file:
-                model = pickle.load(file)
-            return model
+            return get_predictor(PROFILE_MODEL)
         except FileNotFoundError:
             print("Error: The model file 'model.pkl' was not found.")
             return None
@@ -985,7 +1255,8 @@ class PredictionHistoryView(LoginRequiredMixin, ListView):
     Displays a list of prediction history for a logged-in user.
 
     This view allows logged-in users to view their past insurance charge predictions,
-    including the predicted charges and related details. The list is paginated, and users
+    including the predicted charges and related details. The list is keyset-paginated on
+    (timestamp, id) with opaque ``?cursor=`` tokens, and users
     can see statistics such as the total number of predictions and the average predicted charges.
 
     Attributes:
@@ -994,6 +1265,10 @@ class PredictionHistoryView(LoginRequiredMixin, ListView):
         context_object_name (str): The name of the context variable for the list of predictions.
         paginate_by (int): The number of predictions to display per page.
 
+    Note:
+        ``paginate_queryset`` swaps Django's OFFSET paginator for a ``CursorPaginator``,
+        so ``page_obj`` is a ``CursorPage`` and there is no page number or count.
+
     Methods:
         get_queryset():
             Returns a queryset containing the user's prediction history,
@@ -1021,21 +1296,24 @@ class PredictionHistoryView(LoginRequiredMixin, ListView):
     paginate_by = 10
 
     def get_queryset(self):
-        return (
-            self.model.objects.filter(user=self.request.user)
-            .select_related("user")
-            .order_by("-timestamp")
-        )
+        return self.model.objects.filter(user=self.request.user).select_related("user")
+
+    def paginate_queryset(self, queryset, page_size: int):
+        # Keyset pages on (timestamp, id); the running stats provide the
+        # totals the OFFSET paginator used to COUNT(*) for
+        self.prediction_stats = PredictionStats.for_user(self.request.user)
+        paginator = CursorPaginator(queryset, ("-timestamp", "-id"), page_size)
+        page = _cursor_page(paginator, self.request)
+        return paginator, page, page.object_list, page.has_other_pages()
 
     def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
         context = super().get_context_data(**kwargs)
         context.update(
             {
                 "user_profile": self.request.user,
-                "total_predictions": self.get_queryset().count(),
-                "average_charges": self.get_queryset().aggregate(
-                    Avg("predicted_charges")
-                )["predicted_charges__avg"],
+                "prediction_stats": self.prediction_stats,
+                "total_predictions": self.prediction_stats.count,
+                "average_charges": self.prediction_stats.average_charges,
             }
         )
         return context
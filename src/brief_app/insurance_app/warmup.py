@@ -0,0 +1,126 @@
+"""Model warm-up run before the first request is served.
+
+``warm_up_models`` imports the scientific stack, loads both pipelines through
+the model registry (or their compiled exports with ``USE_COMPILED_MODELS``)
+and runs one prediction with each. With ``USE_QUOTE_TABLE`` it also builds
+the quote table if it is missing or stale, and maps it. Under Gunicorn it is
+called from the master when ``preload_app`` is on, so every forked worker
+inherits the loaded models copy-on-write, or from each worker otherwise.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import logging
+import resource
+import time
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+
+from .model_registry import (
+    PROFILE_MODEL,
+    QUOTE_MODEL,
+    get_predictor,
+    hash_file,
+    resolve_model_path,
+)
+
+logger = logging.getLogger(__name__)
+
+# Representative applicant used for the dummy predictions
+SAMPLE_QUOTE: Dict[str, Any] = {
+    "height": 175.0,
+    "weight": 70.0,
+    "age": 35,
+    "sex": "male",
+    "smoker": "no",
+    "region": "northeast",
+    "children": 1,
+    "bmi": 22.9,
+    "BMI_category": "Poids normal",
+}
+SAMPLE_PROFILE: Dict[str, Any] = {
+    "age": 35,
+    "bmi": 22.9,
+    "smoker": "No",
+    "children": 1,
+    "region": "Northeast",
+    "sex": "Male",
+}
+
+
+def _elapsed_ms(start: float) -> float:
+    return round((time.perf_counter() - start) * 1000, 2)
+
+
+def warm_up_models(
+    started_at: Optional[float] = None, freeze: bool = False
+) -> Dict[str, Any]:
+    """
+    Loads and exercises both prediction pipelines.
+
+    Args:
+        started_at (float, optional): ``time.perf_counter()`` value taken when the
+            process started, used to report the time to first successful prediction.
+        freeze (bool): Move every object allocated so far to the permanent GC
+            generation so the collector does not dirty shared pages after fork.
+
+    Returns:
+        dict: Timings in milliseconds for each step plus the peak RSS in kilobytes.
+    """
+    report: Dict[str, Any] = {}
+    begin = time.perf_counter()
+
+    step = time.perf_counter()
+    import pandas as pd
+
+    report["import_pandas_ms"] = _elapsed_ms(step)
+
+    # Compiled models are evaluated with NumPy only, sklearn is not needed then
+    if not getattr(settings, "USE_COMPILED_MODELS", False):
+        step = time.perf_counter()
+        import sklearn  # noqa: F401  (unpickling needs it, import it up front)
+
+        report["import_sklearn_ms"] = _elapsed_ms(step)
+
+    step = time.perf_counter()
+    quote_model = get_predictor(QUOTE_MODEL)
+    profile_model = get_predictor(PROFILE_MODEL)
+    report["load_models_ms"] = _elapsed_ms(step)
+    report["backend"] = type(quote_model).__name__
+
+    step = time.perf_counter()
+    quote_model.predict(pd.DataFrame([SAMPLE_QUOTE]))
+    report["first_quote_predict_ms"] = _elapsed_ms(step)
+
+    from .views import PredictChargesView
+
+    step = time.perf_counter()
+    profile_model.predict(PredictChargesView().preprocess_data(SAMPLE_PROFILE))
+    report["first_profile_predict_ms"] = _elapsed_ms(step)
+
+    if getattr(settings, "USE_QUOTE_TABLE", False):
+        from .quote_table import ensure_quote_table, quote_table_registry
+
+        step = time.perf_counter()
+        ensure_quote_table(resolve_model_path(QUOTE_MODEL))
+        quote_table_registry.get(QUOTE_MODEL)
+        report["quote_table_ms"] = _elapsed_ms(step)
+
+    report["warm_up_ms"] = _elapsed_ms(begin)
+    if started_at is not None:
+        report["time_to_first_prediction_ms"] = _elapsed_ms(started_at)
+    report["versions"] = {
+        name: hash_file(resolve_model_path(name))[:12]
+        for name in (QUOTE_MODEL, PROFILE_MODEL)
+    }
+
+    if freeze:
+        gc.collect()
+        gc.freeze()
+    report["max_rss_kb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    logger.info("Model warm-up report: %s", json.dumps(report))
+    return report
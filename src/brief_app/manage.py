@@ -15,6 +15,11 @@ def main():
             "available on your PYTHONPATH environment variable? Did you "
             "forget to activate a virtual environment?"
         ) from exc
+    # Set STARTUP_PROFILE to time each boot phase (see brief_app/startup.py)
+    if os.getenv("STARTUP_PROFILE"):
+        from brief_app.startup import profile_if_enabled
+
+        profile_if_enabled()
     execute_from_command_line(sys.argv)
 
 
@@ -2,10 +2,6 @@
 
 set -eo pipefail
 
-GUNICORN_PORT=${GUNICORN_PORT:-8000}
-MAX_RETRIES=120
-RETRY_INTERVAL=3
-
 echo "🚀 Starting Assuraimant Web App"
 echo "🧾 Version Info:"
 if [[ -f /app/version.txt ]]; then
@@ -14,32 +10,7 @@ else
   echo "⚠️ version.txt not found"
 fi
 
-echo "DATABASE_URL is: $DATABASE_URL"
-
-echo ""
-echo "⏳ Waiting for database to be ready..."
-COUNT=0
-until python src/brief_app/manage.py showmigrations &>/dev/null; do
-  COUNT=$((COUNT + 1))
-  if [ "$COUNT" -ge "$MAX_RETRIES" ]; then
-    echo "⛔️ Database not ready after $MAX_RETRIES attempts, exiting..."
-    exit 1
-  fi
-  echo "⛔️ Database not ready, retrying in ${RETRY_INTERVAL}s... ($COUNT/$MAX_RETRIES)"
-  sleep $RETRY_INTERVAL
-done
-
-echo "✅ Database is ready. Running migrations..."
-if ! python src/brief_app/manage.py migrate; then
-  echo "❌ Database migrations failed"
-  exit 1
-fi
-
-echo "📦 Collecting static files..."
-if ! python src/brief_app/manage.py collectstatic --noinput; then
-  echo "❌ Collectstatic failed"
-  exit 1
-fi
-
-echo "🚀 Launching Gunicorn on port $GUNICORN_PORT..."
-exec gunicorn brief_app.wsgi:application --chdir src/brief_app --bind 0.0.0.0:$GUNICORN_PORT --access-logfile -
+# Waits for the database, migrates and collects static files only when
+# needed, then replaces itself with Gunicorn (see the bootstrap command)
+echo "🚀 Bootstrapping on port ${GUNICORN_PORT:-8000} (preload: ${GUNICORN_PRELOAD:-1})..."
+exec python src/brief_app/manage.py bootstrap --port "${GUNICORN_PORT:-8000}"